@@ -1,103 +1,243 @@
 
 from MinesweeperBoard import Minesweeper as MinesweeperBoard
+from Solver import Solver
+from Deduction import DeductionEngine
+from Patterns import PATTERNS, lookup, row_keys
 import random
+import time
+try:
+    from MonteCarlo import MonteCarloEstimator
+except ImportError:  # NumPy is optional, without it forced guesses are uniformly random
+    MonteCarloEstimator = None
+
+# How hard the medium AI works on a forced guess: it stops estimating mine chances after this many samples or this long
+GUESS_SAMPLES = 4096
+GUESS_DEADLINE_MS = 50
 
 class AIPlayer:
     def __init__(self, board: MinesweeperBoard, difficulty: str):
         self.board = board
         self.difficulty = difficulty
+        # The frontier is every revealed number that still has a covered neighbor. Only those cells can tell the
+        # AI anything, so the medium and hard logic only look at them instead of scanning the whole board.
+        # Both sets are kept up to date from the cells the board reports as changed since seenVersion.
+        self.frontier = set()
+        self.coveredCells = []  # Covered, unflagged cells as (col, row), for picking a random cell in O(1)
+        self.coveredIndex = {}  # (col, row) -> position in coveredCells
+        self.seenVersion = None
+        self.hardMatches = None  # Where each hard pattern applies, see update_hard_patterns
+        # Knowledge base, kept for as long as the game lasts (the game makes a new AIPlayer for a new board):
+        # cells already worked out to be safe or mines but not played yet, and the board version the medium logic
+        # last deduced from. Only frontier cells whose surroundings changed after that version can tell it anything new.
+        self.safeMoves = []
+        self.mineFlags = []
+        self.processedVersion = None
+        # Linear algebra over every frontier number at once (see Deduction.py), used by the hard and expert logic.
+        # It keeps its own equations up to date from the board's changes, so it also lasts the whole game.
+        self.deduction = DeductionEngine(board)
+        self.chosenMove = None  # ("reveal" or "flag", col, row) picked by the last choose_move call
+        # Time budget of the move being chosen (a perf_counter() time, None for no limit), and for the last move:
+        # which stage of the logic picked it (see choose_move) and how many milliseconds it took
+        self.deadline = None
+        self.stage = None
+        self.moveStage = None
+        self.moveTime = 0.0
+        self.stopped = False  # Set by stop() once the board is thrown away, see AIWorker.cancel
     
     # This function will make a move based on the selected difficulty level
     # It returns the (col, row) of the move made. 
     # This means its important that every move function returns those values.
-    def make_move(self):
+    def make_move(self, deadline_ms=None):
+        return self.apply_move(self.choose_move(deadline_ms))
+
+    # Works out every move the AI is sure of in one go and returns them in the order to play them, as a list of
+    # ("reveal" or "flag", col, row). The first is the move choose_move picks. If that move is certain, the rest are the other
+    # cells the same analysis proved (the knowledge base of safe cells and mines), so one call does the work of many make_move
+    # calls. A guess is never batched: it changes what the AI knows, so it comes back on its own. Neither is a hard pattern
+    # (the wall 1-1 and 1-2-1 rules are heuristics), so those are only ever played one at a time as choose_move picks them.
+    # Like choose_move it only reads the board. Moves later in the list may be played already by the time they're reached
+    # (a reveal's flood fill can get there first), so play them with self.board.apply_moves, which skips those.
+    def plan(self, deadline_ms=None):
+        move = self.choose_move(deadline_ms)
+        if move is None:
+            return []
+        moves = [move]
+        if self.moveStage in ("random", "guess", "timeout", "patterns"):
+            return moves
+        cell = self.board.get_cell
+        planned = {(move[1], move[2])}
+        candidates = [("reveal", x, y) for x, y in reversed(self.safeMoves)]
+        candidates += [("flag", x, y) for x, y in reversed(self.mineFlags)]
+        #the knowledge base keeps its cells, they get skipped once they're played
+        for action, x, y in candidates:
+            if (x, y) not in planned and cell(x, y) == "?":
+                planned.add((x, y))
+                moves.append((action, x, y))
+        return moves
+
+    # Plans a batch of moves (see plan) and plays all of them. Returns the moves that were played.
+    def make_moves(self, deadline_ms=None):
+        return self.board.apply_moves(self.plan(deadline_ms))
+
+    # Works out the next move without making it, and returns it as ("reveal" or "flag", col, row) (None if there is no move).
+    # It makes no moves, so it can run on another thread while the board is left alone (see AIWorker.py), as long as
+    # the move gets played with apply_move before the next one is chosen. Reading a ChunkedMinesweeper can still load
+    # and evict chunks, which that board does under its chunk_lock so the game can draw it at the same time.
+    #
+    # Every difficulty tries its stages from cheapest to most expensive:
+    #   "remembered" cells already worked out, "patterns" (hard), "local" one number at a time rules (medium and hard),
+    #   "deduction" over the whole frontier (hard and expert), "solver" (expert), and then "guess" the safest looking cell.
+    #   Easy only has "random".
+    # With deadline_ms the clock is checked between stages, and once the time is up the move is a "timeout" guess of any
+    # covered cell instead of the stages left. The local rules cost next to nothing, so medium and hard run them before
+    # giving up (see play_local_move). A single stage can't be stopped halfway, so a slow stage can still run over.
+    # The guess is the exception: it stops sampling mine chances once the budget is up (after one batch of samples).
+    # Afterwards moveStage says which stage picked the move and moveTime how many milliseconds it took.
+    def choose_move(self, deadline_ms=None):
+        start = time.perf_counter()
+        self.deadline = None if deadline_ms is None else start + deadline_ms / 1000
+        self.chosenMove = None
+        self.stage = self.moveStage = None
         if self.difficulty == "Easy":
-            return self.make_easy_move()
+            self.make_easy_move()
         elif self.difficulty == "Medium":
-            return self.make_medium_move()
+            self.make_medium_move()
         elif self.difficulty == "Hard":
-            return self.make_hard_move()
+            self.make_hard_move()
+        elif self.difficulty == "Expert":
+            self.make_expert_move()
+        self.moveTime = (time.perf_counter() - start) * 1000
+        return self.chosenMove
+
+    # Makes every move from now on give up at the next check of the clock, as if its time was up. For a move being chosen
+    # on another thread when its board is thrown away: the stage it is in still runs to the end, but none of the ones after.
+    def stop(self):
+        self.stopped = True
+
+    # True once the time budget of the move being chosen is used up (or the AI was stopped)
+    def out_of_time(self):
+        return self.stopped or (self.deadline is not None and time.perf_counter() >= self.deadline)
+
+    # Milliseconds left of the time budget, or None if there is no budget
+    def time_left(self):
+        if self.stopped:
+            return 0.0
+        return None if self.deadline is None else max(0.0, (self.deadline - time.perf_counter()) * 1000)
+
+    # Plays a move from choose_move on the board and returns its (col, row)
+    def apply_move(self, move):
+        if move is None:
+            return None
+        action, x, y = move
+        if action == "flag":
+            self.board.toggle_flag(x, y)
+        else:
+            self.board.reveal_square(x, y)
+        return x, y
+
+    # The move functions call these instead of changing the board themselves. Every move function picks exactly one move
+    # and returns right after, so the move is only recorded here and choose_move hands it back.
+    def reveal(self, x, y):
+        self.chosenMove = ("reveal", x, y)
+        self.moveStage = self.stage
+
+    def flag(self, x, y):
+        self.chosenMove = ("flag", x, y)
+        self.moveStage = self.stage
     
 
+    # Brings the frontier and the covered cells up to date with the board.
+    # The first call looks at every cell, after that only the cells changed since the last call (and their neighbors) are checked.
+    def update_frontier(self):
+        board = self.board
+        if self.seenVersion == board.version:
+            return
+        if self.seenVersion is None:
+            changed = None
+            touched = [(col, row) for row in range(board.height) for col in range(board.width)]
+        else:
+            changed = board.changes_since(self.seenVersion)
+            touched = set(changed)
+            for col, row in changed:
+                touched.update(board.neighbor_table.neighbors(col, row))
+        self.seenVersion = board.version
+        if self.difficulty == "Hard":
+            self.update_hard_patterns(changed)
+        for cell in touched:
+            col, row = cell
+            value = board.get_cell(col, row)
+            if value == "?":
+                if cell not in self.coveredIndex:
+                    self.coveredIndex[cell] = len(self.coveredCells)
+                    self.coveredCells.append(cell)
+            elif cell in self.coveredIndex:
+                # Swap the last covered cell into this one's place so removing it is O(1)
+                position = self.coveredIndex.pop(cell)
+                last = self.coveredCells.pop()
+                if last != cell:
+                    self.coveredCells[position] = last
+                    self.coveredIndex[last] = position
+            if value != "?" and value != "F" and value > 0 and any(board.get_cell(nx, ny) == "?" for nx, ny in board.neighbor_table.neighbors(col, row)):
+                self.frontier.add(cell)
+            else:
+                self.frontier.discard(cell)
+
+    # The frontier cells that changed, or had a neighbor change, since the last call (the whole frontier on the first call),
+    # as (row, col) pairs in the order a top to bottom, left to right scan of the board would find them.
+    # Every other frontier cell looks the same as last time, so anything it could tell the AI is already in the knowledge base.
+    def unprocessed_frontier(self):
+        self.update_frontier()
+        if self.processedVersion is None:
+            cells = self.frontier
+        else:
+            cells = set()
+            for col, row in self.board.changes_since(self.processedVersion):
+                cells.add((col, row))
+                cells.update(self.board.neighbor_table.neighbors(col, row))
+            cells &= self.frontier
+        self.processedVersion = self.board.version
+        return sorted((row, col) for col, row in cells)
+
     # This function takes a cell position and determines what the 8 surrounding cells look like. 
     # It uses the display board so it only has access to the same information as a player would.
     # It returns the values of the adjacent cells in the following order:
         # left, topleft, top, topright, right, bottomright, bottom, bottomleft
     # If an adjacent cell is out of bounds, it returns None for that cell.
+    # The board's neighbor table already knows which of the 8 directions are in bounds for every cell, so no bounds checks are needed.
     def getAdjacentValues(self, row, col):
-        currentBoardState = self.board.get_display_board()
-        try:
-            left = currentBoardState[row][col - 1] if (col - 1 >= 0) else None
-        except IndexError:
-            left = None
-        try:
-            top = currentBoardState[row-1][col] if (row - 1 >= 0) else None
-        except IndexError:
-            top = None
-        try:
-            topleft = currentBoardState[row-1][col - 1] if (col - 1 >= 0 and row - 1 >= 0) else None
-        except IndexError:
-            topleft = None
-        try:
-            topright = currentBoardState[row-1][col+1] if (row - 1 >= 0 and col + 1 < self.board.width) else None
-        except IndexError:
-            topright = None
-        try:
-            right = currentBoardState[row][col+1] if (col + 1 < self.board.width) else None
-        except IndexError:
-            right = None
-        try:
-            bottomright = currentBoardState[row+1][col+1] if (row + 1 < self.board.height and col + 1 < self.board.width) else None
-        except IndexError:
-            bottomright = None
-        try:
-            bottom = currentBoardState[row+1][col] if (row + 1 < self.board.height) else None
-        except IndexError:
-            bottom = None
-        try:
-            bottomleft = currentBoardState[row+1][col-1] if (col - 1 >= 0 and row + 1 < self.board.height) else None
-        except IndexError:
-            bottomleft = None
-
-        return left, topleft, top, topright, right, bottomright, bottom, bottomleft
+        get_cell = self.board.get_cell
+        table = self.board.neighbor_table
+        return tuple(None if delta is None else get_cell(col + delta[0], row + delta[1])
+                     for delta in table.compass[table.kind(col, row)])
 
     # NOTE: Their logic takes the column first then the row. No idea why since it is usually row then column. Don't get tripped up by this. 
-    # To uncover a cell just do self.board.reveal_square(column, row) 
-    # To flag a cell just do self.toggle_flag(column, row)
+    # To uncover a cell just do self.reveal(column, row) 
+    # To flag a cell just do self.flag(column, row)
 
     #only used by medium "ai"
     #different from getAdjacentValues, it returns the coordinates and its value, not only the values
     #decided to make it seperate, as to not have to change the hard ai patterns since the return values/structure is different
     def getAdjacentCells(self, row, col):
-        neighbors = []
-        currentBoardState = self.board.get_display_board()
-        #loop over the adjacent rows (-1 to the left, +1 to the right)
-        for rowOffset in (-1, 0, 1):
-            #same thing for the cols
-            for colOffset in (-1, 0, 1):
-                #skip 0, 0 because thats just the center cell itself
-                if rowOffset == 0 and colOffset == 0:
-                    continue
-                #get the neighbor row, col
-                neigborRow, neighborCol = row + rowOffset, col + colOffset
-                #make sure the neighbor is inside the board
-                if 0 <= neigborRow < self.board.height and 0 <=neighborCol < self.board.width:
-                    #add the neighbor's coordinates and what value it has ("?", "F", or a num)
-                    neighbors.append(((neigborRow, neighborCol), currentBoardState[neigborRow][neighborCol]))
+        get_cell = self.board.get_cell
+        #the neighbor table only lists neighbors inside the board, so there's nothing to bounds check
+        #add each neighbor's coordinates and what value it has ("?", "F", or a num)
+        neighbors = [((row + rowOffset, col + colOffset), get_cell(col + colOffset, row + rowOffset))
+                     for colOffset, rowOffset in self.board.neighbor_table.deltas_at(col, row)]
         return neighbors
     
     # This function will make a random move on the board
     def make_easy_move(self):
         print("AI making easy move")
+        self.stage = "random"
 
         # Randomly selects a cell to uncover
         (x, y) = (random.randint(0, self.board.width - 1), random.randint(0, self.board.height - 1))
         # Keeps picking random cells until an unrevealed cell is found
-        while self.board.get_display_board()[y][x] != "?" and self.board.get_display_board()[y][x] != "F":
+        while self.board.get_cell(x, y) != "?" and self.board.get_cell(x, y) != "F":
             (x, y) = (random.randint(0, self.board.width - 1), random.randint(0, self.board.height - 1))
 
         # Uncovers the selected cell
-        self.board.reveal_square(x, y)
+        self.reveal(x, y)
         return x, y
 
     # This function will make a strategic move based on the same information the player has using various minesweeper strategies
@@ -105,233 +245,259 @@ class AIPlayer:
     def make_medium_move(self):
         # Implement medium difficulty logic
         print("AI making medium move")
+
+        #it'll remember things though, safeMoves and mineFlags last for the whole game
+        #if there are cells it 'remembers', play those first
+        self.stage = "remembered"
+        move = self.play_remembered_move()
+        if move:
+            return move
+        move = self.play_local_move()
+        if move:
+            return move
+        return self.make_guess_move()
+
+    # Applies the one number at a time rules to the frontier cells that changed: a number with as many flags around it as
+    # its value makes its other covered neighbors safe, and one with as many covered and flagged neighbors as its value makes
+    # them all mines. Remembers what it found and plays one of those cells, or returns None if it found nothing.
+    # It only looks at the numbers that changed since the last time, so it is cheap enough to run even once the time is up.
+    def play_local_move(self):
+        #the ""ai"" ain't actually cheating so it just reads the display values too
+        cell = self.board.get_cell
+        self.stage = "local"
+        newSafeMoves = []
+        newMineFlags = []
+        #goes through the frontier and figures out if there are cells it should remember
+        #covered/flagged cells and numbers with nothing covered around them can't tell us anything, so they're not on the frontier
+        #and frontier cells that haven't changed since last time were already looked at, so it skips those too
+        for x, y in self.unprocessed_frontier():
+            #how many mines are around the current cell
+            adjacentMinesNum = cell(y, x)
+            #get the neighbors
+            neighbors = self.getAdjacentCells(x, y)
+            coveredNeighbors = [(col, row) for (row, col), v in neighbors if v == "?"]
+            flaggedNeighbors = [(col, row) for (row, col), v in neighbors if v == "F"]
+            #if the adjacentMinesNum == flagged Neighbors, then that means the other adjacent covered cells are all safe
+            #                                               that is if there are covered neighbors
+            if adjacentMinesNum == len(flaggedNeighbors) and coveredNeighbors:
+                # print(f"For cell ({x}, {y}), the neighbors:\n{coveredNeighbors}\nare safe")
+                #instead of doing a for loop to append each elem
+                newSafeMoves.extend(coveredNeighbors)
+            #if the adjacentMinesNum == flaggedNeighbors + coveredNeighbords, then that means all the covered cells are mine
+            if adjacentMinesNum == len(flaggedNeighbors) + len(coveredNeighbors) and coveredNeighbors:
+                # print(f"For cell ({x}, {y}), the neighbors:\n{coveredNeighbors}\nare mines")
+                newMineFlags.extend(coveredNeighbors)
         
-        #the ""ai"" ain't actually cheating so it just has the display board too
-        currentBoardState = self.board.get_display_board()
+        #add the new moves to the og arrays, and play the last one found (a safe cell first) like a remembered one
+        #the rest are used in a later turn
+        self.safeMoves.extend(newSafeMoves)
+        self.mineFlags.extend(newMineFlags)
+        return self.play_remembered_move()
+
+    # Guesses when nothing is certain: the covered cell least likely to be a mine, or any covered cell once the time is up
+    def make_guess_move(self):
+        #if it's out of time there's no working out which cell is safest, so just guess
+        if self.out_of_time():
+            return self.make_timeout_move()
+
+        #if there truly is nothing it can deduce, then it'll look at the covered cells (kept up to date by update_frontier)
+        self.stage = "guess"
+        choices = self.coveredCells
+        #if there is a cell it can chooose from that
+        if choices:
+            #reveal the one least likely to be a mine
+            x, y = self.pick_guess()
+            # print(f"No moves to deduce. Uncovering ({x}, {y})")
+            self.reveal(x, y)
+            return x,y
 
-        #it'll remember things though
-        #init arrays if they don't exist yet
-        #can i just put this in when initting the class? yes but i just wanted it to be created only when hard mode is called
-        if not hasattr(self, "safeMoves"):
-            self.safeMoves = []
-        if not hasattr(self, "mineFlags"):
-            self.mineFlags = []
+        print("No moves. Making random move")
+        return self.make_easy_move()
 
+    # Plays a cell from the knowledge base: reveals a remembered safe cell, or if there are none flags a remembered mine.
+    # Cells that were played some other way since they were remembered get skipped.
+    # Returns the (col, row) it played, or None if there was nothing left to play.
+    def play_remembered_move(self):
+        cell = self.board.get_cell
         #if there are safe cells it 'remembers', click those first
         while self.safeMoves:
             #since its col, row not row, col
             x, y = self.safeMoves.pop()
             #if its an unrevealed cell
-            if currentBoardState[y][x] == "?":
+            if cell(x, y) == "?":
                 # print(f"Remembered safe move at ({x}, {y})")
                 #click it
-                self.board.reveal_square(x, y)
+                self.reveal(x, y)
                 return x, y
-            
+
         #if there are cells it remembers have to be mines, flag them
         while self.mineFlags:
             x, y, = self.mineFlags.pop()
-            if currentBoardState[y][x] == "?":
+            if cell(x, y) == "?":
                 # print(f"Remembered mine flagged at ({x}, {y})")
-                self.board.toggle_flag(x, y)
-                return x,y
-        
-        newSafeMoves = []
-        newMineFlags = []
-        #goes through board and figures out if there are cells it should remember
-        for x in range(self.board.height):
-            for y in range(self.board.width):
-                #gets the value of the cell its looking at
-                value = currentBoardState[x][y]
-                #if the cell is covered or flagged (aka not an int) skip it, since we can't figure out info from whatever number is hidden
-                if not isinstance(value, int):
-                    continue
-                #how many mines are around the current cell
-                adjacentMinesNum = value
-                #get the neighbors
-                neighbors = self.getAdjacentCells(x, y)
-                coveredNeighbors = [(col, row) for (row, col), v in neighbors if v == "?"]
-                flaggedNeighbors = [(col, row) for (row, col), v in neighbors if v == "F"]
-                #if the adjacentMinesNum == flagged Neighbors, then that means the other adjacent covered cells are all safe
-                #                                               that is if there are covered neighbors
-                if adjacentMinesNum == len(flaggedNeighbors) and coveredNeighbors:
-                    # print(f"For cell ({x}, {y}), the neighbors:\n{coveredNeighbors}\nare safe")
-                    #instead of doing a for loop to append each elem
-                    newSafeMoves.extend(coveredNeighbors)
-                #if the adjacentMinesNum == flaggedNeighbors + coveredNeighbords, then that means all the covered cells are mine
-                if adjacentMinesNum == len(flaggedNeighbors) + len(coveredNeighbors) and coveredNeighbors:
-                    # print(f"For cell ({x}, {y}), the neighbors:\n{coveredNeighbors}\nare mines")
-                    newMineFlags.extend(coveredNeighbors)
-        
-        #Play what it deduced
-        if newSafeMoves:
-            #pick a cell and remove it from the array
-            x, y = newSafeMoves.pop()
-            #add the new  moves to the og arrays
-            #to be used in a later turn
-            self.safeMoves.extend(newSafeMoves)
-            self.mineFlags.extend(newMineFlags)
-            if currentBoardState[y][x] == "?":
-                # print(f"Playing a save move at ({x}, {y})")
-                self.board.reveal_square(x, y)
-                return x, y
-            
-        if newMineFlags:
-            x, y = newMineFlags.pop()
-            self.safeMoves.extend(newSafeMoves)
-            self.mineFlags.extend(newMineFlags)
-            if currentBoardState[y][x] == "?":
-                # print(f"Flagging a known mine at ({x}, {y})")
-                self.board.toggle_flag(x, y)
+                self.flag(x, y)
                 return x,y
+        return None
 
-        #if there truly is nothing it can deduce, then it'll look at the uncovered cells (within heigth and width range)
-        choices = [(x, y) for y in range(self.board.height) for x in range(self.board.width) if currentBoardState[y][x]== "?"]
-        #if there is a cell it can chooose from that
-        if choices:
-            #reveal a random one
-            x, y = random.choice(choices)
-            # print(f"No moves to deduce. Uncovering ({x}, {y})")
-            self.board.reveal_square(x, y)
-            return x,y
+    # Runs the deduction engine and remembers what it proved, in reverse so the lowest cells are played first.
+    # Then plays one of those cells, or returns None if it couldn't prove anything.
+    def play_deduced_move(self):
+        self.stage = "deduction"
+        safe, mines = self.deduction.deduce()
+        self.safeMoves.extend(sorted(safe, reverse=True))
+        self.mineFlags.extend(sorted(mines, reverse=True))
+        return self.play_remembered_move()
 
-        print("No moves. Making random move")
+    # Picks a covered cell to guess when nothing can be deduced.
+    # With NumPy it estimates every covered cell's chance of being a mine (see MonteCarlo.py) and picks the lowest,
+    # otherwise (or if the flags contradict the numbers) it picks any covered cell at random.
+    # With a time budget it only samples for as long as the budget has left.
+    def pick_guess(self):
+        if MonteCarloEstimator is not None:
+            estimator = MonteCarloEstimator(self.board)
+            if estimator.consistent:
+                deadline_ms = GUESS_DEADLINE_MS if self.deadline is None else min(GUESS_DEADLINE_MS, self.time_left())
+                cell, _ = estimator.estimate(samples=GUESS_SAMPLES, deadline_ms=deadline_ms).safest()
+                if cell is not None:
+                    return cell
+                # Every cell no number touches is equally likely to be a mine, so any of them will do
+                if estimator.interior:
+                    return random.choice(estimator.interior)
+        return random.choice(self.coveredCells)
+
+    # Used once the time budget is up: reveals any covered cell, the best move there is without working anything out
+    def make_timeout_move(self):
+        self.stage = "timeout"
+        self.update_frontier()
+        if self.coveredCells:
+            x, y = random.choice(self.coveredCells)
+            self.reveal(x, y)
+            return x, y
         return self.make_easy_move()
 
+    # The hard patterns are data in Patterns.py: each one is a 3x3 grid of what the cells around an anchor cell look like
+    # and the cell it would uncover or flag from there (at most 2 away from the anchor). The 3x3 around a cell is packed
+    # into one number, and one lookup of that number gives every pattern that applies at the cell.
+    # A pattern only depends on cells within 2 of its anchor, so after a move only the anchors near the cells that changed
+    # need checking again.
+
+    # Re-checks the hard patterns at every anchor near the changed cells (or everywhere if changed is None).
+    # hardMatches has one {(row, col) anchor: ("reveal" or "flag", col, row)} per pattern, in the order make_hard_move tries them.
+    def update_hard_patterns(self, changed):
+        board = self.board
+        width, height = board.width, board.height
+        cell = board.get_cell
+        if self.hardMatches is None:
+            self.hardMatches = [{} for _ in PATTERNS]
+        # The anchors to check, as the columns to check in every row (so row_keys can slide along each row)
+        if changed is None:
+            anchorCols = {row: range(width) for row in range(height)}
+        else:
+            anchorCols = {}
+            for col, row in changed:
+                nearCols = range(max(col - 2, 0), min(col + 3, width))
+                for nearRow in range(max(row - 2, 0), min(row + 3, height)):
+                    anchorCols.setdefault(nearRow, set()).update(nearCols)
+        for row, cols in anchorCols.items():
+            for col, key in row_keys(board, row, sorted(cols)):
+                anchor = (row, col)
+                patterns = lookup(key)
+                found = {}
+                for number, action, moves in patterns:
+                    if number in found:
+                        continue
+                    # The first of the pattern's cells that is on the board and still covered is the one to play
+                    for dx, dy in moves:
+                        x, y = col + dx, row + dy
+                        if 0 <= x < width and 0 <= y < height and cell(x, y) == "?":
+                            found[number] = (action, x, y)
+                            break
+                for number, matches in enumerate(self.hardMatches):
+                    if number in found:
+                        matches[anchor] = found[number]
+                    else:
+                        matches.pop(anchor, None)
+
     def make_hard_move(self):
         print("AI making hard move")
 
         # If no safe moves, make random move
         # Otherwise, make a strategic move
-        # Since the hard AI should not have any special knowledge we will use the display board instead of the regular board. 
-        currentBoardState = self.board.get_display_board()
-
-        # Key: 
-        #   * = any value
-        #   Number = revealed square with that number
-        #   ? = unrevealed square
-        #   F = flagged square
-        #   | = wall of the board
-        #   X = Uncover the cell
-
-        # Pattern: | 1 1 *
-        #          | ? ? ?
-        # Safe move: 
-        #          | 1 1 *
-        #          | ? ? X
-        # Logic: Along a wall, if 2 adjacent revealed squares show a 1 and there are 3 covered cells below the squares, then the third square can be safely uncovered. 
-        # This logic also goes for when the pattern is rotated in any direction.
-
-        # Pattern 1, check by row from left wall. 
-        col = 0
-        for row in range(self.board.height):
-            if (currentBoardState[row][col] == 1) and (currentBoardState[row][col+1] == 1):
-                if ((row+1 < self.board.height) and currentBoardState[row+1][col+2] == "?"):
-                    self.board.reveal_square(col + 2, row+1)
-                    return col + 2, row+1
-                elif ((row-1 >= 0) and currentBoardState[row-1][col+2] == "?"):
-                    self.board.reveal_square(col + 2, row-1)
-                    return col + 2, row-1
-           
-        # Pattern 1, check by row from right wall. 
-        col = self.board.width - 1 # - 1 because the columns are zero indexed. 
-        for row in range(self.board.height):
-            if (currentBoardState[row][col] == 1) and (currentBoardState[row][col-1] == 1):
-                if ((row+1 < self.board.height) and currentBoardState[row+1][col-2] == "?"):
-                    self.board.reveal_square(col-2, row+1)
-                    return col-2, row+1
-                elif ((row-1 >= 0) and currentBoardState[row-1][col-2] == "?"):
-                    self.board.reveal_square(col-2, row-1)
-                    return col-2, row-1
-                
-        # Pattern 1, check by column from top wall. 
-        row = 0 # Lock to the top wall
-        for col in range(self.board.width):
-            if (currentBoardState[row][col] == 1) and (currentBoardState[row+1][col] == 1):
-                if ((col + 1 < self.board.width) and currentBoardState[row+2][col+1] == "?"):
-                    self.board.reveal_square(col+1, row+2)
-                    return col+1, row+2
-                elif ((col - 1 < self.board.width) and currentBoardState[row+2][col-1] == "?"):
-                    self.board.reveal_square(col-1, row+2)
-                    return col-1, row+2
-            
-        # Pattern 1, check by column from bottom wall.
-        row = self.board.height - 1 # Lock to the bottom wall
-        for col in range(self.board.width):
-            if (currentBoardState[row][col] == 1) and (currentBoardState[row-1][col] == 1):
-                if ((col+1 < self.board.width) and currentBoardState[row-2][col+1] == "?"):
-                    self.board.reveal_square(col+1, row-2)
-                    return col+1, row-2
-                elif ((col-1 < self.board.width) and currentBoardState[row-2][col-1] == "?"):
-                    self.board.reveal_square(col-1, row-2)
-                    return col-1, row-2
-
-        # Pattern 2, If there is a cell with 3 '1's in around one of its corners, then it must be a mine and should be flagged. 
-        # 1 1
-        # 1 ?
-        # Safe Move:
-        # 1 1
-        # 1 F
-        for row in range(self.board.height):
-            for col in range(self.board.width):
-                currentCell = currentBoardState[row][col]
-                # For every covered cell, check if it has a corner of 1s
-                if currentCell == "?":
-                    left, topleft, top, topright, right, bottomright, bottom, bottomleft = self.getAdjacentValues(row,col)
-                    
-                    # There are 4 corners to check
-                    # left, top left, top
-                    if left == 1 and topleft == 1 and top == 1 and (self.getAdjacentValues(row-1,col-1).count('?') + self.getAdjacentValues(row-1,col-1).count('F')) == 1:
-                        self.board.toggle_flag(col, row)
-                        return col, row
-                    # top, top right, right
-                    if top == 1 and topright == 1 and right == 1 and (self.getAdjacentValues(row-1,col+1).count('?') + self.getAdjacentValues(row-1,col+1).count('F')) == 1:
-                        self.board.toggle_flag(col, row)
-                        return col, row
-                    # right, bottom right, bottom
-                    if right == 1 and bottomright == 1 and bottom == 1 and (self.getAdjacentValues(row+1,col+1).count('?') + self.getAdjacentValues(row+1,col+1).count('F')) == 1:
-                        self.board.toggle_flag(col, row)
-                        return col, row
-                    # bottom, bottom left, left
-                    if bottom == 1 and bottomleft == 1 and left == 1 and (self.getAdjacentValues(row+1,col-1).count('?') + self.getAdjacentValues(row+1,col-1).count('F'))== 1:
-                        self.board.toggle_flag(col, row)
-                        return col, row
-                    
-        # Pattern 3, if there is a 1-2-1 pattern horizontally or vertically with covered cells on the opposite side of the 2, then the covered cells can be flagged and the middle cell can be uncovered.
-        # Pattern:
-        # | * * *
-        # | 1 2 1
-        # | ? ? ?
-        # Safe Move:
-        # | * * *
-        # | 1 2 1
-        # | F X F Can do any of these 3 moves. I will choose to just do the uncovering of the middle cell because the medium logic will take care of flagging the left and right cells.
-        # Pattern 5
-        # Loop through each cell in the board
-        for row in range(self.board.height):
-            for col in range(self.board.width):
-                currentCell = currentBoardState[row][col]
-                if currentCell == 2:
-                    left, topleft, top, topright, right, bottomright, bottom, bottomleft = self.getAdjacentValues(row,col)
-                    if left == 1 and currentCell == 2 and right == 1:
-                        # If the cell below is covered then uncover it. 
-                        if bottom == "?":
-                            # Uncover the middle cell
-                            self.board.reveal_square(col, row+1)
-                            return col, row+1
-                        # If the cell above is covered then uncover it (this pattern works both up and down)
-                        if top == "?":
-                            self.board.reveal_square(col, row-1)
-                            return col, row-1
-
-                    if top == 1 and currentCell == 2 and bottom == 1:
-                        # If the cell to the left is covered then uncover it. 
-                        if left == "?":
-                            self.board.reveal_square(col-1, row)
-                            return col-1, row
-                        # If the cell to the right is covered then uncover it (this pattern works both left and right)
-                        if right == "?":
-                            self.board.reveal_square(col+1, row)
-                            return col+1, row
-                    
-        return self.make_medium_move()
\ No newline at end of file
+        # Since the hard AI should not have any special knowledge we only read the display values instead of the regular board. 
+        self.update_frontier()
+        self.stage = "patterns"
+
+        # Try the patterns in order. Where a pattern applies in more than one place, use the first anchor a scan of the board
+        # would reach: the lowest row, then the lowest column.
+        for matches in self.hardMatches:
+            if matches:
+                action, col, row = matches[min(matches)]
+                if action == "flag":
+                    self.flag(col, row)
+                else:
+                    self.reveal(col, row)
+                return col, row
+
+        # No pattern applies, so try the one number at a time medium logic, and then combine every number on the frontier
+        self.stage = "remembered"
+        move = self.play_remembered_move()
+        if move:
+            return move
+        move = self.play_local_move()
+        if move:
+            return move
+        if self.out_of_time():
+            return self.make_timeout_move()
+        move = self.play_deduced_move()
+        if move:
+            return move
+        return self.make_guess_move()
+
+    # This function uses the deduction engine (see Deduction.py) and the constraint solver (see Solver.py) instead of fixed patterns.
+    # The solver works out exactly which cells are safe or mines from every revealed number and the mines left, so it only
+    # guesses when no cell is certain, and then it picks the cell with the lowest chance of being a mine.
+    def make_expert_move(self):
+        print("AI making expert move")
+
+        # Cells proved safe or mines on an earlier turn stay that way, so play those before solving again
+        self.stage = "remembered"
+        move = self.play_remembered_move()
+        if move:
+            return move
+
+        # Row reducing the frontier is cheaper than counting every arrangement and finds almost every certain cell,
+        # so the solver only runs when it comes up empty
+        if self.out_of_time():
+            return self.make_timeout_move()
+        move = self.play_deduced_move()
+        if move:
+            return move
+
+        if self.out_of_time():
+            return self.make_timeout_move()
+        self.stage = "solver"
+        result = Solver(self.board).solve()
+
+        # The numbers and flags can only disagree if a player flagged a safe cell, so fall back to the simpler logic
+        if not result.consistent:
+            return self.make_medium_move()
+
+        # Remember everything the solver proved, in reverse so the lowest cells are popped first
+        self.safeMoves.extend(sorted(result.safe, reverse=True))
+        self.mineFlags.extend(sorted(result.mines, reverse=True))
+        if self.safeMoves:
+            x, y = self.safeMoves.pop()
+            self.reveal(x, y)
+            return x, y
+
+        if self.mineFlags:
+            x, y = self.mineFlags.pop()
+            self.flag(x, y)
+            return x, y
+
+        # Nothing is certain, so guess one of the cells least likely to be a mine
+        self.stage = "guess"
+        lowest = min(result.probabilities.values())
+        x, y = random.choice([square for square, chance in result.probabilities.items() if chance == lowest])
+        self.reveal(x, y)
+        return x, y
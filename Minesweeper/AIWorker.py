@@ -0,0 +1,93 @@
+"""
+Module: AIWorker
+Class: AIWorker
+Description: Runs AI move choices on a background thread so the game window keeps drawing and
+                handling input while the AI thinks. The worker only calls AIPlayer.choose_move, which
+                makes no moves (reading a ChunkedMinesweeper can load and evict chunks, but that board
+                does so under a lock, so the game can draw it at the same time); the game checks for
+                the chosen move whenever its loop runs and plays it on the main thread. A loop that
+                sleeps until something happens passes notify, which is called once the move is chosen,
+                to be woken up for it. While a move is being chosen the game leaves the board alone (it
+                is the AI's turn), so the AI sees a fixed snapshot of the display state.
+                Resetting the board cancels the move in flight: the AI is stopped at its next check of the
+                clock (see AIPlayer.stop), so the worker is soon free for the new board, and the result is
+                dropped.
+                The worker also times the game's frames while the AI is thinking.
+Inputs: An AIPlayer whose turn it is, the frame times of the game loop, and optionally a function to call when
+                a move is ready.
+Outputs: The chosen move (or batch of moves), and a summary of the frame times while it was chosen.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class AIWorker:
+    # A thread rather than a process: the AI keeps what it has worked out between turns (see AIPlayer), which a
+    # process would have to copy back and forth every move. The move functions release the GIL often enough
+    # (every few milliseconds, see sys.getswitchinterval) for the game loop to keep its frame rate.
+    def __init__(self, notify=None):
+        """notify, if given, is called with no arguments on the worker thread every time a move has been chosen."""
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-move")
+        self.notify = notify
+        self.future = None       # Move being chosen, or None
+        self.ai_player = None    # AIPlayer choosing it
+        self.started = None      # perf_counter() when the move was asked for
+        self.frame_times = []    # Seconds per frame drawn while the AI was thinking
+
+    def start(self, ai_player, deadline_ms=None, batch=False):
+        """Start choosing ai_player's next move in the background, within deadline_ms if it is given. With batch,
+        plan every move the AI is sure of instead (see AIPlayer.plan)."""
+        if self.future is not None:
+            self.future.cancel()  # A move nobody collected, from the same AI, so it doesn't need stopping
+        self.ai_player = ai_player
+        self.started = time.perf_counter()
+        self.frame_times = []
+        self.future = self.executor.submit(ai_player.plan if batch else ai_player.choose_move, deadline_ms)
+        if self.notify is not None:
+            self.future.add_done_callback(lambda future: self.notify())
+
+    def is_thinking(self):
+        """True while a move is being chosen or waiting to be collected."""
+        return self.future is not None
+
+    def record_frame(self, seconds):
+        """Record how long one frame of the game loop took, if the AI is thinking."""
+        if self.future is not None:
+            self.frame_times.append(seconds)
+
+    def is_ready(self):
+        """True once the move in flight has been chosen."""
+        return self.future is not None and self.future.done()
+
+    def take_move(self):
+        """Return the chosen move (see AIPlayer.choose_move), or the list of planned moves for a batch, and free
+        the worker for the next one. Errors raised by the AI are raised here."""
+        future, self.future = self.future, None
+        return future.result()
+
+    def frame_report(self):
+        """One line summing up the frame times of the last move."""
+        thinking = (time.perf_counter() - self.started) * 1000
+        if not self.frame_times:
+            return f"AI thought for {thinking:.1f}ms, no frames drawn meanwhile"
+        frames = sorted(self.frame_times)
+        return (f"AI thought for {thinking:.1f}ms over {len(frames)} frames: frame time "
+                f"mean {sum(frames) / len(frames) * 1000:.1f}ms, max {frames[-1] * 1000:.1f}ms")
+
+    def cancel(self):
+        """Forget the move in flight (if any), for when its board is thrown away. A move that hasn't started never
+        runs. One already being chosen can't be interrupted halfway through a stage, so its AI is stopped instead:
+        it gives up at the next check of the clock (see AIPlayer.stop), and its result is thrown away."""
+        if self.future is not None:
+            if not self.future.cancel():
+                self.ai_player.stop()
+            self.future = None
+
+    def shutdown(self):
+        """Stop the worker thread without waiting for a move in flight."""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,756 @@
+"""
+Module: Benchmarks
+Functions: benchmark_board_generation, benchmark_flood_fill, benchmark_mine_density, benchmark_board_memory,
+            benchmark_chunked_board, benchmark_board_files, benchmark_what_if, benchmark_neighbors,
+            benchmark_solver, benchmark_auto_solve, benchmark_ai_turns, benchmark_monte_carlo,
+            benchmark_deduction, benchmark_async_ai, benchmark_patterns, benchmark_batch_moves,
+            local_rule_applies, benchmark_deadline, benchmark_rendering, benchmark_resources, read_io,
+            benchmark_idle
+Description: Timing benchmarks for the Minesweeper engine. Each benchmark prints a small
+                table so results can be pasted into notes or commit messages.
+Inputs: Optional benchmark name on the command line (runs every benchmark if omitted).
+Outputs: Timing tables printed to stdout.
+External Sources: NumPy (only for the NumPy board backend and the Monte Carlo estimator), pygame (only for the
+                rendering, resources and idle benchmarks, which run without a window)
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import gc
+import os
+import tempfile
+import random
+import time
+import tracemalloc
+from MinesweeperBoard import Minesweeper
+
+# Fraction of the board covered by mines in the benchmarks (the game's 10-20 mines on 10x10)
+MINE_DENSITY = 0.15
+
+def time_call(function, repeats):
+    """Run function repeats times and return the best wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def generate_board(board_class, size):
+    """Build a size x size board, place its mines and calculate every square."""
+    minesweeper = board_class(size, size, int(size * size * MINE_DENSITY), "Solo", None)
+    minesweeper.place_mines(safe_x=0, safe_y=0)
+    minesweeper.calculate_squares()
+    return minesweeper
+
+def benchmark_board_generation(sizes=(10, 100, 1000)):
+    """Compare generating boards with the list backend and the NumPy backend."""
+    from NumpyBoard import NumpyMinesweeper
+    print("Board generation (place_mines + calculate_squares), best time")
+    print(f"{'size':>11} {'lists':>12} {'numpy':>12} {'speedup':>9}")
+    for size in sizes:
+        repeats = 20 if size <= 100 else 3
+        random.seed(size)
+        list_time = time_call(lambda: generate_board(Minesweeper, size), repeats)
+        numpy_time = time_call(lambda: generate_board(NumpyMinesweeper, size), repeats)
+        print(f"{f'{size}x{size}':>11} {list_time * 1000:>10.3f}ms {numpy_time * 1000:>10.3f}ms {list_time / numpy_time:>8.1f}x")
+
+def benchmark_flood_fill(sizes=(500, 1000, 2000), density=0.01):
+    """Time the first-click flood fill on large sparse boards and report the cost per opened cell."""
+    print(f"First-click flood fill at {density:.0%} mines")
+    print(f"{'size':>11} {'opened':>10} {'time':>12} {'per cell':>10}")
+    for size in sizes:
+        # The safe opening makes the first click a 0 square, so it always starts a flood fill
+        minesweeper = Minesweeper(size, size, int(size * size * density), "Solo", None, safe_opening=True, seed=size)
+        # Place mines up front so only the flood fill itself is timed
+        x, y = size // 2, size // 2
+        minesweeper.place_mines(safe_x=x, safe_y=y)
+        minesweeper.calculate_squares()
+        minesweeper.mines_placed = True
+        start = time.perf_counter()
+        opened = minesweeper.reveal_cells(x, y)
+        elapsed = time.perf_counter() - start
+        print(f"{f'{size}x{size}':>11} {len(opened):>10} {elapsed * 1000:>10.1f}ms {elapsed / len(opened) * 1e9:>8.0f}ns")
+
+def benchmark_mine_density(size=100, densities=(0.01, 0.1, 0.25, 0.5, 0.75, 0.95)):
+    """Time place_mines across mine densities, with and without the safe opening."""
+    print(f"place_mines on a {size}x{size} board, best time")
+    print(f"{'density':>8} {'mines':>7} {'click only':>12} {'safe opening':>13}")
+    for density in densities:
+        num_mines = int(size * size * density)
+        times = []
+        for safe_opening in (False, True):
+            def place():
+                minesweeper = Minesweeper(size, size, num_mines, "Solo", None, safe_opening=safe_opening, seed=1)
+                minesweeper.place_mines(safe_x=size // 2, safe_y=size // 2)
+            times.append(time_call(place, 10))
+        print(f"{density:>8.0%} {num_mines:>7} {times[0] * 1000:>10.2f}ms {times[1] * 1000:>11.2f}ms")
+
+def benchmark_board_memory(size=500, density=0.01):
+    """Measure memory per cell and first-click flood fill time for the list and bitboard backends."""
+    from BitBoard import BitboardMinesweeper
+    print(f"{size}x{size} board at {density:.0%} mines, after the first click")
+    print(f"{'backend':>9} {'bytes/cell':>11} {'first click':>12}")
+    for name, board_class in (("lists", Minesweeper), ("bitboard", BitboardMinesweeper)):
+        def first_click():
+            minesweeper = board_class(size, size, int(size * size * density), "Solo", None, safe_opening=True, seed=size)
+            minesweeper.reveal_square(size // 2, size // 2)
+            # Drop the change log so only the board state itself is measured
+            minesweeper._change_log.clear()
+            return minesweeper
+        elapsed = time_call(first_click, 1)
+        tracemalloc.start()
+        minesweeper = first_click()
+        gc.collect()
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>9} {used / (size * size):>11.2f} {elapsed * 1000:>10.1f}ms")
+
+def benchmark_chunked_board(size=10**6, density=0.2, clicks=2000, area=2000, max_chunks=256):
+    """Play random moves inside a small area of a huge chunked board and report time and memory."""
+    from ChunkedBoard import ChunkedMinesweeper
+    print(f"{clicks} random reveals/flags in a {area}x{area} corner of a {size}x{size} chunked board at {density:.0%} mines")
+    minesweeper = ChunkedMinesweeper(size, size, int(size * size * density), "Solo", None, safe_opening=True, seed=1,
+                                     max_chunks=max_chunks)
+    click_rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(clicks):
+        x, y = click_rng.randrange(area), click_rng.randrange(area)
+        # Peek at the mines so the game never ends: flag mines and reveal everything else
+        if minesweeper.mines_placed and minesweeper.calculate_square(x, y) == -1:
+            minesweeper.toggle_flag(x, y)
+        else:
+            minesweeper.reveal_square(x, y)
+    elapsed = time.perf_counter() - start
+    resident_bytes = sum(len(chunk) for chunk in minesweeper.chunks.values())
+    cold_bytes = sum(len(minesweeper.cold_store[key]) for key in minesweeper.cold_store.keys())
+    print(f"revealed {minesweeper.revealed_safe_count} squares in {elapsed:.2f}s ({elapsed / clicks * 1000:.2f}ms per move)")
+    print(f"{minesweeper.resident_chunks()} chunks in memory ({resident_bytes / 1024:.0f} KiB), "
+          f"{len(minesweeper.cold_store)} in the cold store ({cold_bytes / 1024:.0f} KiB compressed)")
+
+def benchmark_board_files(count=10000, width=30, height=16, num_mines=99):
+    """Time loading single boards out of a memory-mapped corpus against regenerating them."""
+    from BitBoard import BitboardMinesweeper
+    from BoardFile import BoardCorpus, write_corpus
+    boards = []
+    for seed in range(count):
+        minesweeper = Minesweeper(width, height, num_mines, "Auto", "Hard", safe_opening=True, seed=seed)
+        minesweeper.reveal_square(width // 2, height // 2)
+        boards.append(minesweeper)
+    path = os.path.join(tempfile.mkdtemp(), "corpus.msc")
+    write_corpus(path, boards)
+    print(f"Corpus of {count} {width}x{height} boards, {os.path.getsize(path) / 1024:.0f} KiB on disk")
+    print(f"{'operation':>32} {'per board':>10}")
+    pick = random.Random(0)
+    indices = [pick.randrange(count) for _ in range(1000)]
+    with BoardCorpus(path) as corpus:
+        for name, board_class in (("load (lists)", Minesweeper), ("load (bitboard)", BitboardMinesweeper)):
+            elapsed = time_call(lambda: [corpus.load(index, board_class) for index in indices], 3)
+            print(f"{name:>32} {elapsed / len(indices) * 1e6:>8.1f}us")
+    def regenerate():
+        for index in indices:
+            minesweeper = Minesweeper(width, height, num_mines, "Auto", "Hard", safe_opening=True, seed=index)
+            minesweeper.reveal_square(width // 2, height // 2)
+    elapsed = time_call(regenerate, 3)
+    print(f"{'regenerate and replay (lists)':>32} {elapsed / len(indices) * 1e6:>8.1f}us")
+    start = time.perf_counter()
+    with BoardCorpus(path) as corpus:
+        corpus.load(count - 1, BitboardMinesweeper)
+    print(f"{'open corpus + load last board':>32} {(time.perf_counter() - start) * 1e6:>8.1f}us")
+    os.remove(path)
+
+def benchmark_what_if(width=30, height=16, num_mines=99, branches=2000):
+    """Compare exploring hypothetical reveals with checkpoint/rollback against deep-copying the board."""
+    minesweeper = Minesweeper(width, height, num_mines, "Auto", "Hard", safe_opening=True, seed=3)
+    minesweeper.reveal_square(width // 2, height // 2)
+    covered = [(x, y) for y in range(height) for x in range(width) if minesweeper.get_cell(x, y) == "?"]
+    pick = random.Random(0)
+    moves = [pick.choice(covered) for _ in range(branches)]
+    def with_copies():
+        for x, y in moves:
+            branch = copy.deepcopy(minesweeper)
+            branch.reveal_square(x, y)
+    def with_journal():
+        for x, y in moves:
+            checkpoint = minesweeper.checkpoint()
+            minesweeper.reveal_square(x, y)
+            minesweeper.rollback(checkpoint)
+    print(f"{branches} hypothetical reveals on a {width}x{height} board")
+    print(f"{'approach':>22} {'per branch':>11}")
+    for name, explore in (("deepcopy", with_copies), ("checkpoint/rollback", with_journal)):
+        elapsed = time_call(explore, 3)
+        print(f"{name:>22} {elapsed / branches * 1e6:>9.1f}us")
+
+def benchmark_neighbors(sizes=(16, 30, 300)):
+    """Compare counting the mines around every square with bounds-checked loops and with the neighbor table."""
+    from Neighbors import get_neighbor_table
+    print("Count mines around every square, best time")
+    print(f"{'size':>11} {'bounds checks':>14} {'table':>10} {'speedup':>9}")
+    for size in sizes:
+        board = generate_board(Minesweeper, size).board
+        def with_bounds_checks():
+            for y in range(size):
+                for x in range(size):
+                    adj = 0
+                    for ny in range(max(y - 1, 0), min(y + 2, size)):
+                        for nx in range(max(x - 1, 0), min(x + 2, size)):
+                            if (nx, ny) != (x, y) and board[ny][nx] == -1:
+                                adj += 1
+        def with_table():
+            table = get_neighbor_table(size, size)
+            deltas, row_kinds, column_kinds = table.deltas, table.row_kinds, table.column_kinds
+            for y in range(size):
+                row_kind = row_kinds[y]
+                for x in range(size):
+                    adj = 0
+                    for dx, dy in deltas[row_kind | column_kinds[x]]:
+                        if board[y + dy][x + dx] == -1:
+                            adj += 1
+        repeats = 20 if size <= 100 else 3
+        checked_time = time_call(with_bounds_checks, repeats)
+        table_time = time_call(with_table, repeats)
+        cells = size * size
+        print(f"{f'{size}x{size}':>11} {checked_time / cells * 1e9:>12.0f}ns {table_time / cells * 1e9:>8.0f}ns "
+              f"{checked_time / table_time:>8.1f}x")
+
+def benchmark_solver(games=50, width=30, height=16, num_mines=99):
+    """Play expert boards with the Expert AI and report its per-move latency and win rate."""
+    from AIPlayer import AIPlayer
+    print(f"Expert AI on {games} {width}x{height} boards with {num_mines} mines")
+    times = []
+    wins = 0
+    for seed in range(games):
+        minesweeper = Minesweeper(width, height, num_mines, "Auto", "Expert", seed=seed)
+        ai_player = AIPlayer(minesweeper, "Expert")
+        random.seed(seed)
+        while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+            # The AI prints every move it makes, which would swamp the table
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                ai_player.make_move()
+                times.append(time.perf_counter() - start)
+        wins += minesweeper.is_game_won()
+    times.sort()
+    print(f"{'moves':>7} {'mean':>9} {'p99':>9} {'max':>9} {'won':>5}")
+    print(f"{len(times):>7} {sum(times) / len(times) * 1000:>7.2f}ms {times[int(len(times) * 0.99)] * 1000:>7.2f}ms "
+          f"{times[-1] * 1000:>7.2f}ms {wins / games:>5.0%}")
+
+def benchmark_auto_solve(sizes=(100, 500), density=0.1, difficulty="Hard", time_limit=600):
+    """Let one AIPlayer auto-solve large boards and report the time per move. Games running past
+    time_limit seconds are stopped and reported with the moves made so far."""
+    from AIPlayer import AIPlayer
+    print(f"{difficulty} AI auto-solving boards at {density:.0%} mines")
+    print(f"{'size':>11} {'moves':>8} {'total':>10} {'per move':>10} {'result':>8}")
+    for size in sizes:
+        minesweeper = Minesweeper(size, size, int(size * size * density), "Auto", difficulty, safe_opening=True, seed=size)
+        ai_player = AIPlayer(minesweeper, difficulty)
+        random.seed(size)
+        moves = 0
+        start = time.perf_counter()
+        while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+            if time.perf_counter() - start > time_limit:
+                break
+            # The AI prints every move it makes, which would swamp the table
+            with contextlib.redirect_stdout(io.StringIO()):
+                ai_player.make_move()
+            moves += 1
+        elapsed = time.perf_counter() - start
+        result = "won" if minesweeper.is_game_won() else "lost" if minesweeper.is_game_over() else "stopped"
+        print(f"{f'{size}x{size}':>11} {moves:>8} {elapsed:>9.1f}s {elapsed / moves * 1000:>8.2f}ms {result:>8}")
+
+def benchmark_ai_turns(games=20, width=30, height=16, num_mines=99):
+    """Compare the AI's time per turn over full Auto-mode games when a new AIPlayer is made every turn
+    (so it forgets everything between turns) and when one AIPlayer lasts the whole game."""
+    from AIPlayer import AIPlayer
+    print(f"AI time per turn over {games} Auto-mode games on {width}x{height} boards with {num_mines} mines")
+    print(f"{'difficulty':>10} {'new AI per turn':>16} {'one AI per game':>16} {'drop':>7}")
+    for difficulty in ("Medium", "Hard", "Expert"):
+        per_turn = []
+        for persistent in (False, True):
+            turns = 0
+            elapsed = 0
+            for seed in range(games):
+                minesweeper = Minesweeper(width, height, num_mines, "Auto", difficulty, seed=seed)
+                ai_player = AIPlayer(minesweeper, difficulty)
+                random.seed(seed)
+                while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+                    # The AI prints every move it makes, which would swamp the table
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        start = time.perf_counter()
+                        if not persistent:
+                            ai_player = AIPlayer(minesweeper, difficulty)
+                        ai_player.make_move()
+                        elapsed += time.perf_counter() - start
+                    turns += 1
+            per_turn.append(elapsed / turns)
+        print(f"{difficulty:>10} {per_turn[0] * 1000:>14.3f}ms {per_turn[1] * 1000:>14.3f}ms {1 - per_turn[1] / per_turn[0]:>7.0%}")
+
+def benchmark_monte_carlo(positions=40, width=30, height=16, num_mines=99, budgets=(1024, 4096, 16384)):
+    """Compare Monte Carlo mine probabilities against the exact solver's at several sample budgets."""
+    from AIPlayer import AIPlayer
+    from MonteCarlo import MonteCarloEstimator
+    from Solver import Solver
+    # Collect mid-game positions by letting the Expert AI play a few moves on expert boards
+    boards = []
+    for seed in range(positions):
+        minesweeper = Minesweeper(width, height, num_mines, "Auto", "Expert", seed=seed)
+        ai_player = AIPlayer(minesweeper, "Expert")
+        random.seed(seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(8):
+                if minesweeper.is_game_over() or minesweeper.is_game_won():
+                    break
+                ai_player.make_move()
+        if not minesweeper.is_game_over() and not minesweeper.is_game_won():
+            boards.append(minesweeper)
+    exact = [Solver(minesweeper).solve().probabilities for minesweeper in boards]
+    print(f"Monte Carlo mine chances on {len(boards)} mid-game {width}x{height} positions, against the exact solver")
+    print(f"{'samples':>8} {'time':>9} {'mean error':>11} {'worst cell':>11}")
+    for budget in budgets:
+        elapsed = 0
+        errors = []
+        for seed, (minesweeper, probabilities) in enumerate(zip(boards, exact)):
+            random.seed(seed)
+            start = time.perf_counter()
+            estimate = MonteCarloEstimator(minesweeper).estimate(samples=budget)
+            elapsed += time.perf_counter() - start
+            errors.append(max(abs(estimate.probabilities.get(cell, estimate.interior_probability) - chance)
+                              for cell, chance in probabilities.items()))
+        print(f"{budget:>8} {elapsed / len(boards) * 1000:>7.1f}ms {sum(errors) / len(errors):>11.3f} {max(errors):>11.3f}")
+
+def benchmark_deduction(games=50, width=30, height=16, num_mines=99):
+    """Compare the deduction engine, kept up to date move by move, with a full solver run at every position of
+    Expert AI games: time per position and how many of the solver's certain cells the engine finds."""
+    from AIPlayer import AIPlayer
+    from Deduction import DeductionEngine
+    from Solver import Solver
+    engine_time = solver_time = 0
+    positions = engine_found = solver_found = 0
+    for seed in range(games):
+        minesweeper = Minesweeper(width, height, num_mines, "Auto", "Expert", seed=seed)
+        ai_player = AIPlayer(minesweeper, "Expert")
+        engine = DeductionEngine(minesweeper)
+        random.seed(seed)
+        while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+            start = time.perf_counter()
+            engine.deduce()
+            engine_time += time.perf_counter() - start
+            start = time.perf_counter()
+            result = Solver(minesweeper).solve()
+            solver_time += time.perf_counter() - start
+            # The incremental engine only reports components that changed, so count what a fresh one finds
+            engine_found += sum(len(cells) for cells in DeductionEngine(minesweeper).deduce())
+            solver_found += len(result.safe) + len(result.mines)
+            positions += 1
+            with contextlib.redirect_stdout(io.StringIO()):
+                ai_player.make_move()
+    print(f"Deduction engine against the solver on {positions} positions of {games} {width}x{height} Expert AI games")
+    print(f"{'':>8} {'per move':>9} {'certain cells found':>20}")
+    print(f"{'engine':>8} {engine_time / positions * 1000:>7.2f}ms {engine_found / solver_found:>20.1%}")
+    print(f"{'solver':>8} {solver_time / positions * 1000:>7.2f}ms {1:>20.1%}")
+
+def benchmark_async_ai(moves=150, width=200, height=200, num_mines=8000, difficulty="Expert", fps=60):
+    """Run a stand-in for the game's 60 FPS loop (touch every cell of the display board, then wait for the next
+    frame) while the AI plays move after move, once choosing the moves on the loop's thread like the game used
+    to and once on an AIWorker, and report the loop's frame times."""
+    from AIPlayer import AIPlayer
+    from AIWorker import AIWorker
+    print(f"{fps} FPS loop while the {difficulty} AI plays {moves} moves on a {width}x{height} board with {num_mines} mines")
+    print(f"{'AI runs on':>12} {'frames':>7} {'mean':>9} {'p99':>9} {'max':>9} {'moves/s':>8}")
+    for threaded in (False, True):
+        worker = AIWorker() if threaded else None
+        random.seed(0)
+        frame_times = []
+        played = games = 0
+        minesweeper = None
+        start = last = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            while played < moves:
+                # Start the next board once a game is over (or before the first one), like pressing Reset
+                if minesweeper is None or minesweeper.is_game_over() or minesweeper.is_game_won():
+                    minesweeper = Minesweeper(width, height, num_mines, "Auto", difficulty, safe_opening=True, seed=games)
+                    ai_player = AIPlayer(minesweeper, difficulty)
+                    games += 1
+                if not threaded:
+                    ai_player.make_move()
+                    played += 1
+                else:
+                    if worker.is_ready():
+                        ai_player.apply_move(worker.take_move())
+                        played += 1
+                    if not worker.is_thinking() and not minesweeper.is_game_over() and not minesweeper.is_game_won():
+                        worker.start(ai_player)
+                sum(row.count("?") for row in minesweeper.get_display_board())
+                time.sleep(max(0.0, last + 1 / fps - time.perf_counter()))
+                now = time.perf_counter()
+                frame_times.append(now - last)
+                last = now
+        if worker is not None:
+            worker.shutdown()
+        frame_times.sort()
+        print(f"{'worker' if threaded else 'game loop':>12} {len(frame_times):>7} {sum(frame_times) / len(frame_times) * 1000:>7.1f}ms "
+              f"{frame_times[int(len(frame_times) * 0.99)] * 1000:>7.1f}ms {frame_times[-1] * 1000:>7.1f}ms "
+              f"{played / (last - start):>8.1f}")
+
+def benchmark_patterns(games=30, width=30, height=16, num_mines=99, every=10):
+    """Time a full scan of the hard patterns (as on the Hard AI's first move) on positions from Hard AI games,
+    and the Hard AI's time per move over the same games."""
+    from AIPlayer import AIPlayer
+    scan_time = move_time = 0
+    scanned = moves = 0
+    for seed in range(games):
+        minesweeper = Minesweeper(width, height, num_mines, "Auto", "Hard", safe_opening=True, seed=seed)
+        ai_player = AIPlayer(minesweeper, "Hard")
+        random.seed(seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+                if moves % every == every // 2:
+                    start = time.perf_counter()
+                    ai_player.update_hard_patterns(None)
+                    scan_time += time.perf_counter() - start
+                    scanned += width * height
+                start = time.perf_counter()
+                ai_player.make_move()
+                move_time += time.perf_counter() - start
+                moves += 1
+    print(f"Hard patterns on {games} {width}x{height} games with {num_mines} mines")
+    print(f"{'full scan':>12} {scan_time / scanned * 1e9:>8.0f}ns per cell")
+    print(f"{'per move':>12} {move_time / moves * 1000:>8.3f}ms over {moves} moves")
+
+def benchmark_batch_moves(games=30, width=30, height=16, num_mines=99):
+    """Compare playing whole games one make_move call per move against one make_moves call per batch of
+    certain moves, in AI calls and AI time per game."""
+    from AIPlayer import AIPlayer
+    print(f"AI calls and time per game over {games} games on {width}x{height} boards with {num_mines} mines")
+    print(f"{'difficulty':>10} {'make_move':>22} {'make_moves':>22} {'won':>9}")
+    for difficulty in ("Medium", "Hard", "Expert"):
+        cells = []
+        for batch in (False, True):
+            calls = won = 0
+            elapsed = 0
+            for seed in range(games):
+                minesweeper = Minesweeper(width, height, num_mines, "Auto", difficulty, seed=seed)
+                ai_player = AIPlayer(minesweeper, difficulty)
+                random.seed(seed)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+                        start = time.perf_counter()
+                        if batch:
+                            ai_player.make_moves()
+                        else:
+                            ai_player.make_move()
+                        elapsed += time.perf_counter() - start
+                        calls += 1
+                won += minesweeper.is_game_won()
+            cells.append(f"{calls / games:>6.0f} calls {elapsed / games * 1000:>7.1f}ms")
+            cells.append(won)
+        print(f"{difficulty:>10} {cells[0]:>22} {cells[2]:>22} {cells[1]:>4}/{cells[3]:<4}")
+
+def local_rule_applies(minesweeper):
+    """True if a one number at a time rule proves some covered square safe or a mine: a number with as many flags
+    around it as its value and covered squares left, or with exactly as many covered and flagged squares as its value."""
+    cell = minesweeper.get_cell
+    neighbors = minesweeper.neighbor_table.neighbors
+    for y in range(minesweeper.height):
+        for x in range(minesweeper.width):
+            value = cell(x, y)
+            if value == "?" or value == "F" or value == 0:
+                continue
+            around = [cell(nx, ny) for nx, ny in neighbors(x, y)]
+            covered, flagged = around.count("?"), around.count("F")
+            if covered and (value == flagged or value == flagged + covered):
+                return True
+    return False
+
+def benchmark_deadline(games=200, width=30, height=16, num_mines=99, deadline_ms=0.05):
+    """Play whole games with a per-move time budget too small for anything but the cheapest stages, and report the win
+    rate and the timeout guesses per game. Medium and Hard run their local rules before giving up, so they should
+    never make a timeout guess while one of those rules still applies (the last column)."""
+    from AIPlayer import AIPlayer
+    print(f"AI with {deadline_ms}ms per move over {games} games on {width}x{height} boards with {num_mines} mines")
+    print(f"{'difficulty':>10} {'won':>6} {'timeouts/game':>14} {'with a local rule':>18}")
+    for difficulty in ("Medium", "Hard", "Expert"):
+        won = timeouts = missed = 0
+        for seed in range(games):
+            minesweeper = Minesweeper(width, height, num_mines, "Auto", difficulty, seed=seed)
+            ai_player = AIPlayer(minesweeper, difficulty)
+            random.seed(seed)
+            while not minesweeper.is_game_over() and not minesweeper.is_game_won():
+                applies = local_rule_applies(minesweeper)
+                # The AI prints every move it makes, which would swamp the table
+                with contextlib.redirect_stdout(io.StringIO()):
+                    ai_player.make_move(deadline_ms)
+                if ai_player.moveStage == "timeout":
+                    timeouts += 1
+                    missed += applies
+            won += minesweeper.is_game_won()
+        print(f"{difficulty:>10} {won / games:>6.0%} {timeouts / games:>14.1f} {missed:>18}")
+
+def benchmark_rendering(frames=600, repeats=3, window=(600, 600), num_mines=15, seed=3, pan_frames=200,
+                        pan_sides=(10, 100, 1000, 4000)):
+    """Time drawing the game's frames (cells, labels, turn, timer and flag text, cursor) on a 10x10 board while the
+    mouse moves every frame and a safe square is revealed every second: redrawn in full with every glyph rasterized
+    as it is drawn (as before GlyphCache), redrawn in full with the cache, and redrawn only where something changed
+    (MinesweeperGame.BoardRenderer). Then time panning across boards of growing size, which redraws the whole view
+    every frame."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed, frames are drawn off screen
+    import pygame as pg
+    import MinesweeperGame
+    from GlyphCache import GlyphCache
+    from Resources import Resources
+    from Viewport import Viewport
+    from ChunkedBoard import ChunkedMinesweeper
+
+    class UncachedGlyphs(GlyphCache):
+        def get(self, asset, value, cell_size, color):
+            return self.render(asset, value, cell_size, color)
+
+    pg.init()
+    screen = pg.display.set_mode(window)
+    resources = Resources()  # Not the game's shared one, which would outlive this pygame session
+    font = resources.font(MinesweeperGame.FONT_PATH, MinesweeperGame.TEXT_FONT_SIZE)
+    images = {"mine": resources.image(MinesweeperGame.MINE_PATH), "flag": resources.image(MinesweeperGame.FLAG_PATH)}
+    cursor_img = resources.image(MinesweeperGame.CURSOR_PATH)
+    size = MinesweeperGame.BOARD_WIDTH
+    area = (window[0] // 10, window[1] // 10, window[0] * 8 // 10, window[1] * 8 // 10)
+
+    def play(glyphs, dirty):
+        renderer = MinesweeperGame.BoardRenderer(glyphs)
+        viewport = Viewport(size, size)
+        viewport.fit(area)
+        minesweeper = Minesweeper(size, size, num_mines, "Solo", None, safe_opening=True, seed=seed)
+        minesweeper.reveal_square(size // 2, size // 2)
+        safe = [(x, y) for y in range(size) for x in range(size) if minesweeper.board[y][x] != -1]
+        pixels = 0
+        for frame in range(frames):
+            if frame % 60 == 59:
+                while safe and minesweeper.is_revealed(*safe[-1]):
+                    safe.pop()
+                if safe:
+                    minesweeper.reveal_square(*safe.pop())
+            widgets = {}
+            for name, text, top in (("turn", "Turn: Player", 10), ("time", f"TIME: {frame // 60}", window[1] - 34),
+                                    ("flags", f"Flags Remaining: {minesweeper.flags_remaining}", window[1] - 70)):
+                surface = glyphs.text(text, MinesweeperGame.GENERAL_TEXT)
+                widgets[name] = MinesweeperGame.text_widget(surface, surface.get_rect(midtop=(window[0] // 2, top)))
+            cursor = (cursor_img, (100 + frame % 200, 300))
+            if dirty:
+                pixels += sum(rect.width * rect.height for rect in renderer.draw_frame(screen, minesweeper, viewport, None, widgets, None, cursor))
+            else:
+                screen.fill(MinesweeperGame.BACKGROUND)
+                renderer.draw_board(screen, minesweeper, viewport)
+                for _, _, draw in widgets.values():
+                    draw(screen)
+                screen.blit(*cursor)
+                pg.display.flip()
+                pixels += window[0] * window[1]
+        return pixels
+
+    print(f"Drawing {frames} frames of a {size}x{size} board in a {window[0]}x{window[1]} window")
+    print(f"{'frames':>20} {'per frame':>10} {'rasterized':>16} {'pixels updated':>16}")
+    for name, glyph_class, dirty in (("full, uncached", UncachedGlyphs, False), ("full, GlyphCache", GlyphCache, False),
+                                     ("BoardRenderer", GlyphCache, True)):
+        glyphs = glyph_class({"text": font}, images)
+        results = []
+        elapsed = time_call(lambda: results.append(play(glyphs, dirty)), repeats)
+        print(f"{name:>20} {elapsed / frames * 1000:>8.3f}ms {glyphs.rendered / (frames * repeats):>10.1f}/frame "
+              f"{results[-1] / frames:>10.0f}/frame")
+
+    # Panning redraws everything in view, which only depends on the window and the cell size, not on the board
+    glyphs = GlyphCache({"text": font}, images)
+    print(f"Panning {pan_frames} frames with BoardRenderer at the default zoom")
+    print(f"{'board':>20} {'per frame':>10}")
+    for side in pan_sides:
+        board_class = ChunkedMinesweeper if side * side > MinesweeperGame.CHUNKED_SQUARES else Minesweeper
+        minesweeper = board_class(side, side, side * side // 7, "Solo", None, safe_opening=True, seed=seed)
+        minesweeper.reveal_square(side // 2, side // 2)
+        renderer = MinesweeperGame.BoardRenderer(glyphs)
+        viewport = Viewport(side, side)
+        viewport.fit(area)
+
+        def pan():
+            for frame in range(pan_frames):
+                viewport.pan(3 if frame // 50 % 2 else -3, 2)
+                renderer.draw_frame(screen, minesweeper, viewport, None, {})
+        print(f"{f'{side}x{side}':>20} {time_call(pan, repeats) / pan_frames * 1000:>8.3f}ms")
+    pg.quit()
+
+def read_io():
+    """(read calls, bytes read) by this process so far, from /proc/self/io, or None where that isn't available."""
+    try:
+        with open("/proc/self/io") as io_file:
+            fields = dict(line.split(": ") for line in io_file.read().splitlines())
+        return int(fields["syscr"]), int(fields["rchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def benchmark_resources(frames=600, repeats=3, window=(600, 600)):
+    """Profile the game's file I/O: loading its fonts and images at startup, the first time and again from
+    Resources, and drawing the game screen's buttons with the Yes, No and Reset buttons made anew every frame,
+    each opening its own font (as before Resources), against buttons made once and placed on resize."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed, frames are drawn off screen
+    import pygame as pg
+    import MinesweeperGame
+    from MinesweeperGame import Button, FONT_PATH, WHITE
+    from Resources import Resources
+
+    pg.init()
+    screen = pg.display.set_mode(window)
+    w, h = window
+
+    def profile(function, count, runs):
+        """Best time of function over runs, and the read calls and bytes read, per count."""
+        before_io = read_io()
+        elapsed = time_call(function, runs)
+        after_io = read_io()
+        if before_io is None:
+            return elapsed / count, "n/a", "n/a"
+        calls, read = (after - before for before, after in zip(before_io, after_io))
+        return elapsed / count, f"{calls / (count * runs):.1f}", f"{read / (count * runs) / 1024:.1f}KB"
+
+    resources = Resources()
+
+    def startup():
+        for size in (MinesweeperGame.TEXT_FONT_SIZE, MinesweeperGame.TITLE_FONT_SIZE, MinesweeperGame.BUTTON_FONT_SIZE):
+            resources.font(FONT_PATH, size)
+        for path in (MinesweeperGame.CURSOR_PATH, MinesweeperGame.FLAG_PATH, MinesweeperGame.MINE_PATH):
+            resources.image(path)
+
+    print("Loading the game's 3 fonts and 3 images")
+    print(f"{'':>20} {'time':>10} {'files':>8} {'read calls':>12} {'read':>10}")
+    # Only the first run reads anything, so it is timed once
+    for name, runs in (("first time", 1), ("from Resources", repeats)):
+        loads = resources.loads
+        elapsed, calls, read = profile(startup, 1, runs)
+        print(f"{name:>20} {elapsed * 1000:>8.3f}ms {(resources.loads - loads) / runs:>8.1f} {calls:>12} {read:>10}")
+
+    def frame_buttons(made_once):
+        buttons = {}
+        files = 0
+        for frame in range(frames):
+            if not made_once or not buttons:
+                # Before Resources every Button opened its own font
+                font = resources.font if made_once else pg.font.Font
+                buttons = {text: Button(0, 0, 0, 0, text, (110, 110, 130), (140, 140, 170), WHITE,
+                                        font(FONT_PATH, MinesweeperGame.BUTTON_FONT_SIZE))
+                           for text in ("Yes", "No", "Reset")}
+                files += 0 if made_once else len(buttons)
+                buttons["Yes"].place(w // 2 - 145, h // 2 + 50, 130, 44)
+                buttons["No"].place(w // 2 + 15, h // 2 + 50, 130, 44)
+                buttons["Reset"].place(10, h - 46, 110, 36)
+            buttons["Reset"].draw(screen)
+        return files
+
+    print(f"Drawing the game screen's buttons for {frames} frames")
+    print(f"{'buttons':>20} {'per frame':>10} {'files':>8} {'read calls':>12} {'read':>10}")
+    for name, made_once in (("made every frame", False), ("made once", True)):
+        files = []
+        elapsed, calls, read = profile(lambda: files.append(frame_buttons(made_once)), frames, repeats)
+        print(f"{name:>20} {elapsed * 1000:>8.3f}ms {files[-1] / frames:>8.1f} {calls:>12} {read:>10}")
+    pg.quit()
+
+def benchmark_idle(seconds=10, window=(600, 600), num_mines=15, seed=3):
+    """Measure the CPU used and the frames drawn while a Solo game sits idle: in a stand-in for the game loop as it
+    was, handling events and drawing a frame 60 times a second, and in Game.run, which sleeps until an event or
+    the timer's next second. Without a window SDL polls for events every millisecond while it waits, which a real
+    display doesn't, so the second number is an upper bound."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed, frames are drawn off screen
+    import pygame as pg
+    import MinesweeperGame
+    from GlyphCache import GlyphCache
+    from Resources import Resources
+    from Viewport import Viewport
+
+    size = MinesweeperGame.BOARD_WIDTH
+    area = (window[0] // 10, window[1] // 10, window[0] * 8 // 10, window[1] * 8 // 10)
+
+    def sixty_fps_loop():
+        pg.init()
+        screen = pg.display.set_mode(window)
+        resources = Resources()
+        glyphs = GlyphCache({"text": resources.font(MinesweeperGame.FONT_PATH, MinesweeperGame.TEXT_FONT_SIZE)},
+                            {"mine": resources.image(MinesweeperGame.MINE_PATH),
+                             "flag": resources.image(MinesweeperGame.FLAG_PATH)})
+        renderer = MinesweeperGame.BoardRenderer(glyphs)
+        viewport = Viewport(size, size)
+        viewport.fit(area)
+        minesweeper = Minesweeper(size, size, num_mines, "Solo", None, seed=seed)
+        clock = pg.time.Clock()
+        frames = []
+        start = pg.time.get_ticks()
+        while pg.time.get_ticks() - start < seconds * 1000:
+            pg.event.get()
+            surface = glyphs.text(f"TIME: {(pg.time.get_ticks() - start) // 1000}", MinesweeperGame.GENERAL_TEXT)
+            widgets = {"time": MinesweeperGame.text_widget(surface, surface.get_rect(bottomright=window))}
+            renderer.draw_frame(screen, minesweeper, viewport, None, widgets)
+            frames.append((time.perf_counter(), time.process_time()))
+            clock.tick(60)
+        pg.quit()
+        return frames
+
+    def game_run():
+        # Note when Game.run draws each frame, and make it quit after the given time
+        frames = []
+        draw_frame = MinesweeperGame.BoardRenderer.draw_frame
+
+        def timed_draw_frame(renderer, *args):
+            draw_frame(renderer, *args)
+            frames.append((time.perf_counter(), time.process_time()))
+        MinesweeperGame.BoardRenderer.draw_frame = timed_draw_frame
+        try:
+            game = MinesweeperGame.Game()
+            game.start_game(size, size, num_mines, "Solo", None)
+            pg.time.set_timer(pg.QUIT, seconds * 1000, 1)
+            game.run()
+        finally:
+            MinesweeperGame.BoardRenderer.draw_frame = draw_frame
+        return frames
+
+    print(f"Idle Solo game on a {size}x{size} board for {seconds}s")
+    print(f"{'loop':>20} {'CPU':>8} {'frames/s':>10}")
+    for name, loop in (("60 FPS", sixty_fps_loop), ("Game.run", game_run)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            frames = loop()
+        # From the first frame to the last, so loading and setting up the window isn't counted
+        (first_wall, first_cpu), (last_wall, last_cpu) = frames[0], frames[-1]
+        wall = last_wall - first_wall
+        print(f"{name:>20} {(last_cpu - first_cpu) / wall * 100:>7.2f}% {(len(frames) - 1) / wall:>10.1f}")
+
+BENCHMARKS = {
+    "generation": benchmark_board_generation,
+    "flood": benchmark_flood_fill,
+    "density": benchmark_mine_density,
+    "memory": benchmark_board_memory,
+    "chunked": benchmark_chunked_board,
+    "files": benchmark_board_files,
+    "whatif": benchmark_what_if,
+    "neighbors": benchmark_neighbors,
+    "solver": benchmark_solver,
+    "autosolve": benchmark_auto_solve,
+    "aiturns": benchmark_ai_turns,
+    "montecarlo": benchmark_monte_carlo,
+    "deduction": benchmark_deduction,
+    "asyncai": benchmark_async_ai,
+    "patterns": benchmark_patterns,
+    "batch": benchmark_batch_moves,
+    "deadline": benchmark_deadline,
+    "rendering": benchmark_rendering,
+    "resources": benchmark_resources,
+    "idle": benchmark_idle,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Minesweeper engine benchmarks.")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}'")
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+        print()
@@ -0,0 +1,213 @@
+"""
+Module: BitBoard
+Class: BitboardMinesweeper
+Description: Compact storage backend for the Minesweeper board. Mines, revealed squares and flags
+                are kept as three bitsets, about 3 bits per cell, instead of lists of Python objects.
+                Neighbor counts and flood fill frontiers use shift-and-mask operations and the
+                revealed/flagged counts are popcounts.
+Inputs: Width, height, and number of mines defining the initial board setup.
+Outputs: Minesweeper game board with the same public methods as MinesweeperBoard.Minesweeper.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+from functools import lru_cache
+from MinesweeperBoard import Minesweeper
+
+# Bit layout: square (x, y) is bit y * (width + 1) + x. The extra column on the right of every row
+# is never set in a board's bitsets, so shifting by one bit never carries a square into the next row.
+
+@lru_cache(maxsize=16)
+def valid_mask(width, height):
+    """Bitmask with a bit set for every real square of a width x height board, shared by boards of that shape."""
+    stride = width + 1
+    mask = (1 << width) - 1
+    rows = 1
+    # Double the number of rows covered each step instead of OR-ing in one row at a time
+    while rows < height:
+        mask |= mask << (rows * stride)
+        rows *= 2
+    return mask & ((1 << (height * stride)) - 1)
+
+def test_bit(bits, index):
+    """Read one bit of a bytearray bitset."""
+    return bits[index >> 3] >> (index & 7) & 1
+
+class BitboardMinesweeper(Minesweeper):
+    # board, revealed and flags are bytearray bitsets here: board has a bit set for every mine.
+    # There is no persistent display view; get_cell and get_display_board decode the bits on demand.
+
+    def create_grids(self):
+        """Create the mine, revealed and flag bitsets."""
+        self.stride = self.width + 1
+        size = (self.stride * self.height + 7) // 8
+        return bytearray(size), bytearray(size), bytearray(size)
+
+    def create_display(self):
+        """The display view is decoded from the bitsets on demand."""
+        return None
+
+    def _to_int(self, bits):
+        return int.from_bytes(bits, "little")
+
+    def _store(self, bits, value):
+        bits[:] = value.to_bytes(len(bits), "little")
+
+    def _dilate(self, bits):
+        """Set every bit next to (or on) a set bit. The result may include padding bits."""
+        bits |= (bits << 1) | (bits >> 1)
+        return bits | (bits << self.stride) | (bits >> self.stride)
+
+    def _cells(self, bits):
+        """Decode a bitmask of squares into a set of (x, y) cells."""
+        cells = set()
+        for byte_index, byte in enumerate(bits.to_bytes(len(self.revealed), "little")):
+            while byte:
+                low = byte & -byte
+                y, x = divmod(byte_index * 8 + low.bit_length() - 1, self.stride)
+                cells.add((x, y))
+                byte ^= low
+        return cells
+
+    def place_mines(self, safe_x=None, safe_y=None):
+        """Place mines, ensuring the first square is safe."""
+        for index in self.sample_mine_indices(safe_x, safe_y):
+            y, x = divmod(index, self.width)
+            bit = y * self.stride + x
+            self.board[bit >> 3] |= 1 << (bit & 7)
+
+    def adjacent_mines(self, x, y):
+        """Count the mines next to a square with bit tests on the mine bitset."""
+        board, stride, bit = self.board, self.stride, y * self.stride + x
+        # Offsets are (dx, dy) pairs, so the flat bit offset uses this board's padded stride
+        return sum(test_bit(board, bit + dy * stride + dx) for dx, dy in self.neighbor_table.deltas_at(x, y))
+
+    def calculate_square(self, x, y):
+        """Return the number of adjacent mines for a given square, or -1 for a mine."""
+        if test_bit(self.board, y * self.stride + x):
+            return -1
+        return self.adjacent_mines(x, y)
+
+    def calculate_squares(self):
+        """Nothing to precompute: adjacent mine counts are read from the mine bitset on demand."""
+
+    def reveal_cells(self, x, y):
+        """Reveal a square and flood fill outward from 0 squares by repeatedly dilating the frontier.
+        Returns the set of (x, y) cells that were newly revealed by this call."""
+        if self.is_revealed(x, y) or self.is_flagged(x, y) or self.game_over:
+            return set()
+
+        # Place mines after first click, ensuring the first square is safe
+        if not self.mines_placed:
+            self.place_mines(safe_x=x, safe_y=y)
+            self.mines_placed = True
+
+        bit = y * self.stride + x
+
+        # Mine then lose
+        if test_bit(self.board, bit):
+            self.revealed[bit >> 3] |= 1 << (bit & 7)
+            newly_revealed = {(x, y)} | self.reveal_all_mines()
+            self.game_over = True
+            self._record_changes(newly_revealed, ("reveal", newly_revealed, 0, True))
+            return newly_revealed
+
+        if self.adjacent_mines(x, y) == 0:
+            # Squares with no mine in their 3x3 block keep the fill going; flags and revealed squares stop it
+            valid = valid_mask(self.width, self.height)
+            revealed = self._to_int(self.revealed)
+            open_squares = valid & ~self._dilate(self._to_int(self.board))
+            blocked = revealed | self._to_int(self.flags)
+            filled = frontier = 1 << bit
+            while frontier:
+                frontier = self._dilate(frontier & open_squares) & valid & ~blocked & ~filled
+                filled |= frontier
+            self._store(self.revealed, revealed | filled)
+            newly_revealed = self._cells(filled)
+        else:
+            self.revealed[bit >> 3] |= 1 << (bit & 7)
+            newly_revealed = {(x, y)}
+
+        self.revealed_safe_count += len(newly_revealed)
+        self._record_changes(newly_revealed, ("reveal", newly_revealed, len(newly_revealed), False))
+        return newly_revealed
+
+    def toggle_flag(self, x, y):
+        """Toggle a flag on a square if flaggable."""
+        if self.is_revealed(x, y) or self.game_over:
+            return
+
+        bit = y * self.stride + x
+        self.flags[bit >> 3] ^= 1 << (bit & 7)
+
+        self.flags_remaining += -1 if test_bit(self.flags, bit) else 1
+        self._record_changes({(x, y)}, ("flag", {(x, y)}))
+
+    def _set_revealed(self, cells, value):
+        """Set or clear the revealed bit of the given cells."""
+        for x, y in cells:
+            bit = y * self.stride + x
+            if value:
+                self.revealed[bit >> 3] |= 1 << (bit & 7)
+            else:
+                self.revealed[bit >> 3] &= ~(1 << (bit & 7))
+
+    def _set_flag(self, x, y, value):
+        """Set or clear the flag bit of one cell."""
+        bit = y * self.stride + x
+        if value:
+            self.flags[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self.flags[bit >> 3] &= ~(1 << (bit & 7))
+
+    def is_revealed(self, x, y):
+        """True if the square has been revealed, false otherwise."""
+        return bool(test_bit(self.revealed, y * self.stride + x))
+
+    def is_flagged(self, x, y):
+        """True if the square is flagged, false otherwise."""
+        return bool(test_bit(self.flags, y * self.stride + x))
+
+    def count_revealed(self):
+        """Number of revealed squares, mines included (popcount)."""
+        return self._to_int(self.revealed).bit_count()
+
+    def count_flags(self):
+        """Number of flagged squares (popcount)."""
+        return self._to_int(self.flags).bit_count()
+
+    def count_revealed_safe(self):
+        """Count the revealed non-mine squares with a popcount (used to check revealed_safe_count)."""
+        return (self._to_int(self.revealed) & ~self._to_int(self.board)).bit_count()
+
+    def get_cell(self, x, y):
+        """Returns the display value of a single square in O(1)."""
+        bit = y * self.stride + x
+        if test_bit(self.revealed, bit):
+            return -1 if test_bit(self.board, bit) else self.adjacent_mines(x, y)
+        return "F" if test_bit(self.flags, bit) else "?"
+
+    def get_display_board(self):
+        """Returns the current state of the board for display purposes, decoded from the bitsets.
+        Unlike the list backend this is a new list of lists on every call."""
+        return [[self.get_cell(x, y) for x in range(self.width)] for y in range(self.height)]
+
+    def reveal_all_mines(self):
+        """Reveal all mines on the board. Returns the set of mine cells that were newly revealed."""
+        revealed = self._to_int(self.revealed)
+        mines = self._to_int(self.board)
+        self._store(self.revealed, revealed | mines)
+        return self._cells(mines & ~revealed)
+
+    def to_planes(self):
+        """The bitsets already use the BoardFile plane layout."""
+        return self.board, self.revealed, self.flags
+
+    def load_planes(self, mines, revealed, flags):
+        """Copy bit planes in the BoardFile layout straight into the bitsets."""
+        self.board[:] = mines
+        self.revealed[:] = revealed
+        self.flags[:] = flags
+        self.revealed_safe_count = self.count_revealed_safe()
@@ -0,0 +1,157 @@
+"""
+Module: BoardFile
+Functions: board_to_bytes, board_from_bytes, save_board, load_board, write_corpus
+Class: BoardCorpus
+Description: Versioned binary format for saving and loading Minesweeper boards, and corpus files
+                holding many boards that are memory-mapped so one board can be opened without
+                reading the rest of the file.
+Inputs: Minesweeper boards (any storage backend that implements to_planes/load_planes, so not chunked boards,
+                which can be far too large for whole-board planes) or board files.
+Outputs: Board files, corpus files, and boards restored from them.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import mmap
+import struct
+
+# Board record, version 1 (all integers little-endian):
+#   64 byte header: magic "MSWB", format version (u16), state bits (u16), width (u32), height (u32),
+#                   num_mines (u32), flags_remaining (i32), seed (i64), mode and difficulty (16 byte ASCII,
+#                   zero padded, empty for None)
+#   then the mine, revealed and flag planes, each plane_size(width, height) bytes.
+# A plane has one bit per square: square (x, y) is bit y * (width + 1) + x, bit i being bit (i % 8) of
+# byte i // 8. The extra bit at the end of every row is always clear. This is the same layout that
+# BitBoard.BitboardMinesweeper keeps in memory, so that backend loads a board with three slice copies.
+BOARD_MAGIC = b"MSWB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIiq16s16s")
+
+# Bits of the header's state field
+GAME_OVER = 1
+MINES_PLACED = 2
+SAFE_OPENING = 4
+HAS_SEED = 8
+
+# Corpus file: "MSWC", format version (u16), reserved (u16), board count (u32), then one u64 offset per
+# board from the start of the file, then the board records back to back.
+CORPUS_MAGIC = b"MSWC"
+CORPUS_HEADER = struct.Struct("<4sHHI")
+CORPUS_OFFSET = struct.Struct("<Q")
+
+SEED_RANGE = range(-2**63, 2**63)
+
+def plane_size(width, height):
+    """Number of bytes in one bit plane of a width x height board."""
+    return ((width + 1) * height + 7) // 8
+
+def _check_savable(board_class):
+    """Raise TypeError for a storage backend without whole-board planes (ChunkedBoard.ChunkedMinesweeper)."""
+    if board_class.to_planes is None or board_class.load_planes is None:
+        raise TypeError(f"{board_class.__name__} boards cannot be saved to or loaded from board files")
+
+def _text_field(value):
+    return (value or "").encode("ascii")[:16]
+
+def board_to_bytes(minesweeper):
+    """Encode a board as a version 1 board record."""
+    _check_savable(type(minesweeper))
+    state = 0
+    if minesweeper.game_over:
+        state |= GAME_OVER
+    if minesweeper.mines_placed:
+        state |= MINES_PLACED
+    if minesweeper.safe_opening:
+        state |= SAFE_OPENING
+    seed = minesweeper.seed
+    # Only integer seeds that fit the field can be kept; other boards reload with a fresh seed
+    if isinstance(seed, int) and seed in SEED_RANGE:
+        state |= HAS_SEED
+    else:
+        seed = 0
+    header = HEADER.pack(BOARD_MAGIC, FORMAT_VERSION, state, minesweeper.width, minesweeper.height,
+                         minesweeper.num_mines, minesweeper.flags_remaining, seed,
+                         _text_field(minesweeper.mode), _text_field(minesweeper.difficulty))
+    return header + b"".join(bytes(plane) for plane in minesweeper.to_planes())
+
+def board_from_bytes(data, board_class, offset=0):
+    """Decode the board record starting at offset in data (bytes, mmap or memoryview) into a board_class."""
+    _check_savable(board_class)
+    magic, version, state, width, height, num_mines, flags_remaining, seed, mode, difficulty = HEADER.unpack_from(data, offset)
+    if magic != BOARD_MAGIC:
+        raise ValueError("Not a Minesweeper board record")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported board format version {version}")
+    minesweeper = board_class(width, height, num_mines, mode.rstrip(b"\0").decode("ascii") or None,
+                              difficulty.rstrip(b"\0").decode("ascii") or None,
+                              safe_opening=bool(state & SAFE_OPENING), seed=seed if state & HAS_SEED else None)
+    minesweeper.flags_remaining = flags_remaining
+    minesweeper.game_over = bool(state & GAME_OVER)
+    minesweeper.mines_placed = bool(state & MINES_PLACED)
+    size = plane_size(width, height)
+    start = offset + HEADER.size
+    with memoryview(data) as view:
+        minesweeper.load_planes(view[start:start + size], view[start + size:start + 2 * size],
+                                view[start + 2 * size:start + 3 * size])
+    return minesweeper
+
+def save_board(minesweeper, path):
+    """Write a board to its own board file."""
+    record = board_to_bytes(minesweeper)  # Before opening, so a board that can't be saved leaves no empty file
+    with open(path, "wb") as board_file:
+        board_file.write(record)
+
+def load_board(path, board_class):
+    """Read a board file written by save_board."""
+    with open(path, "rb") as board_file:
+        return board_from_bytes(board_file.read(), board_class)
+
+def write_corpus(path, boards):
+    """Write many boards into one corpus file that BoardCorpus can open one board at a time."""
+    records = [board_to_bytes(minesweeper) for minesweeper in boards]
+    offset = CORPUS_HEADER.size + CORPUS_OFFSET.size * len(records)
+    offsets = []
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+    with open(path, "wb") as corpus_file:
+        corpus_file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, FORMAT_VERSION, 0, len(records)))
+        corpus_file.write(b"".join(CORPUS_OFFSET.pack(offset) for offset in offsets))
+        corpus_file.writelines(records)
+
+class BoardCorpus:
+    # Read-only view of a corpus file. The file is memory-mapped, so opening it and loading one board
+    # only touches the pages holding the header, that board's offset and that board's record.
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count = CORPUS_HEADER.unpack_from(self._map, 0)
+        if magic != CORPUS_MAGIC:
+            self.close()
+            raise ValueError("Not a Minesweeper corpus file")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported corpus format version {version}")
+
+    def __len__(self):
+        return self.count
+
+    def load(self, index, board_class):
+        """Load board number index from the corpus as a board_class."""
+        if not 0 <= index < self.count:
+            raise IndexError("Board index out of range")
+        (offset,) = CORPUS_OFFSET.unpack_from(self._map, CORPUS_HEADER.size + index * CORPUS_OFFSET.size)
+        return board_from_bytes(self._map, board_class, offset)
+
+    def close(self):
+        """Unmap and close the corpus file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,306 @@
+"""
+Module: ChunkedBoard
+Class: ChunkedMinesweeper
+Description: Lazily generated storage backend for effectively unbounded Minesweeper boards.
+                The board is split into fixed-size square chunks whose mines are generated
+                deterministically from the board seed and the chunk coordinates, only when a reveal,
+                flag or neighbor count first touches the chunk. Cold chunks can be evicted to a
+                compressed store (in memory or on disk) so memory follows the explored area.
+                Reading a square can generate, load or evict chunks, so that is done under a lock: the
+                game draws the board while the AI reads it on its worker thread (see AIWorker).
+Inputs: Width, height, and number of mines defining the board, plus the chunk size and eviction limits.
+Outputs: Minesweeper game board with the same reveal_square semantics as MinesweeperBoard.Minesweeper.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import dbm
+import random
+import threading
+import zlib
+from collections import OrderedDict, deque
+from MinesweeperBoard import Minesweeper
+
+# Every square of a chunk is one byte of its bytearray, holding these bits
+MINE = 1
+REVEALED = 2
+FLAG = 4
+
+class ChunkedMinesweeper(Minesweeper):
+    def __init__(self, width, height, num_mines, mode, difficulty, safe_opening=False, seed=None, rng=None,
+                 debug=False, chunk_size=64, max_chunks=None, store_path=None):
+        """Take a width, height, and mine number to create a lazily generated board.
+        The mines are spread evenly over the chunks, so num_mines is rounded to what the chunks hold.
+        max_chunks limits how many chunks stay in memory; the least recently used ones beyond it are
+        evicted. Untouched chunks are simply regenerated later, played ones are compressed into a store,
+        which is a dbm file at store_path or a dict in memory when no path is given. A board with a store_path
+        should be closed with close(), or used in a with statement."""
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        super().__init__(width, height, num_mines, mode, difficulty, safe_opening, seed, rng, debug)
+        if self.seed is None:
+            self.seed = random.getrandbits(64)
+        self.cold_store = dbm.open(store_path, "n") if store_path else {}
+        self.safe_cells = set()  # Squares kept clear by the first click, applied whenever a chunk is generated
+        self.requested_mines = num_mines  # Chunk mine counts are shares of this; num_mines becomes the actual total
+        self.num_mines = self.planned_mines()
+        self.flags_remaining = self.num_mines
+
+    def create_grids(self):
+        """Chunks are created on demand, so there are no full-board grids."""
+        self.chunks = OrderedDict()  # (chunk_x, chunk_y) -> bytearray, kept in least recently used order
+        self.generated = set()       # Key of every chunk ever generated, wherever it is now
+        self.chunk_lock = threading.Lock()  # Held while chunks are looked up, loaded, generated or evicted
+        return None, None, None
+
+    def create_display(self):
+        """The display view is decoded from the chunks on demand."""
+        return None
+
+    def chunk_mines(self, area):
+        """Number of mines in a chunk covering area squares of the board (rounded share of the requested mines)."""
+        total = self.width * self.height
+        return min(area, (2 * self.requested_mines * area + total) // (2 * total))
+
+    def planned_mines(self):
+        """Total mines over every chunk, in closed form over the full, edge and corner chunk sizes."""
+        size = self.chunk_size
+        full_x, rest_x = divmod(self.width, size)
+        full_y, rest_y = divmod(self.height, size)
+        return (full_x * full_y * self.chunk_mines(size * size)
+                + full_y * self.chunk_mines(rest_x * size)
+                + full_x * self.chunk_mines(size * rest_y)
+                + self.chunk_mines(rest_x * rest_y))
+
+    def _chunk(self, chunk_x, chunk_y):
+        """Return the bytearray for a chunk, loading or generating it if it is not in memory."""
+        key = (chunk_x, chunk_y)
+        with self.chunk_lock:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                if self.max_chunks:
+                    self.chunks.move_to_end(key)
+                return chunk
+            # A chunk lives either in memory or in the cold store, never both, so nothing stale is left behind
+            name = f"{chunk_x},{chunk_y}"
+            stored = self.cold_store.get(name)
+            if stored is not None:
+                del self.cold_store[name]
+                chunk = bytearray(zlib.decompress(stored))
+            else:
+                chunk = self._generate_chunk(chunk_x, chunk_y)
+                self.generated.add(key)
+            self.chunks[key] = chunk
+            if self.max_chunks and len(self.chunks) > self.max_chunks:
+                self._evict(*self.chunks.popitem(last=False))
+            return chunk
+
+    def chunk_mine_positions(self, chunk_x, chunk_y):
+        """Deterministically pick a chunk's mine squares from the board seed and the chunk coordinates.
+        Returns (x, y) board positions, before the first click's safe squares are taken out."""
+        size = self.chunk_size
+        x0, y0 = chunk_x * size, chunk_y * size
+        chunk_width = min(size, self.width - x0)
+        chunk_height = min(size, self.height - y0)
+        chunk_rng = random.Random(f"{self.seed}:{chunk_x}:{chunk_y}")
+        samples = chunk_rng.sample(range(chunk_width * chunk_height), self.chunk_mines(chunk_width * chunk_height))
+        return [(x0 + index % chunk_width, y0 + index // chunk_width) for index in samples]
+
+    def _generate_chunk(self, chunk_x, chunk_y):
+        """Build a chunk's bytearray with its mines, leaving the first click's safe squares clear."""
+        size = self.chunk_size
+        chunk = bytearray(size * size)
+        for x, y in self.chunk_mine_positions(chunk_x, chunk_y):
+            if (x, y) not in self.safe_cells:
+                chunk[(y % size) * size + x % size] = MINE
+        return chunk
+
+    def _evict(self, key, chunk):
+        """Drop a chunk from memory, saving it to the cold store only if it has been played on. Called with
+        chunk_lock held."""
+        if chunk.translate(None, b"\x00\x01"):  # Anything left besides empty and mine squares is a reveal or flag
+            self.cold_store[f"{key[0]},{key[1]}"] = zlib.compress(bytes(chunk))
+
+    def _square(self, x, y):
+        """Return the chunk holding a square and the square's index inside it."""
+        chunk_x, local_x = divmod(x, self.chunk_size)
+        chunk_y, local_y = divmod(y, self.chunk_size)
+        return self._chunk(chunk_x, chunk_y), local_y * self.chunk_size + local_x
+
+    def _state(self, x, y):
+        chunk, index = self._square(x, y)
+        return chunk[index]
+
+    def place_mines(self, safe_x=None, safe_y=None):
+        """Mark the first click (and with safe_opening its neighbors) safe. Mines are placed per chunk on demand."""
+        if safe_x is None or safe_y is None:
+            return
+        if self.safe_opening:
+            self.safe_cells = {(nx, ny) for ny in range(max(safe_y - 1, 0), min(safe_y + 2, self.height))
+                               for nx in range(max(safe_x - 1, 0), min(safe_x + 2, self.width))}
+        else:
+            self.safe_cells = {(safe_x, safe_y)}
+        # Every mine the chunks would have put on a safe square is taken off the board's total
+        chunk_keys = {(x // self.chunk_size, y // self.chunk_size) for x, y in self.safe_cells}
+        removed = sum(1 for key in chunk_keys for position in self.chunk_mine_positions(*key) if position in self.safe_cells)
+        self.num_mines -= removed
+        self.flags_remaining -= removed
+        # Chunks already touched by flags were generated before the safe squares were known, so clear them by hand
+        for x, y in self.safe_cells:
+            chunk, index = self._square(x, y)
+            chunk[index] &= ~MINE
+
+    def adjacent_mines(self, x, y):
+        """Count the mines next to a square, generating neighboring chunks as needed."""
+        return sum(self._state(x + dx, y + dy) & MINE for dx, dy in self.neighbor_table.deltas_at(x, y))
+
+    def calculate_square(self, x, y):
+        """Return the number of adjacent mines for a given square, or -1 for a mine."""
+        if self._state(x, y) & MINE:
+            return -1
+        return self.adjacent_mines(x, y)
+
+    def calculate_squares(self):
+        """Nothing to precompute: adjacent mine counts are worked out per square on demand."""
+
+    def reveal_cells(self, x, y):
+        """Reveal a square and flood fill outward from 0 squares using a work queue, across chunk boundaries.
+        Returns the set of (x, y) cells that were newly revealed by this call."""
+        if self.game_over or self._state(x, y) & (REVEALED | FLAG):
+            return set()
+
+        # Mark the first click safe before any mines around it are read
+        if not self.mines_placed:
+            self.place_mines(safe_x=x, safe_y=y)
+            self.mines_placed = True
+
+        chunk, index = self._square(x, y)
+        chunk[index] |= REVEALED
+        newly_revealed = {(x, y)}
+
+        # Mine then lose
+        if chunk[index] & MINE:
+            newly_revealed |= self.reveal_all_mines()
+            self.game_over = True
+            self._record_changes(newly_revealed, ("reveal", newly_revealed, 0, True))
+            return newly_revealed
+
+        queue = deque()
+        if self.adjacent_mines(x, y) == 0:
+            queue.append((x, y))
+        while queue:
+            cx, cy = queue.popleft()
+            for nx, ny in self.neighbor_table.neighbors(cx, cy):
+                chunk, index = self._square(nx, ny)
+                if chunk[index] & (REVEALED | FLAG):
+                    continue
+                chunk[index] |= REVEALED
+                newly_revealed.add((nx, ny))
+                if self.adjacent_mines(nx, ny) == 0:
+                    queue.append((nx, ny))
+
+        self.revealed_safe_count += len(newly_revealed)
+        self._record_changes(newly_revealed, ("reveal", newly_revealed, len(newly_revealed), False))
+        return newly_revealed
+
+    def toggle_flag(self, x, y):
+        """Toggle a flag on a square if flaggable."""
+        chunk, index = self._square(x, y)
+        if chunk[index] & REVEALED or self.game_over:
+            return
+
+        chunk[index] ^= FLAG
+
+        self.flags_remaining += -1 if chunk[index] & FLAG else 1
+        self._record_changes({(x, y)}, ("flag", {(x, y)}))
+
+    def _set_revealed(self, cells, value):
+        """Set or clear the revealed bit of the given cells."""
+        for x, y in cells:
+            chunk, index = self._square(x, y)
+            if value:
+                chunk[index] |= REVEALED
+            else:
+                chunk[index] &= ~REVEALED
+
+    def _set_flag(self, x, y, value):
+        """Set or clear the flag bit of one cell."""
+        chunk, index = self._square(x, y)
+        if value:
+            chunk[index] |= FLAG
+        else:
+            chunk[index] &= ~FLAG
+
+    def is_revealed(self, x, y):
+        """True if the square has been revealed, false otherwise."""
+        return bool(self._state(x, y) & REVEALED)
+
+    def is_flagged(self, x, y):
+        """True if the square is flagged, false otherwise."""
+        return bool(self._state(x, y) & FLAG)
+
+    def get_cell(self, x, y):
+        """Returns the display value of a single square."""
+        state = self._state(x, y)
+        if state & REVEALED:
+            return -1 if state & MINE else self.adjacent_mines(x, y)
+        return "F" if state & FLAG else "?"
+
+    def get_display_board(self):
+        """Returns the current state of the whole board for display purposes. This generates every chunk,
+        so on very large boards read the squares you need with get_cell instead."""
+        return [[self.get_cell(x, y) for x in range(self.width)] for y in range(self.height)]
+
+    def _all_chunks(self):
+        """Yield (key, chunk) for every chunk that has been generated, without caching the ones not in memory: cold
+        ones are decompressed, and ones evicted before they were played on are generated again from the seed."""
+        with self.chunk_lock:
+            keys = list(self.generated)
+        for key in keys:
+            with self.chunk_lock:
+                chunk = self.chunks.get(key)
+                stored = None if chunk is not None else self.cold_store.get(f"{key[0]},{key[1]}")
+            if chunk is None:
+                chunk = bytearray(zlib.decompress(stored)) if stored is not None else self._generate_chunk(*key)
+            yield key, chunk
+
+    def count_revealed_safe(self):
+        """Count the revealed non-mine squares over every generated chunk (used to check revealed_safe_count)."""
+        return sum(1 for _, chunk in self._all_chunks() for state in chunk if state & (REVEALED | MINE) == REVEALED)
+
+    def reveal_all_mines(self):
+        """Reveal the mines of every generated chunk (the rest of an unbounded board is never built).
+        Returns the set of mine cells that were newly revealed."""
+        newly_revealed = set()
+        size = self.chunk_size
+        for (chunk_x, chunk_y), chunk in self._all_chunks():
+            for index, state in enumerate(chunk):
+                if state & (MINE | REVEALED) == MINE:
+                    chunk[index] |= REVEALED
+                    local_y, local_x = divmod(index, size)
+                    newly_revealed.add((chunk_x * size + local_x, chunk_y * size + local_y))
+            with self.chunk_lock:
+                if (chunk_x, chunk_y) not in self.chunks:
+                    self._evict((chunk_x, chunk_y), chunk)
+        return newly_revealed
+
+    def close(self):
+        """Close the cold store's dbm file, if the board has one. The board can't be played afterwards."""
+        if hasattr(self.cold_store, "close"):
+            self.cold_store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def resident_chunks(self):
+        """Number of chunks currently held in memory."""
+        return len(self.chunks)
+
+    # Chunked boards can be far too large for whole-board planes, so they have none and BoardFile refuses them
+    to_planes = None
+    load_planes = None
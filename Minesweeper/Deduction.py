@@ -0,0 +1,210 @@
+"""
+Module: Deduction
+Class: DeductionEngine
+Functions: reduce_rows, bound_values, forced_values
+Description: Linear algebra deduction for the Hard and Expert AIs. Every revealed number that touches
+                covered squares is an equation: the sum of its covered neighbors (0 or 1 each) equals the
+                number minus its flags. The equations of a frontier component are row reduced with integer
+                Gaussian elimination, and every reduced row is checked against the 0/1 bounds of its cells,
+                which finds the squares that are forced safe or forced mines by several numbers together.
+                The equations are kept up to date from the cells the board reports as changed, and only
+                the components whose equations changed are reduced again.
+Inputs: A Minesweeper board. Only what a player can see is used: the display values.
+Outputs: Sets of (x, y) squares that are certainly safe and certainly mines.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+from math import gcd
+
+def reduce_rows(rows, order):
+    """Row reduce [{cell: coefficient}, total] equations over the integers, pivoting on cells in the given order.
+    Returns the reduced rows, or None if they contradict each other (0 = a nonzero total)."""
+    rows = [(dict(coefficients), total) for coefficients, total in rows]
+    reduced = []
+    for cell in order:
+        pivot = next((number for number, (coefficients, _) in enumerate(rows) if cell in coefficients), None)
+        if pivot is None:
+            continue
+        pivot_row = rows.pop(pivot)
+        pivot_coefficient = pivot_row[0][cell]
+        for group in (rows, reduced):
+            for number, (coefficients, total) in enumerate(group):
+                factor = coefficients.get(cell)
+                if factor is None:
+                    continue
+                # row * pivot - pivot row * factor cancels the cell without leaving fractions
+                combined = {other: value * pivot_coefficient for other, value in coefficients.items()}
+                for other, value in pivot_row[0].items():
+                    combined[other] = combined.get(other, 0) - value * factor
+                combined = {other: value for other, value in combined.items() if value}
+                total = total * pivot_coefficient - pivot_row[1] * factor
+                divisor = gcd(total, *combined.values())
+                if divisor > 1:
+                    combined = {other: value // divisor for other, value in combined.items()}
+                    total //= divisor
+                group[number] = (combined, total)
+        reduced.append(pivot_row)
+        # Rows left with no cells are either 0 = 0 (redundant) or a contradiction
+        for coefficients, total in rows:
+            if not coefficients and total:
+                return None
+        rows = [row for row in rows if row[0]]
+    for coefficients, total in reduced:
+        if not coefficients and total:
+            return None
+    return [row for row in reduced if row[0]] + rows
+
+def bound_values(coefficients, total):
+    """Cells of one equation whose value (0 or 1) is forced by the smallest and largest sums the others allow.
+    Returns {cell: value}, or None if no values meet the equation."""
+    lowest = sum(value for value in coefficients.values() if value < 0)
+    highest = sum(value for value in coefficients.values() if value > 0)
+    if total < lowest or total > highest:
+        return None
+    forced = {}
+    for cell, value in coefficients.items():
+        if value > 0:
+            if highest - value < total:
+                forced[cell] = 1  # Even with every other positive cell a mine the total is out of reach
+            elif lowest + value > total:
+                forced[cell] = 0
+        else:
+            if lowest - value > total:
+                forced[cell] = 1
+            elif highest + value < total:
+                forced[cell] = 0
+    return forced
+
+def forced_values(rows):
+    """Every value bound_values forces in any of the rows, or None if the rows contradict each other."""
+    found = {}
+    for coefficients, total in rows:
+        forced = bound_values(coefficients, total)
+        if forced is None:
+            return None
+        for cell, value in forced.items():
+            if found.setdefault(cell, value) != value:
+                return None
+    return found
+
+class DeductionEngine:
+    # Flags are taken as mines, like the other AI levels do.
+    def __init__(self, board):
+        self.board = board
+        self.equations = {}       # number square (x, y) -> (covered neighbors, mines among them)
+        self.cell_equations = {}  # covered square -> number squares whose equations include it
+        self.dirty = set()        # Number squares whose equations changed since the last deduce()
+        self.seen_version = None
+
+    def update(self):
+        """Rebuild the equations of the numbers next to every cell changed since the last update."""
+        board = self.board
+        if self.seen_version == board.version:
+            return
+        table = board.neighbor_table
+        if self.seen_version is None:
+            touched = [(x, y) for y in range(board.height) for x in range(board.width)]
+        else:
+            touched = set()
+            for x, y in board.changes_since(self.seen_version):
+                touched.add((x, y))
+                touched.update(table.neighbors(x, y))
+        self.seen_version = board.version
+        get_cell = board.get_cell
+        for square in touched:
+            x, y = square
+            value = get_cell(x, y)
+            equation = None
+            if value != "?" and value != "F" and value > 0:
+                cells = []
+                mines = value
+                for nx, ny in table.neighbors(x, y):
+                    shown = get_cell(nx, ny)
+                    if shown == "?":
+                        cells.append((nx, ny))
+                    elif shown == "F":
+                        mines -= 1
+                if cells:
+                    equation = (tuple(cells), mines)
+            old = self.equations.get(square)
+            if old == equation:
+                continue
+            if old is not None:
+                for cell in old[0]:
+                    users = self.cell_equations[cell]
+                    users.discard(square)
+                    if not users:
+                        del self.cell_equations[cell]
+                del self.equations[square]
+                self.dirty.discard(square)
+            if equation is not None:
+                self.equations[square] = equation
+                for cell in equation[0]:
+                    self.cell_equations.setdefault(cell, set()).add(square)
+                self.dirty.add(square)
+
+    def component(self, start):
+        """Number squares linked to start through shared covered cells, in the order they were reached."""
+        found = [start]
+        seen = {start}
+        for square in found:
+            for cell in self.equations[square][0]:
+                for other in sorted(self.cell_equations[cell]):
+                    if other not in seen:
+                        seen.add(other)
+                        found.append(other)
+        return found
+
+    def solve_component(self, squares):
+        """Forced values of the cells of one component as {cell: value}, or None if its equations contradict."""
+        rows = [(dict.fromkeys(self.equations[square][0], 1), self.equations[square][1]) for square in squares]
+        # Pivot along the frontier (cells in the order the numbers were reached) so little fill-in builds up
+        order = list(dict.fromkeys(cell for square in squares for cell in self.equations[square][0]))
+        known = {}
+        while True:
+            # The equations on their own settle the easy cells, so only row reduce when they have nothing to give
+            found = forced_values(rows)
+            if found == {}:
+                reduced = reduce_rows(rows, order)
+                found = None if reduced is None else forced_values(reduced)
+            if found is None:
+                return None
+            if not found:
+                return known
+            known.update(found)
+            # Put the forced values into the equations and reduce what is left
+            substituted = []
+            for coefficients, total in rows:
+                total -= sum(value * found[cell] for cell, value in coefficients.items() if cell in found)
+                coefficients = {cell: value for cell, value in coefficients.items() if cell not in found}
+                if coefficients:
+                    substituted.append((coefficients, total))
+                elif total:
+                    return None
+            rows = substituted
+            order = [cell for cell in order if cell not in found]
+
+    def deduce(self):
+        """Return (safe, mines): the covered squares the numbers force to be safe or mines. Only components
+        whose equations changed since the last call are solved again, since the others have nothing new to give.
+        A component whose numbers contradict its flags gives no deductions."""
+        self.update()
+        safe, mines = set(), set()
+        done = set()
+        for square in sorted(self.dirty):
+            if square in done:
+                continue
+            squares = self.component(square)
+            done.update(squares)
+            # Start again from the component's first square, so the pivot order (and so what is found) does not
+            # depend on which of its numbers changed
+            squares = self.component(min(squares))
+            known = self.solve_component(squares)
+            if known:
+                for cell, value in known.items():
+                    (mines if value else safe).add(cell)
+        self.dirty.clear()
+        return safe, mines
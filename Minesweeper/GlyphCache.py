@@ -0,0 +1,65 @@
+"""
+Module: GlyphCache
+Class: GlyphCache
+Description: Cache of the small surfaces the game draws over and over: rendered text (cell numbers,
+                labels, the turn indicator, the timer) and the mine and flag icons scaled to the cell size.
+                Each surface is rasterized the first time it is asked for and kept, keyed by
+                (asset, value, cell size, color), so drawing a frame is only blits. Icons are kept for
+                every cell size they were scaled to, so resizing or zooming back to a size scales nothing.
+Inputs: The fonts and images the game loaded, and (asset, value, cell size, color) keys.
+Outputs: pygame Surfaces ready to blit.
+External Sources: pygame
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import pygame as pg
+
+# Icons are drawn at this fraction of the cell size
+ICON_SCALE = 0.5
+# Most surfaces to keep. Text that keeps changing (the timer) adds a surface every time it changes,
+# so past this the oldest surfaces are dropped, and are simply rendered again if they come back.
+MAX_SURFACES = 2048
+
+class GlyphCache:
+    def __init__(self, fonts, images):
+        """fonts maps an asset name to a pygame Font used to render its text, images maps an asset name to a
+        loaded image (or None if it failed to load, in which case a square of the given color is used)."""
+        self.fonts = fonts
+        self.images = images
+        self.surfaces = {}  # (asset, value, cell_size, color) -> Surface
+        self.rendered = 0   # How many surfaces were rasterized, for comparing frame costs
+
+    def render(self, asset, value, cell_size, color):
+        """Rasterize one surface without the cache: value as text in the asset's font, or the asset's icon scaled
+        for cells of cell_size."""
+        self.rendered += 1
+        if asset in self.fonts:
+            return self.fonts[asset].render(str(value), True, color)
+        icon_size = int(cell_size * ICON_SCALE)
+        image = self.images.get(asset)
+        if image is not None:
+            return pg.transform.smoothscale(image, (icon_size, icon_size))
+        icon = pg.Surface((icon_size, icon_size))
+        icon.fill(color)
+        return icon
+
+    def get(self, asset, value, cell_size, color):
+        """The surface for the key, rasterized only if it is not cached yet."""
+        key = (asset, value, cell_size, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.render(asset, value, cell_size, color)
+            if len(self.surfaces) >= MAX_SURFACES:
+                del self.surfaces[next(iter(self.surfaces))]
+            self.surfaces[key] = surface
+        return surface
+
+    def text(self, value, color, asset="text"):
+        """Rendered text, which does not depend on the cell size."""
+        return self.get(asset, value, None, color)
+
+    def icon(self, asset, cell_size, color):
+        """An icon scaled for cells of cell_size (color is the fallback square's if the image did not load)."""
+        return self.get(asset, None, cell_size, color)
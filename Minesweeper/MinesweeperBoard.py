@@ -9,49 +9,110 @@ External Sources: None
 Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
 Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
 Created: September 19, 2025 (original prototype August 25, 2025)
-Last Modified: September 19, 2025
+Last Modified: October 17, 2026
 """
 
 import random
+from bisect import bisect_right
+from collections import deque
+from BoardFile import load_board, plane_size, save_board
+from Neighbors import get_neighbor_table
+
+# The change log keeps up to this many moves. Past that, its older half is folded into one set of cells, so a long game
+# keeps at most one set per square changed plus this many moves, and changes_since stays fast for recent versions.
+CHANGE_LOG_LIMIT = 1024
+# Moves kept for undo by default. Once twice as many have been made the older ones are dropped. Set a board's undo_limit
+# to None to keep every move, or to 0 to keep none (for simulations, which never undo)
+UNDO_LIMIT = 1000
 
 class Minesweeper:
-    def __init__(self, width, height, num_mines, mode, difficulty):
-        """Take a width, height, and mine number to create a Minesweeper game board."""
+    def __init__(self, width, height, num_mines, mode, difficulty, safe_opening=False, seed=None, rng=None, debug=False):
+        """Take a width, height, and mine number to create a Minesweeper game board.
+        safe_opening keeps the 8 neighbors of the first click free of mines as well as the click itself.
+        rng is any object with a random.Random style sample(); if it is not given, a random.Random(seed)
+        is used when a seed is given, and the global random module otherwise."""
+        if not 0 <= num_mines < width * height:
+            raise ValueError(f"Cannot place {num_mines} mines on a {width}x{height} board with a safe first square")
         self.width = width
         self.height = height
+        self.neighbor_table = get_neighbor_table(width, height)  # Shared by every board of this shape
         self.num_mines = num_mines
         self.mode = mode
         self.difficulty = difficulty
+        self.safe_opening = safe_opening
+        self.seed = seed
+        if rng is not None:
+            self.rng = rng
+        elif seed is not None:
+            self.rng = random.Random(seed)
+        else:
+            self.rng = random
         self.flags_remaining = num_mines
-        self.board = [[0 for _ in range(width)] for _ in range(height)]
-        self.revealed = [[False for _ in range(width)] for _ in range(height)]
-        self.flags = [[False for _ in range(width)] for _ in range(height)]
+        self.board, self.revealed, self.flags = self.create_grids()
         self.game_over = False
         self.mines_placed = False  # Flag to track if mines have been placed
+        self.revealed_safe_count = 0  # Number of revealed non-mine squares, kept up to date by reveal_cells
+        self.debug = debug
+        # Persistent display view, updated in place as cells change instead of being rebuilt on every call
+        self.display = self.create_display()
+        self.version = 0  # Bumped once per reveal or flag toggle that changes the board
+        self._change_log = []  # _change_log[i] holds the cells changed going from version _log_start + i to the next one
+        self._log_start = 0
+        self._folded = set()   # Every cell changed before version _log_start (the folded part of the log)
+        self._subscribers = []
+        # Move journal for undo/redo. Entries are ("reveal", cells, safe squares revealed, ended the game)
+        # or ("flag", cells) and share their cell sets with the change log, so journaling copies nothing.
+        self._journal = []
+        self._journal_start = 0  # Moves dropped from the front of the journal, so checkpoints keep counting from the start
+        self._redo = []
+        self.undo_limit = UNDO_LIMIT
+
+    def create_grids(self):
+        """Create the empty board, revealed and flag grids. Storage backends override this."""
+        board = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        revealed = [[False for _ in range(self.width)] for _ in range(self.height)]
+        flags = [[False for _ in range(self.width)] for _ in range(self.height)]
+        return board, revealed, flags
+
+    def create_display(self):
+        """Create the persistent display view. Backends that build the view on demand return None."""
+        return [["?" for _ in range(self.width)] for _ in range(self.height)]
 
     def place_mines(self, safe_x=None, safe_y=None):
         """Place mines, ensuring the first square is safe."""
-        mines = 0
-        while mines < self.num_mines:
-            # Random position, make sure valid placement
-            x = random.randint(0, self.width-1)
-            y = random.randint(0, self.height-1)
-            if self.board[y][x] != -1 and not (x == safe_x and y == safe_y):
-                self.board[y][x] = -1
-                mines += 1
+        for index in self.sample_mine_indices(safe_x, safe_y):
+            self.board[index // self.width][index % self.width] = -1
+
+    def sample_mine_indices(self, safe_x=None, safe_y=None):
+        """Pick num_mines distinct flat cell indices (y * width + x) outside the safe zone.
+        Samples without replacement, so it takes O(num_mines) time at any mine density."""
+        cells = self.width * self.height
+        excluded = []
+        if safe_x is not None and safe_y is not None:
+            excluded = [safe_y * self.width + safe_x]
+            if self.safe_opening:
+                opening = [ny * self.width + nx
+                           for ny in range(max(safe_y - 1, 0), min(safe_y + 2, self.height))
+                           for nx in range(max(safe_x - 1, 0), min(safe_x + 2, self.width))]
+                # Only protect the clicked square if the opening would leave too few cells for the mines
+                if cells - len(opening) >= self.num_mines:
+                    excluded = opening
+        # Sample positions among the allowed cells only, then map each one back to its board index.
+        # The j-th excluded index (sorted) pushes every sampled position at or past (index - j) up by one.
+        shifts = [index - j for j, index in enumerate(sorted(excluded))]
+        samples = self.rng.sample(range(cells - len(excluded)), self.num_mines)
+        return [sample + bisect_right(shifts, sample) for sample in samples]
 
     def calculate_square(self, x, y):
         """Calculate the number of adjacent mines for a given square."""
         if self.board[y][x] == -1: # Mines don't need calculation
             return
         adj = 0
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                # If not out of bounds
-                if 0 <= x + i < self.width and 0 <= y + j < self.height:
-                    # If adjacent mine then ++
-                    if self.board[y + j][x + i] == -1:
-                        adj += 1
+        # The neighbor table only lists in-bounds neighbors, so no bounds checks are needed
+        for dx, dy in self.neighbor_table.deltas_at(x, y):
+            # If adjacent mine then ++
+            if self.board[y + dy][x + dx] == -1:
+                adj += 1
         self.board[y][x] = adj
 
     def calculate_squares(self):
@@ -61,9 +122,16 @@ class Minesweeper:
                 self.calculate_square(x, y)
 
     def reveal_square(self, x, y):
-        """Reveal a square on the board. If 0 square, reveal adjacent squares."""
+        """Reveal a square on the board. If 0 square, reveal adjacent squares.
+        Returns True if a safe square was uncovered, False otherwise."""
+        newly_revealed = self.reveal_cells(x, y)
+        return bool(newly_revealed) and not self.game_over
+
+    def reveal_cells(self, x, y):
+        """Reveal a square and flood fill outward from 0 squares using a work queue.
+        Returns the set of (x, y) cells that were newly revealed by this call."""
         if self.revealed[y][x] or self.flags[y][x] or self.game_over:
-            return False
+            return set()
 
         # Place mines after first click, ensuring the first square is safe
         if not self.mines_placed:
@@ -72,21 +140,38 @@ class Minesweeper:
             self.mines_placed = True
 
         self.revealed[y][x] = True
+        newly_revealed = {(x, y)}
 
-        # Mine then lose
+        # Mine then lose. Only mines are revealed from here on, so the safe count does not change.
         if self.board[y][x] == -1:
-            self.reveal_all_mines()
+            newly_revealed |= self.reveal_all_mines()
             self.game_over = True
-            return False
+            self._record_changes(newly_revealed, ("reveal", newly_revealed, 0, True))
+            return newly_revealed
 
-        # If the square is empty (0), reveal adjacent squares
-        if self.board[y][x] == 0:
-            for i in range(-1, 2):
-                for j in range(-1, 2):
-                    if 0 <= x + i < self.width and 0 <= y + j < self.height:
-                        self.reveal_square(x + i, y + j)
+        # Cells are marked revealed as they are queued, so each cell is visited at most once.
+        # Neighbors of a 0 square are never mines, so no mine check is needed while filling.
+        board, revealed, flags = self.board, self.revealed, self.flags
+        table = self.neighbor_table
+        deltas, row_kinds, column_kinds = table.deltas, table.row_kinds, table.column_kinds
+        queue = deque()
+        if board[y][x] == 0:
+            queue.append((x, y))
+        while queue:
+            cx, cy = queue.popleft()
+            for dx, dy in deltas[row_kinds[cy] | column_kinds[cx]]:
+                nx, ny = cx + dx, cy + dy
+                if revealed[ny][nx] or flags[ny][nx]:
+                    continue
+                revealed[ny][nx] = True
+                newly_revealed.add((nx, ny))
+                if board[ny][nx] == 0:
+                    queue.append((nx, ny))
 
-        return True
+        # Everything revealed by the flood fill is safe
+        self.revealed_safe_count += len(newly_revealed)
+        self._record_changes(newly_revealed, ("reveal", newly_revealed, len(newly_revealed), False))
+        return newly_revealed
 
     def toggle_flag(self, x, y):
         """Toggle a flag on a square if flaggable."""
@@ -97,34 +182,233 @@ class Minesweeper:
         self.flags[y][x] = flag_status
 
         self.flags_remaining += -1 if flag_status else 1
+        self._record_changes({(x, y)}, ("flag", {(x, y)}))
+
+    def apply_moves(self, moves):
+        """Play a batch of ("reveal" or "flag", x, y) moves in order, such as the ones AIPlayer.plan returns.
+        Moves on squares that are no longer covered (revealed by an earlier reveal's flood fill, or flagged)
+        are skipped, and the rest of the batch is dropped once the game is over. Returns the moves played."""
+        played = []
+        for move in moves:
+            if self.game_over:
+                break
+            action, x, y = move
+            if self.is_revealed(x, y) or self.is_flagged(x, y):
+                continue
+            if action == "flag":
+                self.toggle_flag(x, y)
+            else:
+                self.reveal_square(x, y)
+            played.append(move)
+        return played
 
     def is_game_over(self):
         """True if loss, false otherwise."""
         return self.game_over
 
     def is_game_won(self):
-        """True if all non-mine squares are revealed, false otherwise."""
-        return all(self.revealed[y][x] or self.board[y][x] == -1 for y in range(self.height) for x in range(self.width))
+        """True if all non-mine squares are revealed, false otherwise. Constant time thanks to revealed_safe_count."""
+        if self.debug:
+            scanned = self.count_revealed_safe()
+            assert scanned == self.revealed_safe_count, f"revealed_safe_count is {self.revealed_safe_count} but the board has {scanned}"
+        return self.revealed_safe_count == self.width * self.height - self.num_mines
+
+    def count_revealed_safe(self):
+        """Count the revealed non-mine squares with a full scan of the board (used to check revealed_safe_count)."""
+        return sum(1 for y in range(self.height) for x in range(self.width) if self.revealed[y][x] and self.board[y][x] != -1)
 
     def get_display_board(self):
-        """Returns the current state of the board for display purposes."""
-        display_board = [[] for _ in range(self.height)]
+        """Returns the current state of the board for display purposes: the number or -1 for revealed squares,
+        "F" for flagged squares and "?" for hidden squares. This is a live view that the board updates in place,
+        so callers must not modify it and should copy it if they need the state at a fixed point in time."""
+        return self.display
+
+    def is_revealed(self, x, y):
+        """True if the square has been revealed, false otherwise."""
+        return bool(self.revealed[y][x])
+
+    def is_flagged(self, x, y):
+        """True if the square is flagged, false otherwise."""
+        return bool(self.flags[y][x])
+
+    def get_cell(self, x, y):
+        """Returns the display value of a single square in O(1)."""
+        return self.display[y][x]
+
+    def changes_since(self, version):
+        """Returns the set of (x, y) cells changed by reveals and flag toggles after the given version.
+        For a version older than the log keeps (see CHANGE_LOG_LIMIT) the set also has cells changed before it,
+        so callers should read the current state of every cell returned."""
+        if version < self._log_start:
+            changed = set(self._folded)
+            version = self._log_start
+        else:
+            changed = set()
+        for cells in self._change_log[version - self._log_start:]:
+            changed |= cells
+        return changed
+
+    def subscribe(self, callback):
+        """Call callback(cells, version) with the set of changed cells every time the board changes."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop sending board changes to a callback registered with subscribe."""
+        self._subscribers.remove(callback)
+
+    def undo(self):
+        """Undo the last reveal (with its whole flood fill or loss) or flag toggle in O(cells changed).
+        Returns (a copy of) the cells it changed, or an empty set if there is nothing to undo.
+        Mines stay where the first click put them, even if that click is undone."""
+        if not self._journal:
+            return set()
+        entry = self._journal.pop()
+        self._apply_entry(entry, forward=False)
+        self._redo.append(entry)
+        return set(entry[1])
+
+    def redo(self):
+        """Redo the last undone move. Returns (a copy of) the cells it changed, or an empty set if there is nothing
+        to redo."""
+        if not self._redo:
+            return set()
+        entry = self._redo.pop()
+        self._apply_entry(entry, forward=True)
+        self._journal.append(entry)
+        return set(entry[1])
+
+    def checkpoint(self):
+        """Return a token for the current position that rollback can return to."""
+        return self._journal_start + len(self._journal)
+
+    def rollback(self, checkpoint):
+        """Undo every move made since checkpoint was taken. Returns the set of cells that changed.
+        Raises ValueError if moves since then were dropped from the journal (see undo_limit)."""
+        if checkpoint < self._journal_start:
+            raise ValueError("The moves since this checkpoint are no longer in the undo journal")
+        changed = set()
+        while self.checkpoint() > checkpoint:
+            changed |= self.undo()
+        return changed
+
+    def _apply_entry(self, entry, forward):
+        """Replay a journal entry forwards (redo) or backwards (undo)."""
+        kind, cells = entry[0], entry[1]
+        if kind == "reveal":
+            _, _, safe_revealed, ended_game = entry
+            self._set_revealed(cells, forward)
+            self.revealed_safe_count += safe_revealed if forward else -safe_revealed
+            if ended_game:
+                self.game_over = forward
+        else:
+            # A flag toggle is its own inverse
+            (x, y), = cells
+            flag_status = not self.is_flagged(x, y)
+            self._set_flag(x, y, flag_status)
+            self.flags_remaining += -1 if flag_status else 1
+        self._record_changes(cells)
+
+    def _set_revealed(self, cells, value):
+        """Set or clear the revealed state of the given cells. Storage backends override this."""
+        for x, y in cells:
+            self.revealed[y][x] = value
+
+    def _set_flag(self, x, y, value):
+        """Set or clear the flag on one cell. Storage backends override this."""
+        self.flags[y][x] = value
+
+    def _record_changes(self, cells, journal_entry=None):
+        """Copy changed cells into the display view, log them under a new version and notify subscribers.
+        A new move passes its journal_entry, which is kept for undo and drops anything left to redo."""
+        if not cells:
+            return
+        if journal_entry is not None:
+            self._redo.clear()
+        if journal_entry is not None and self.undo_limit == 0:
+            self._journal_start += 1  # Counted for checkpoints, but not kept
+        elif journal_entry is not None:
+            self._journal.append(journal_entry)
+            if self.undo_limit is not None and len(self._journal) > 2 * self.undo_limit:
+                # Drop the oldest moves in one go, so trimming costs O(1) per move
+                dropped = len(self._journal) - self.undo_limit
+                del self._journal[:dropped]
+                self._journal_start += dropped
+        self._refresh_display(cells)
+        self._change_log.append(cells)
+        if len(self._change_log) > CHANGE_LOG_LIMIT:
+            folded = CHANGE_LOG_LIMIT // 2
+            for old_cells in self._change_log[:folded]:
+                self._folded |= old_cells
+            del self._change_log[:folded]
+            self._log_start += folded
+        self.version += 1
+        for callback in self._subscribers:
+            callback(cells, self.version)
+
+    def _refresh_display(self, cells):
+        """Copy the given cells from the grids into the display view (if this backend keeps one)."""
+        if self.display is None:
+            return
+        display, board, revealed, flags = self.display, self.board, self.revealed, self.flags
+        for x, y in cells:
+            if revealed[y][x]:
+                display[y][x] = int(board[y][x]) # Revealed, number or mine
+            elif flags[y][x]:
+                display[y][x] = "F" # Flagged
+            else:
+                display[y][x] = "?" # Hidden
+
+    def save(self, path):
+        """Save the board to a binary board file (the format is described in BoardFile)."""
+        save_board(self, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a board file into a board of this class, whichever backend saved it."""
+        return load_board(path, cls)
+
+    def to_planes(self):
+        """Return the mine, revealed and flag bit planes in the BoardFile layout (bit y * (width + 1) + x)."""
+        stride = self.width + 1
+        mines, revealed, flags = (bytearray(plane_size(self.width, self.height)) for _ in range(3))
         for y in range(self.height):
             for x in range(self.width):
+                bit = y * stride + x
+                byte, mask = bit >> 3, 1 << (bit & 7)
+                if self.board[y][x] == -1:
+                    mines[byte] |= mask
                 if self.revealed[y][x]:
-                    display_board[y].append(self.board[y][x]) # Revealed, number or mine
-                elif self.flags[y][x]:
-                    display_board[y].append("F") # Flagged
-                else:
-                    display_board[y].append("?") # Hidden
-        return display_board
+                    revealed[byte] |= mask
+                if self.flags[y][x]:
+                    flags[byte] |= mask
+        return mines, revealed, flags
+
+    def load_planes(self, mines, revealed, flags):
+        """Restore the grids from bit planes in the BoardFile layout and rebuild the derived state."""
+        stride = self.width + 1
+        shown = []
+        for y in range(self.height):
+            for x in range(self.width):
+                bit = y * stride + x
+                byte, mask = bit >> 3, 1 << (bit & 7)
+                self.board[y][x] = -1 if mines[byte] & mask else 0
+                self.revealed[y][x] = bool(revealed[byte] & mask)
+                self.flags[y][x] = bool(flags[byte] & mask)
+                if self.revealed[y][x] or self.flags[y][x]:
+                    shown.append((x, y))
+        self.calculate_squares()
+        self.revealed_safe_count = self.count_revealed_safe()
+        self._refresh_display(shown)
 
     #iterates through the board and reveals all squares with mines
     def reveal_all_mines(self):
-        """Reveal all mines on the board."""
+        """Reveal all mines on the board. Returns the set of mine cells that were newly revealed."""
+        newly_revealed = set()
         for y in range(self.height):
             for x in range(self.width):
-                if self.board[y][x] == -1:
+                if self.board[y][x] == -1 and not self.revealed[y][x]:
                     self.revealed[y][x] = True
+                    newly_revealed.add((x, y))
+        return newly_revealed
 
 
@@ -1,6 +1,7 @@
 """
 Module: MinesweeperGame
-Class: Game
+Classes: Button, BoardRenderer, Game
+Functions: column_label, text_widget, button_widget, wait_for_events
 Description: Organizes and runs the Minesweeper game using Pygame.
             Title screen, gameplay loop, rendering, and input handling.
 Inputs: User interaction via GUI.
@@ -9,18 +10,39 @@ External Sources: None
 Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
 Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
 Created: September 19, 2025 (original prototype August 25, 2025)
-Last Modified: September 19, 2025
+Last Modified: October 17, 2026
 """
 
+import math
 import os
 import pygame as pg
 import pygame_textinput as textinput
 from MinesweeperBoard import Minesweeper
+from ChunkedBoard import ChunkedMinesweeper
 from AIPlayer import AIPlayer
+from AIWorker import AIWorker
+from GlyphCache import GlyphCache
+from Resources import Resources
+from Viewport import Viewport
 
-# Board layout (fixed 10x10)
+# Board layout (10x10 unless another size is given on the command line, see PlayMinesweeper.py)
 BOARD_WIDTH = 10
 BOARD_HEIGHT = 10
+# Boards with more squares than this only generate the parts that get played (see ChunkedBoard.py)
+CHUNKED_SQUARES = 250000
+# The mine count can be 10% to 20% of the squares (10-20 on the 10x10 board)
+MINE_FRACTIONS = (0.1, 0.2)
+
+# Viewport controls: the mouse wheel zooms by ZOOM_STEP, arrow keys pan by PAN_STEP of the view, the middle button drags
+ZOOM_STEP = 1.25
+PAN_STEP = 0.25
+# Drawing: cells smaller than MIN_GLYPH_CELL pixels get no numbers or icons, and labels are spaced at least this far apart
+MIN_GLYPH_CELL = 16
+COLUMN_LABEL_SPACING = 40
+ROW_LABEL_SPACING = 24
+
+# Event the AI worker posts when it has chosen a move, to wake the game loop up
+AI_MOVE_READY = pg.USEREVENT
 
 # Window size limit
 MIN_WINDOW = (550, 550)
@@ -30,7 +52,15 @@ BASE_DIR = os.path.dirname(__file__)
 FLAG_PATH = os.path.join(BASE_DIR, "Assets", "flag.png")
 MINE_PATH = os.path.join(BASE_DIR, "Assets", "skull.png")
 CURSOR_PATH = os.path.join(BASE_DIR, "Assets", "cursor.png")
-FONT_PATH = os.path.join(BASE_DIR, "Assets", "pixelfont.ttf")
+FONT_PATH = os.path.join(BASE_DIR, "Assets", "pixelFont.ttf")
+
+# Font sizes in points
+TEXT_FONT_SIZE = 24
+TITLE_FONT_SIZE = 30
+BUTTON_FONT_SIZE = 20
+
+# Fonts and images are loaded from disk once and shared by the game and its buttons (see Resources.py)
+RESOURCES = Resources()
 
 # Colors (RGB)
 WHITE = (255, 255, 255)
@@ -45,17 +75,25 @@ TITLE_TEXT = (240, 228, 220)
 GENERAL_TEXT = (176, 196, 177)
 TRANSPARENT_RED = (255, 155, 155, 180)
 TRANSPARENT_GREEN = (155, 255, 155, 200)
+HIGHLIGHT_COLOR = (0, 0, 0)  # Gold for AI highlight
 
 # Maintenance Note: Added Button class for mode selection and difficulty selection buttons
 # This class makes a button in pygame that will automatically trigger an event if it is clicked on, and will change colors when hovered over.
+# Buttons are made once and moved with place() when the window is resized. Their font comes from the shared RESOURCES,
+# and their label is rendered once, so drawing a button is a rectangle and a blit.
 class Button:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color):
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color, font=None):
         self.rect = pg.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.font = pg.font.Font(FONT_PATH, 20) # You can load a custom font here
+        self.font = font or RESOURCES.font(FONT_PATH, BUTTON_FONT_SIZE)
+        self.label = self.font.render(self.text, True, self.text_color)
+
+    def place(self, x, y, width, height):
+        """Move the button, for a new window size."""
+        self.rect.update(x, y, width, height)
 
     def draw(self, surface):
         # Change color on hover
@@ -64,10 +102,8 @@ class Button:
         else:
             pg.draw.rect(surface, self.color, self.rect)
 
-        # Render text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        # Draw the label
+        surface.blit(self.label, self.label.get_rect(center=self.rect.center))
 
     def handle_event(self, event):
         if event.type == pg.MOUSEBUTTONDOWN:
@@ -75,10 +111,227 @@ class Button:
                 return True # Button was clicked
         return False
 
+# Maintenance Note: the game screen used to be cleared and drawn again in full 60 times a second.
+# This class keeps everything but the cursor on an off-screen surface (the scene) and each frame only redraws the cells
+# the board reports as changed, the AI highlight when it moves, and the text or buttons whose content changed, then
+# pushes just those rectangles to the window. The whole scene is only drawn again on a resize, a new board, or when
+# the end of game overlay appears.
+class BoardRenderer:
+    def __init__(self, glyphs):
+        self.glyphs = glyphs      # Rendered text and icons (see GlyphCache.py)
+        self.scene = None         # Everything drawn so far except the cursor, the size of the window
+        self.board = None         # Board, board version, layout, highlight and overlay the scene shows
+        self.version = None
+        self.layout = None
+        self.board_area = None    # Part of the scene the grid and its labels cover
+        self.highlight = None
+        self.overlay_key = None
+        self.widgets = {}         # name -> (key, rect) of every widget in the scene
+        self.cursor_rect = None   # Where the cursor was drawn on the window, or None
+
+    def invalidate(self):
+        """Draw the whole scene again on the next frame."""
+        self.scene = None
+
+    def draw_cell(self, surface, value, rect, highlighted=False):
+        """Draw one cell showing value (a display value) into rect."""
+        glyphs = self.glyphs
+        if value == -1:
+            color = MINE_RED
+            icon = glyphs.icon("mine", rect.width, MINE_RED)
+        elif value == 0:
+            color = REVEALED_EMPTY
+            icon = glyphs.text(0, WHITE)
+        elif value == "?":
+            color = HIDDEN
+            icon = None
+        elif value == "F":
+            color = HIDDEN
+            icon = glyphs.icon("flag", rect.width, BLACK)
+        else:
+            color = REVEALED_NUMBER
+            icon = glyphs.text(value, WHITE)
+        pg.draw.rect(surface, color, rect)
+        pg.draw.rect(surface, GRID_LINE, rect, 1)
+        # Zoomed far out the numbers and icons don't fit in the cells, so the colors have to do
+        if icon is not None and rect.width >= MIN_GLYPH_CELL:
+            surface.blit(icon, icon.get_rect(center=rect.center))
+        # Highlight AI cell
+        if highlighted:
+            pg.draw.rect(surface, HIGHLIGHT_COLOR, rect, max(1, min(4, rect.width // 8)))
+
+    def draw_board(self, surface, board, viewport, ai_highlight_cell=None):
+        """Draw the visible cells of the board and their row and column labels. Only what the viewport shows is
+        drawn, so this costs the same on any size of board. Returns the rectangle covering the grid and labels."""
+        glyphs = self.glyphs
+        get_cell = board.get_cell
+        cell_size = viewport.cell_size
+        first_col, last_col, first_row, last_row = viewport.visible()
+        grid = pg.Rect(viewport.grid_rect())
+        surface.set_clip(grid)
+        for y in range(first_row, last_row):
+            for x in range(first_col, last_col):
+                self.draw_cell(surface, get_cell(x, y), pg.Rect(viewport.cell_rect(x, y)), ai_highlight_cell == (x, y))
+
+        # Labels go next to the grid, or next to the edge of the view when the grid runs past it. Small cells only get
+        # every few labels, so they don't run into each other.
+        label_x, label_y = grid.left, grid.top
+        # Column labels A, B, ... (top)
+        col_step = math.ceil(COLUMN_LABEL_SPACING / cell_size)
+        col_strip = pg.Rect(grid.left, label_y - 40, grid.width, 40)
+        surface.set_clip(col_strip)
+        for col_index in range(first_col - first_col % col_step, last_col, col_step):
+            text_surface = glyphs.text(column_label(col_index), GENERAL_TEXT)
+            text_rect = text_surface.get_rect(center=(
+                viewport.x0 + col_index * cell_size + cell_size // 2,
+                label_y - 20
+            ))
+            surface.blit(text_surface, text_rect)
+
+        # Row labels 1, 2, ... (left)
+        row_step = math.ceil(ROW_LABEL_SPACING / cell_size)
+        row_strip = pg.Rect(0, grid.top, label_x, grid.height)
+        surface.set_clip(row_strip)
+        for row_index in range(first_row - first_row % row_step, last_row, row_step):
+            text_surface = glyphs.text(row_index + 1, GENERAL_TEXT)
+            text_rect = text_surface.get_rect(center=(
+                label_x - 20,
+                viewport.y0 + row_index * cell_size + cell_size // 2
+            ))
+            # Long row numbers are right aligned so they don't run into the grid
+            text_rect.right = min(text_rect.right, label_x)
+            surface.blit(text_surface, text_rect)
+        surface.set_clip(None)
+        return grid.union(col_strip).union(row_strip)
+
+    def draw_frame(self, screen, board, viewport, ai_highlight_cell, widgets, overlay=None, cursor=None):
+        """Bring the scene up to date and show what changed in the window. Returns the rectangles that were updated.
+        viewport says where the board goes (see Viewport.py). widgets maps a name to (key, rect, draw) for everything
+        drawn on the background around the grid, in drawing order: draw(surface) draws it inside rect, and it is only
+        drawn again when its key changes. overlay is (key, draw) for something drawn over the board, or None. cursor
+        is (image, position) or None."""
+        layout = viewport.key()
+        overlay_key = overlay[0] if overlay is not None else None
+        full = (self.scene is None or self.scene.get_size() != screen.get_size() or board is not self.board
+                or layout != self.layout or overlay_key != self.overlay_key)
+        dirty = []
+        if not full:
+            cells = board.changes_since(self.version)
+            if ai_highlight_cell != self.highlight:
+                cells |= {self.highlight, ai_highlight_cell} - {None}
+            first_col, last_col, first_row, last_row = viewport.visible()
+            # The overlay covers part of the board, so a cell can't be drawn again without drawing it again too.
+            # And when more cells changed than are on screen (a big flood fill) drawing the screen is cheaper.
+            full = bool(cells) and (overlay is not None or len(cells) > (last_col - first_col) * (last_row - first_row))
+        if not full:
+            scene = self.scene
+            get_cell = board.get_cell
+            grid = pg.Rect(viewport.grid_rect())
+            scene.set_clip(grid)
+            for x, y in cells:
+                if first_col <= x < last_col and first_row <= y < last_row:
+                    cell_rect = pg.Rect(viewport.cell_rect(x, y))
+                    self.draw_cell(scene, get_cell(x, y), cell_rect, ai_highlight_cell == (x, y))
+                    dirty.append(cell_rect.clip(grid))
+            scene.set_clip(None)
+            # Clear the old spot of every widget that changed and draw it again. A widget that overlaps one of those
+            # has to be cleared and drawn again as well, or it would end up drawn twice or under the other one.
+            old = self.widgets
+            changed = {name for name, (key, _, _) in widgets.items() if name not in old or old[name][0] != key}
+            gone = [old[name][1] for name in old if name not in widgets]
+            while True:
+                areas = gone + [old[name][1] for name in changed if name in old] + [widgets[name][1] for name in changed]
+                overlapping = {name for name, (_, rect, _) in widgets.items()
+                               if name not in changed and rect.collidelist(areas) != -1}
+                if not overlapping:
+                    break
+                changed |= overlapping
+            erased = gone + [old[name][1] for name in changed if name in old]
+            if self.board_area.collidelist(erased) != -1:
+                full = True  # Too close to the board (or its labels) to just clear with the background
+            else:
+                for rect in erased:
+                    scene.fill(BACKGROUND, rect)
+                for name, (key, rect, draw) in widgets.items():
+                    if name in changed:
+                        draw(scene)
+                        dirty.append(rect)
+                dirty += erased
+        if full:
+            if self.scene is None or self.scene.get_size() != screen.get_size():
+                self.scene = screen.copy()
+            scene = self.scene
+            scene.fill(BACKGROUND)
+            self.board_area = self.draw_board(scene, board, viewport, ai_highlight_cell)
+            for key, rect, draw in widgets.values():
+                draw(scene)
+            if overlay is not None:
+                overlay[1](scene)
+            dirty = [scene.get_rect()]
+        self.board, self.version, self.layout = board, board.version, layout
+        self.highlight, self.overlay_key = ai_highlight_cell, overlay_key
+        self.widgets = {name: (key, rect) for name, (key, rect, _) in widgets.items()}
+
+        # The cursor is only ever on the window: take the old one away and draw it where the mouse is now
+        cursor_rect = None
+        if cursor is not None:
+            image, position = cursor
+            cursor_rect = image.get_rect(topleft=position)
+        if cursor_rect != self.cursor_rect or (cursor_rect is not None and cursor_rect.collidelist(dirty) != -1):
+            dirty += [rect for rect in (self.cursor_rect, cursor_rect) if rect is not None]
+        for rect in dirty:
+            screen.blit(self.scene, rect, rect)
+        if cursor_rect is not None:
+            screen.blit(image, cursor_rect)
+        self.cursor_rect = cursor_rect
+        if dirty:
+            pg.display.update(dirty)
+        return dirty
+
+def column_label(index):
+    """Spreadsheet style letters for a column: A to Z, then AA, AB, ..."""
+    label = ""
+    index += 1
+    while index:
+        index, letter = divmod(index - 1, 26)
+        label = chr(ord("A") + letter) + label
+    return label
+
+def text_widget(surface, rect):
+    """A widget for BoardRenderer.draw_frame that shows a rendered piece of text in rect."""
+    return (surface, tuple(rect)), rect, lambda target: target.blit(surface, rect)
+
+def button_widget(button):
+    """A widget for BoardRenderer.draw_frame that shows a Button, drawn again when the mouse moves on or off it."""
+    # The renderer keeps the rect to erase it later, so it gets a copy that place() won't move
+    return (tuple(button.rect), button.rect.collidepoint(pg.mouse.get_pos())), button.rect.copy(), button.draw
+
+def wait_for_events(deadline=None):
+    """Sleep until an event arrives or until pg.time.get_ticks() reaches deadline (only an event, if it is None).
+    Returns the events that arrived, or an empty list if the deadline came first."""
+    if deadline is None:
+        event = pg.event.wait()
+    else:
+        timeout = deadline - pg.time.get_ticks()
+        if timeout <= 0:
+            return pg.event.get()
+        event = pg.event.wait(timeout)
+    if event.type == pg.NOEVENT:
+        return []
+    return [event] + pg.event.get()
+
 class Game:
-    def __init__(self):
-        """Initialize the game."""
+    def __init__(self, width=BOARD_WIDTH, height=BOARD_HEIGHT, debug=False):
+        """Initialize the game, for boards of width x height squares. With debug, how long the AI thought and the
+        frame times meanwhile are printed after every AI move."""
+        self.board_width = width
+        self.board_height = height
+        self.debug = debug
         self.minesweeper = None
+        self.viewport = None     # Part of the board on screen, see Viewport.py
+        self.ai_player = None    # Lives as long as the board, so the AI keeps what it has worked out between turns
+        self.ai_worker = AIWorker(notify=self._wake_for_ai_move)  # Chooses the AI's moves on a background thread so the window never freezes
+        self.ai_moves = []       # Moves the AI planned in Auto mode and hasn't played yet, the next one last
         self.quit = False
         self.start_ticks = None  # Set when the game actually starts
         self.end_time = None     # Frozen final time
@@ -86,11 +339,19 @@ class Game:
         self.cursor_img = None   
         self.flag_img = None    
         self.mine_img = None     
+        self.glyphs = None       # Rendered text and scaled icons, made once per cell size (see GlyphCache.py)
         pg.init()
 
     def start_game(self, width: int, height: int, num_mines: int, mode: str, difficulty: str):
         """Start a new minesweeper board with given width, height, and num_mines."""
-        self.minesweeper = Minesweeper(width, height, num_mines, mode, difficulty)
+        # A move the AI is still working out was for the old board, so throw it away
+        self.ai_worker.cancel()
+        self.ai_moves = []
+        board_class = ChunkedMinesweeper if width * height > CHUNKED_SQUARES else Minesweeper
+        self.minesweeper = board_class(width, height, num_mines, mode, difficulty)
+        self.viewport = Viewport(width, height)
+        # A new board needs a new AI: everything the old one remembered was about the old board
+        self.ai_player = AIPlayer(self.minesweeper, difficulty) if mode in ("Interactive", "Auto") else None
         self.start_ticks = pg.time.get_ticks()  # milliseconds since pg.init()
         self.end_time = None
         self.last_config = {           
@@ -111,24 +372,50 @@ class Game:
         return "human", None
 
 
+    def _play_planned_move(self):
+        """Play the next of the AI's planned moves that can still be played. Returns its (x, y), or None once
+        there are none left."""
+        while self.ai_moves:
+            move = self.ai_moves.pop()
+            if self.minesweeper.apply_moves([move]):
+                return move[1:]
+        return None
+
+    def _wake_for_ai_move(self):
+        """Called on the AI worker's thread once a move is chosen. Posts AI_MOVE_READY so the waiting game loop wakes up."""
+        try:
+            pg.event.post(pg.event.Event(AI_MOVE_READY))
+        except pg.error:
+            pass  # The game already quit
+
     def exit_game(self):
         """Perform any game cleanup here (if needed), then quit()."""
+        self.ai_worker.shutdown()
         pg.mouse.set_visible(True)
         pg.quit()
 
-    def play_minesweeper():
-        """Static method to play Minesweeper."""
-        game = Game()
+    def play_minesweeper(width=BOARD_WIDTH, height=BOARD_HEIGHT, debug=False):
+        """Static method to play Minesweeper on a width x height board."""
+        game = Game(width, height, debug)
         game.run()
 
-    def mouse_to_grid(self, mx: int, my: int, grid_x0, grid_y0, cell_size, grid_width, grid_height):
-        """Convert mouse pixel coordinates (mx, my) to grid coordinates (gx, gy), or None if click outside of board"""
-        if not (grid_x0 <= mx < grid_x0 + cell_size * grid_width # within grid x
-                and grid_y0 <= my < grid_y0 + cell_size * grid_height): # within grid y
-            return None # Clicked outside grid area
-        gx = (mx - grid_x0) // cell_size
-        gy = (my - grid_y0) // cell_size
-        return int(gx), int(gy)
+    def mine_range(self):
+        """Smallest and largest mine counts the title screen accepts for the board size."""
+        squares = self.board_width * self.board_height
+        return max(1, round(squares * MINE_FRACTIONS[0])), min(squares - 1, round(squares * MINE_FRACTIONS[1]))
+
+    def mouse_to_grid(self, mx: int, my: int, viewport):
+        """Convert mouse pixel coordinates (mx, my) to grid coordinates (gx, gy), or None if click outside of board
+        (or on a part of it scrolled out of view)"""
+        return viewport.cell_at(mx, my)
+
+    def _draw_end_overlay(self, surface, color, band_offset, text):
+        """Draw the see-through band with the end of game text across the middle of surface."""
+        win_width, win_height = surface.get_size()
+        overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
+        overlay.fill(color, (0, win_height // 2 - band_offset, win_width, 60))
+        surface.blit(overlay, (0, 0))
+        surface.blit(text, text.get_rect(center=(win_width // 2, win_height // 2 - 15)))
 
     def _clamp_size(self, w, h):
         """Clamp window size to minimum dimensions."""
@@ -142,7 +429,6 @@ class Game:
         """Main game loop. Title screen followed by game."""
         screen = pg.display.set_mode((600, 600), pg.RESIZABLE)
         clock = pg.time.Clock()
-        HIGHLIGHT_COLOR = (0, 0, 0)  # Gold for AI highlight
         highlight_duration = 500  # ms
         ai_highlight_cell = None
         ai_highlight_time = None
@@ -154,45 +440,48 @@ class Game:
             timeAICanMove = pg.time.get_ticks() + AI_DELAY
 
 
-        # Load assets, with defaults if loading fails
-        try:
-            font = pg.font.Font(FONT_PATH, 24)
-            title_font = pg.font.Font(FONT_PATH, 30)
-        except Exception as e:
-            print("Custom font failed to load:", e)
-            font = pg.font.SysFont(None, 24)
-            title_font = pg.font.SysFont(None, 30)
-        try:
-            self.cursor_img = pg.image.load(CURSOR_PATH).convert_alpha()
-            pg.mouse.set_visible(False) # Hide system cursor, use custom
-        except Exception as e:
-            print("Cursor image failed to load:", e)
-            self.cursor_img = None
-            pg.mouse.set_visible(True) # Show system cursor if custom fails
-        try:
-            self.flag_img = pg.image.load(FLAG_PATH).convert_alpha()
-        except Exception as e:
-            print("Flag image failed to load:", e)
-            self.flag_img = None
-        try:
-            self.mine_img = pg.image.load(MINE_PATH).convert_alpha()
-        except Exception as e:
-            print("Mine image failed to load:", e)
-            self.mine_img = None
+        # Load assets, with defaults if loading fails. They come from the shared RESOURCES, so each file is read once.
+        font = RESOURCES.font(FONT_PATH, TEXT_FONT_SIZE)
+        title_font = RESOURCES.font(FONT_PATH, TITLE_FONT_SIZE)
+        self.cursor_img = RESOURCES.image(CURSOR_PATH)
+        pg.mouse.set_visible(self.cursor_img is None) # Hide system cursor and use the custom one, unless it failed to load
+        self.flag_img = RESOURCES.image(FLAG_PATH)
+        self.mine_img = RESOURCES.image(MINE_PATH)
+        # Every piece of text and every icon is drawn from here, so it is only rasterized again after a resize
+        self.glyphs = GlyphCache({"text": font, "title": title_font}, {"mine": self.mine_img, "flag": self.flag_img})
+        glyphs = self.glyphs
+        renderer = BoardRenderer(glyphs)
 
 
-        # Cap mines at 20 as per requirements. Validator restricts input to 2 digits, 0-20
-        mines_input = textinput.TextInputVisualizer(manager=textinput.TextInputManager(validator=lambda x: (x.isdigit() and int(x) <= 20 and len(x) < 3) or x == ''),
+        # Cap mines at 20 as per requirements (20% of the squares on other board sizes). Validator restricts input to 0-20
+        min_mines, max_mines = self.mine_range()
+        mines_input = textinput.TextInputVisualizer(manager=textinput.TextInputManager(validator=lambda x: (x.isdigit() and int(x) <= max_mines and len(x) <= len(str(max_mines))) or x == ''),
                                                     font_object=font,
                                                     font_color=WHITE,
                                                     cursor_color=WHITE
                                                     )
         mode = None  # Game mode selected by player. Either "Auto", "Interactive", or "Solo"
-        difficulty = None  # Difficulty selected by player. Either "Easy", "Medium", or "Hard"
+        difficulty = None  # Difficulty selected by player. Either "Easy", "Medium", "Hard", or "Expert"
         turn = "human"  # Track whose turn it is, either "human" or "AI"
+        timeAICanMove = None  # pg.time.get_ticks() at which the AI may move, while it is its turn
         AI_DELAY = 1000  # milliseconds delay for AI moves
 
-        # Title screen loop
+        # Buttons for each mode and each difficulty. They are made once, and placed again when the window size changes.
+        button_color = (170, 147, 204)
+        button_hover_color = (131, 106, 168)
+        text_color = (255, 255, 255)
+        # The AI reads the whole board to start with, which takes seconds per move on a board big enough to be chunked,
+        # so those boards can only be played Solo
+        modes = ("Auto", "Interactive", "Solo") if self.board_width * self.board_height <= CHUNKED_SQUARES else ("Solo",)
+        mode_buttons = {name: Button(0, 0, 0, 50, name, button_color, button_hover_color, text_color)
+                        for name in modes}
+        difficulty_buttons = {name: Button(0, 0, 0, 50, name, button_color, button_hover_color, text_color)
+                              for name in ("Easy", "Medium", "Hard", "Expert")}
+        buttons_size = None  # Window size the buttons were placed for
+        events = []
+
+        # Title screen loop. Like the other loops it sleeps between frames until there are events, only waking up on
+        # its own to blink the text cursor.
         while not self.minesweeper and not self.quit:
             screen.fill(BACKGROUND)
             pg.display.set_caption("Minesweeper -- Title Screen")
@@ -206,104 +495,44 @@ class Game:
             hint_margin = text_input_margin + h*0.1
 
             # Render title text centered at top
-            title_text = title_font.render("Welcome to Minesweeper", True, TITLE_TEXT)
+            title_text = glyphs.text("Welcome to Minesweeper", TITLE_TEXT, "title")
             title_text_rect = title_text.get_rect(center=(x_center, title_margin))
             screen.blit(title_text, title_text_rect)
 
             # Render text centered below title
-            mines_text = font.render("Enter Mine Count (10-20): ", True, GENERAL_TEXT)
+            mines_text = glyphs.text(f"Enter Mine Count ({min_mines}-{max_mines}): ", GENERAL_TEXT)
             mines_text_rect = mines_text.get_rect(center=(x_center, mine_text_margin))
             screen.blit(mines_text, mines_text_rect)
 
-            # Create buttons for each mode
-            # Define colors
-            button_color = (170, 147, 204)
-            button_hover_color = (131, 106, 168)
-            text_color = (255, 255, 255)
-
-            # The row of buttons should be underneath the rest of the text
+            # The rows of buttons should be underneath the rest of the text
             row_of_modes_y = hint_margin + h*0.1 
-
-            # Create buttons for each mode
-            def drawModeButtons(selected_mode = None):
-                current_button_color = button_color
-                if selected_mode == "Auto":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                auto_button = Button(0, row_of_modes_y, int(w//3), 50, "Auto", current_button_color, button_hover_color, text_color)
-                # Reset to original color
-                current_button_color = button_color
-
-                if selected_mode == "Interactive":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                interactive_button = Button(int(w//3), row_of_modes_y, int(w//3), 50, "Interactive", current_button_color, button_hover_color, text_color)
-                # Reset to original color
-                current_button_color = button_color
-
-                if selected_mode == "Solo":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                solo_button = Button(2 * int(w//3), row_of_modes_y, int(w//3), 50, "Solo", current_button_color, button_hover_color, text_color)
-
-                auto_button.draw(screen) # Draw the button
-                interactive_button.draw(screen) # Draw the button
-                solo_button.draw(screen) # Draw the button
-
-                # Return callbacks to the buttons so their events can be handled
-                return auto_button, interactive_button, solo_button 
-            
-            # Make sure the buttons are defined here, not just drawn, so events can be handled.
-            auto_button, interactive_button, solo_button = drawModeButtons(mode)
-
-            # Create buttons for each difficulty (Easy/Medium/Hard)
-            # The row of buttons should be underneath the rest of the text
             row_of_difficulties_y = row_of_modes_y + h*0.1 
-
-            def drawDifficultyButtons(selected_difficulty = None):
-                current_button_color = button_color
-                if selected_difficulty == "Easy":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                easy_button = Button(0, row_of_difficulties_y, int(w//3), 50, "Easy", current_button_color, button_hover_color, text_color)
-                # Reset to original color
-                current_button_color = button_color
-
-                if selected_difficulty == "Medium":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                medium_button = Button(int(w//3), row_of_difficulties_y, int(w//3), 50, "Medium", current_button_color, button_hover_color, text_color)
-                # Reset to original color
-                current_button_color = button_color
-
-                if selected_difficulty == "Hard":
-                    # Color it with the hover color because it is selected
-                    current_button_color = button_hover_color
-                hard_button = Button(2 * int(w//3), row_of_difficulties_y, int(w//3), 50, "Hard", current_button_color, button_hover_color, text_color)
-
-                easy_button.draw(screen) # Draw the button
-                medium_button.draw(screen) # Draw the button
-                hard_button.draw(screen) # Draw the button
-
-                # Return callbacks to the buttons so their events can be handled
-                return easy_button, medium_button, hard_button 
-            
+            if buttons_size != (w, h):
+                buttons_size = (w, h)
+                modes_x = (w - len(mode_buttons) * int(w//3)) // 2  # Centered, for when only Solo is offered
+                for i, button in enumerate(mode_buttons.values()):
+                    button.place(modes_x + i * int(w//3), row_of_modes_y, int(w//3), 50)
+                for i, button in enumerate(difficulty_buttons.values()):
+                    button.place(i * int(w//4), row_of_difficulties_y, int(w//4), 50)
+
+            # Draw the mode buttons, the selected one in the hover color
+            for name, button in mode_buttons.items():
+                button.color = button_hover_color if name == mode else button_color
+                button.draw(screen)
             # Only draw the difficulty buttons if AI will be playing (which is only when on Interactive or Auto mode)
             if mode == "Interactive" or mode == "Auto":
-                # Make sure the buttons are defined here, not just drawn, so events can be handled.
-                easy_button, medium_button, hard_button = drawDifficultyButtons(difficulty)
-            else:
-                easy_button = medium_button = hard_button = None
-            
+                for name, button in difficulty_buttons.items():
+                    button.color = button_hover_color if name == difficulty else button_color
+                    button.draw(screen)
 
             # Updates mine and render mine-count input field
-            events = pg.event.get()
+            events += pg.event.get()
             mines_input.update(events)
             mines_input_rect = mines_input.surface.get_rect(center=(x_center, text_input_margin))
             screen.blit(mines_input.surface, mines_input_rect)
 
             # Render hint text
-            hint_text = font.render("Press Enter to Start", True, (GENERAL_TEXT))
+            hint_text = glyphs.text("Press Enter to Start", GENERAL_TEXT)
             hint_text_rect = hint_text.get_rect(center=(x_center, hint_margin))
             screen.blit(hint_text, hint_text_rect)
 
@@ -318,12 +547,12 @@ class Game:
                     if (new_w, new_h) != (cur_w, cur_h):
                         screen = pg.display.set_mode((new_w, new_h), pg.RESIZABLE)
                 elif event.type == pg.KEYDOWN and event.key == pg.K_RETURN: # Return/enter key
-                    # Start game if mine count provided, mine count is within 10-20 range
+                    # Start game if mine count provided, mine count is within 10-20 range (min_mines-max_mines)
                     # Maintenance Note: added check to ensure that the mode and difficulty are selected before starting the game
-                    if (mines_input.value and 10 <= int(mines_input.value) <= 20 and mode in ["Auto", "Interactive", "Solo"]):
-                        if ((mode == "Interactive" or mode == "Auto") and difficulty in ["Easy", "Medium", "Hard"]) or (mode == "Solo"):
+                    if (mines_input.value and min_mines <= int(mines_input.value) <= max_mines and mode in mode_buttons):
+                        if ((mode == "Interactive" or mode == "Auto") and difficulty in ["Easy", "Medium", "Hard", "Expert"]) or (mode == "Solo"):
                             num_mines = int(mines_input.value)
-                            self.start_game(BOARD_WIDTH, BOARD_HEIGHT, num_mines, mode, difficulty)
+                            self.start_game(self.board_width, self.board_height, num_mines, mode, difficulty)
                 elif event.type == pg.MOUSEBUTTONDOWN and self.minesweeper:
                     # If game finished, capture Yes/No before board clicks
                     if self.minesweeper.is_game_over() or self.minesweeper.is_game_won():  
@@ -335,30 +564,16 @@ class Game:
                         elif no_btn.handle_event(event):                                      
                             self.quit = True                                              
                             break                                                       
-                elif auto_button.handle_event(event):
-                    mode = "Auto"
-                    print("Auto was selected")
-                    drawModeButtons("Auto")
-                elif interactive_button.handle_event(event):
-                    mode = "Interactive"
-                    print("Interactive was selected")
-                    drawModeButtons("Interactive")
-                elif solo_button.handle_event(event):
-                    mode = "Solo"
-                    print("Solo was selected")
-                    drawModeButtons("Solo")
-                elif (mode == "Interactive" or mode == "Auto") and easy_button.handle_event(event):
-                    difficulty = "Easy"
-                    print("Easy was selected")
-                    drawModeButtons("Easy")
-                elif (mode == "Interactive" or mode == "Auto") and medium_button.handle_event(event):
-                    difficulty = "Medium"
-                    print("Medium was selected")
-                    drawModeButtons("Medium")
-                elif (mode == "Interactive" or mode == "Auto") and hard_button.handle_event(event):
-                    difficulty = "Hard"
-                    print("Hard was selected")
-                    drawModeButtons("Hard")
+                elif event.type == pg.MOUSEBUTTONDOWN:
+                    for name, button in mode_buttons.items():
+                        if button.handle_event(event):
+                            mode = name
+                            print(f"{name} was selected")
+                    if mode == "Interactive" or mode == "Auto":
+                        for name, button in difficulty_buttons.items():
+                            if button.handle_event(event):
+                                difficulty = name
+                                print(f"{name} was selected")
                 # elif reset_btn.handle_event(event):    
                 #     if self.last_config:              
                 #         turn, timeAICanMove = self._reset_with_same_config()  
@@ -374,44 +589,81 @@ class Game:
 
             pg.display.update()
             clock.tick(60)
+            if not self.minesweeper and not self.quit:
+                events = wait_for_events(pg.time.get_ticks() + mines_input.cursor_blink_interval)
 
         # Before entering gameplay loop, set initial turn and AI move timer for the autosolver mode
         if mode == "Auto":
             turn = "AI"  # AI starts first in Auto mode
             timeAICanMove = pg.time.get_ticks() + AI_DELAY # I put a delay here even though its the first turn so the user has time to see the empty board
-        # Gameplay loop
+        pg.key.set_repeat(300, 40)  # Holding an arrow key keeps panning
+        # Buttons of the game screen and the play again screen, made once and placed when the window size changes
+        yes_btn = Button(0, 0, 0, 0, "Yes", (60, 130, 80), (90, 170, 120), WHITE)
+        no_btn = Button(0, 0, 0, 0, "No", (140, 70, 70), (180, 100, 100), WHITE)
+        reset_btn = Button(0, 0, 0, 0, "Reset", (110, 110, 130), (140, 140, 170), WHITE)
+        play_again_yes_btn = Button(0, 0, 0, 0, "YES", (60, 130, 80), (90, 170, 120), WHITE)
+        play_again_no_btn = Button(0, 0, 0, 0, "NO", (140, 70, 70), (180, 100, 100), WHITE)
+        game_buttons_size = None
+        play_again_buttons_size = None
+        events = []
+        # Gameplay loop. Instead of drawing 60 frames a second, it sleeps at the end of every frame until an event
+        # arrives (input, or the AI worker's AI_MOVE_READY) or the next moment something on screen is due to change.
         while not self.quit:
             if not self.minesweeper.is_game_over() and not self.minesweeper.is_game_won():
                 pg.display.set_caption("Minesweeper -- Playing")
-                # Let the AI make a move if it is its turn and a sufficient delay has passed
+                # Let the AI start working out a move if it is its turn and a sufficient delay has passed.
+                # It thinks on the worker thread, so the loop keeps drawing frames and handling events meanwhile.
+                # In Auto mode the AI plans every move it is sure of at once and they are played one per turn, so each
+                # one still gets its highlight, and it only thinks again once they're used up.
+                ai_move = None
                 if turn == "AI" and timeAICanMove and pg.time.get_ticks() >= timeAICanMove:
-                    ai_player = AIPlayer(self.minesweeper, difficulty)
-                    ai_x, ai_y = ai_player.make_move()
-                    ai_highlight_cell = (ai_x, ai_y)
-                    ai_highlight_time = pg.time.get_ticks()
                     timeAICanMove = None
+                    ai_move = self._play_planned_move()
+                    if ai_move is None:
+                        self.ai_worker.start(self.ai_player, batch=(mode == "Auto"))
+                # Play the move once the AI has chosen it
+                if self.ai_worker.is_ready():
+                    chosen = self.ai_worker.take_move()
+                    if self.debug:
+                        print(self.ai_worker.frame_report())
+                    if mode == "Auto":
+                        self.ai_moves = chosen[::-1]
+                        ai_move = self._play_planned_move()
+                    else:
+                        ai_move = self.ai_player.apply_move(chosen)
+                    # Nothing in the plan could be played (every cell in it was revealed or flagged already, or there
+                    # was no move), so nothing is highlighted to end the turn. Think again after the usual delay in
+                    # Auto mode, and give the turn back to the player in Interactive mode.
+                    if ai_move is None:
+                        if mode == "Auto":
+                            timeAICanMove = pg.time.get_ticks() + AI_DELAY
+                        else:
+                            turn = "human"
+                if ai_move is not None:
+                    ai_highlight_cell = ai_move
+                    ai_highlight_time = pg.time.get_ticks()
+                    # On a board bigger than the window, scroll to where the AI played
+                    self.viewport.show(*ai_move)
             w, h = screen.get_size()
-            grid_size = min(w, h) * 0.8
-            cell_size = int(grid_size // BOARD_WIDTH)
-            grid_width = BOARD_WIDTH * cell_size
-            grid_height = BOARD_HEIGHT * cell_size
-            grid_x0 = (w - grid_width) // 2
-            grid_y0 = (h - grid_height) // 2
+            # The grid gets the middle 80% of the window. The viewport fits the board in it, or shows part of a bigger one.
+            viewport = self.viewport
+            viewport.fit((int(w * 0.1), int(h * 0.1), int(w * 0.8), int(h * 0.8)))
 
             
-            # Post-game overlay buttons (positions computed later)
-            # We create them each frame so they adapt to resize
-            overlay_btn_width = 130
-            overlay_btn_height = 44
-            center_x = w // 2
-            center_y = h // 2 + 50
-            yes_btn = Button(center_x - overlay_btn_width - 15, center_y, overlay_btn_width, overlay_btn_height,
-                             "Yes", (60, 130, 80), (90, 170, 120), WHITE)
-            no_btn = Button(center_x + 15, center_y, overlay_btn_width, overlay_btn_height,
-                            "No", (140, 70, 70), (180, 100, 100), WHITE)
-
-            # Handle events
-            for event in pg.event.get():
+            # Post-game overlay and reset buttons, placed again whenever the window size changes
+            if game_buttons_size != (w, h):
+                game_buttons_size = (w, h)
+                overlay_btn_width = 130
+                overlay_btn_height = 44
+                center_x = w // 2
+                center_y = h // 2 + 50
+                yes_btn.place(center_x - overlay_btn_width - 15, center_y, overlay_btn_width, overlay_btn_height)
+                no_btn.place(center_x + 15, center_y, overlay_btn_width, overlay_btn_height)
+                reset_btn.place(10, h - 46, 110, 36)  # 36px height + 10px margin
+
+            # Handle the events the last frame woke up for, and any that came since
+            events += pg.event.get()
+            for event in events:
                 if event.type == pg.QUIT:
                     # Safe exit
                     self.quit = True
@@ -421,6 +673,14 @@ class Game:
                     cur_w, cur_h = screen.get_size()
                     if (new_w, new_h) != (cur_w, cur_h):
                         screen = pg.display.set_mode((new_w, new_h), pg.RESIZABLE)
+                elif event.type == pg.MOUSEWHEEL: # Zoom in or out around the mouse
+                    viewport.zoom(ZOOM_STEP ** event.y, *pg.mouse.get_pos())
+                elif event.type == pg.MOUSEMOTION and event.buttons[1]: # Drag with the middle button to pan
+                    viewport.pan(*event.rel)
+                elif event.type == pg.KEYDOWN and event.key in (pg.K_LEFT, pg.K_RIGHT, pg.K_UP, pg.K_DOWN): # Pan with the arrow keys
+                    _, _, view_w, view_h = viewport.area
+                    step_x, step_y = {pg.K_LEFT: (1, 0), pg.K_RIGHT: (-1, 0), pg.K_UP: (0, 1), pg.K_DOWN: (0, -1)}[event.key]
+                    viewport.pan(step_x * view_w * PAN_STEP, step_y * view_h * PAN_STEP)
                 elif reset_btn.handle_event(event):          
                     turn, timeAICanMove = self._reset_with_same_config()  
                     ai_highlight_cell = None                      
@@ -438,7 +698,7 @@ class Game:
                         continue  # ignore board clicks while overlay is up         
                     # Only let the person click on the cell if it is their turn.
                     if turn == "human":
-                        hit = self.mouse_to_grid(*event.pos, grid_x0, grid_y0, cell_size, BOARD_WIDTH, BOARD_HEIGHT)
+                        hit = self.mouse_to_grid(*event.pos, viewport)
                         if hit is None:
                             continue  # Clicked margin or outside grid
                         grid_x, grid_y = hit
@@ -452,7 +712,7 @@ class Game:
                                 
                         elif event.button == 3: # Right click flag
                             # Only toggle flag and change turn if cell is not revealed
-                            if not self.minesweeper.revealed[grid_y][grid_x]:
+                            if not self.minesweeper.is_revealed(grid_x, grid_y):
                                 self.minesweeper.toggle_flag(grid_x, grid_y)
                                 if mode == "Interactive":
                                     turn = "AI"
@@ -479,85 +739,27 @@ class Game:
             else:
                 elapsed_seconds = 0
 
-            # Draw the grid
-            screen.fill(BACKGROUND)
-            board = self.minesweeper.get_display_board()
-            for y in range(self.minesweeper.height):
-                for x in range(self.minesweeper.width):
-                    value = board[y][x]
-                    icon = None
-                    if value == -1:
-                        color = MINE_RED
-                        icon_size = int(cell_size * 0.5)
-                        if self.mine_img is not None:
-                            icon = pg.transform.smoothscale(self.mine_img, (icon_size, icon_size))
-                        else:
-                            icon = pg.Surface((icon_size, icon_size))
-                            icon.fill(MINE_RED)
-                    elif value == 0:
-                        color = REVEALED_EMPTY
-                        icon = font.render("0", True, WHITE)
-                    elif value == "?":
-                        color = HIDDEN
-                        icon = None
-                    elif value == "F":
-                        color = HIDDEN
-                        icon_size = int(cell_size * 0.5)
-                        if self.flag_img is not None:
-                            icon = pg.transform.smoothscale(self.flag_img, (icon_size, icon_size))
-                        else:
-                            icon = pg.Surface((icon_size, icon_size))
-                            icon.fill(BLACK)
-                    else:
-                        color = REVEALED_NUMBER
-                        icon = font.render(str(value), True, WHITE)
-
-                    cell_rect = pg.Rect(grid_x0 + x * cell_size, grid_y0 + y * cell_size, cell_size, cell_size)
-                    pg.draw.rect(screen, color, cell_rect)
-                    pg.draw.rect(screen, GRID_LINE, cell_rect, 1)
-                    if icon is not None:
-                        screen.blit(icon, icon.get_rect(center=cell_rect.center))
-                    # Highlight AI cell
-                    if ai_highlight_cell == (x, y):
-                        pg.draw.rect(screen, HIGHLIGHT_COLOR, cell_rect, 4)
-
-            # Draw labels and UI elements
+            # Draw labels and UI elements. Only what changed since the last frame gets drawn (see BoardRenderer),
+            # so everything around the grid is handed over as widgets that say what they show.
+            widgets = {}
             # Turn indicator
-            turn_text = font.render(f"Turn: {'AI' if turn == 'AI' else 'Player'}", True, (255, 255, 0) if turn == 'AI' else (0, 255, 0))
-            screen.blit(turn_text, (w//2 - turn_text.get_width()//2, 10))
-
-            # Column labels A–J (top)
-            for col_index, letter in enumerate("ABCDEFGHIJ"):
-                text_surface = font.render(letter, True, GENERAL_TEXT)
-                text_rect = text_surface.get_rect(center=(
-                    grid_x0 + col_index * cell_size + cell_size // 2,
-                    grid_y0 - 20
-                ))
-                screen.blit(text_surface, text_rect)
-
-            # Row labels 1–10 (left)
-            for row_index in range(BOARD_HEIGHT):
-                text_surface = font.render(str(row_index + 1), True, GENERAL_TEXT)
-                text_rect = text_surface.get_rect(center=(
-                    grid_x0 - 20,
-                    grid_y0 + row_index * cell_size + cell_size // 2
-                ))
-                screen.blit(text_surface, text_rect)
+            turn_text = glyphs.text(f"Turn: {'AI' if turn == 'AI' else 'Player'}", (255, 255, 0) if turn == 'AI' else (0, 255, 0))
+            widgets["turn"] = text_widget(turn_text, turn_text.get_rect(topleft=(w//2 - turn_text.get_width()//2, 10)))
 
             # Timer display
-            time_text = font.render(f"TIME: {elapsed_seconds}", True, GENERAL_TEXT)
-            screen.blit(time_text, (
+            time_text = glyphs.text(f"TIME: {elapsed_seconds}", GENERAL_TEXT)
+            widgets["time"] = text_widget(time_text, time_text.get_rect(topleft=(
                 w - time_text.get_width() - 10,
                 h - time_text.get_height() - 10
-            ))
+            )))
 
             # Flag Count
             flag_rect = pg.Rect(w/2, h*12/13, 10, 10)
-            pg.draw.rect(screen, BACKGROUND, flag_rect)
-            flags = font.render(f'Flags Remaining: {str(self.minesweeper.flags_remaining)}', True, WHITE)
-            screen.blit(flags, flags.get_rect(center=flag_rect.center))
+            flags = glyphs.text(f'Flags Remaining: {str(self.minesweeper.flags_remaining)}', WHITE)
+            widgets["flags"] = text_widget(flags, flags.get_rect(center=flag_rect.center))
 
             # Game end screen overlay
+            overlay = None
             if self.minesweeper.is_game_over(): # Loss
                 pg.display.set_caption("Minesweeper -- You Lose")
                 if self.end_time is None: # Freeze final time
@@ -565,12 +767,7 @@ class Game:
                 goto_play_again_screen = True 
                 if play_again_at is None:              
                     play_again_at = pg.time.get_ticks() + 900  
-                win_width, win_height = screen.get_size()
-                overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
-                overlay.fill(TRANSPARENT_RED, (0, win_height // 2 - 45, win_width, 60))
-                screen.blit(overlay, (0, 0))
-                text = font.render("Game Over", True, BLACK)
-                screen.blit(text, text.get_rect(center=(win_width // 2, win_height // 2 - 15)))
+                overlay = ("lost", lambda target: self._draw_end_overlay(target, TRANSPARENT_RED, 45, glyphs.text("Game Over", BLACK)))
             elif self.minesweeper.is_game_won(): # Win
                 pg.display.set_caption("Minesweeper -- You Win!")
                 if self.end_time is None: # Freeze final time
@@ -578,30 +775,24 @@ class Game:
                 goto_play_again_screen = True
                 if play_again_at is None:               # NEW
                     play_again_at = pg.time.get_ticks() + 900  # NEW
-                win_width, win_height = screen.get_size()
-                overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
-                overlay.fill(TRANSPARENT_GREEN, (0, win_height // 2 - 30, win_width, 60))
-                screen.blit(overlay, (0, 0))
-                text = font.render("You Win!", True, BLACK)
-                screen.blit(text, text.get_rect(center=(win_width // 2, win_height // 2 - 15)))
-            
-            reset_btn_x = 10
-            reset_btn_y = h - 46  # 36px height + 10px margin
-            reset_btn = Button(reset_btn_x, reset_btn_y, 110, 36, "Reset", (110, 110, 130), (140, 140, 170), WHITE)
-            reset_btn.draw(screen)
+                overlay = ("won", lambda target: self._draw_end_overlay(target, TRANSPARENT_GREEN, 30, glyphs.text("You Win!", BLACK)))
+
+            widgets["reset"] = button_widget(reset_btn)
 
             # Custom cursor
+            cursor = None
             if self.cursor_img is not None:
-                mx, my = pg.mouse.get_pos()
-                screen.blit(self.cursor_img, (mx, my))
+                cursor = (self.cursor_img, pg.mouse.get_pos())
 
-            pg.display.flip()
+            renderer.draw_frame(screen, self.minesweeper, viewport, ai_highlight_cell, widgets, overlay, cursor)
             if goto_play_again_screen and not self.quit:
                 if play_again_at is not None and pg.time.get_ticks() < play_again_at:
+                    # (The overlay is already drawn this frame; just wait until it is time for the play again screen.)
                     clock.tick(60)
-                    # (The overlay is already drawn this frame; just wait another frame.)
+                    events = wait_for_events(play_again_at)
                     continue
                 choice = None
+                events = []
                 while choice is None and not self.quit:
                     w, h = screen.get_size()
                     screen.fill(BACKGROUND)
@@ -619,20 +810,23 @@ class Game:
                     screen.blit(box, (box_x, box_y))
 
                     # Title centered in box
-                    title_surf = title_font.render("Play Again?", True, TITLE_TEXT)
+                    title_surf = glyphs.text("Play Again?", TITLE_TEXT, "title")
                     title_rect = title_surf.get_rect(center=(w // 2, box_y + 40))
                     screen.blit(title_surf, title_rect)
 
                     # Buttons centered in box below title
-                    btn_y = box_y + 100
-                    btn_total_width = btn_w * 2 + gap
-                    btn_start_x = (w - btn_total_width) // 2
-                    yes_btn = Button(btn_start_x, btn_y, btn_w, btn_h, "YES", (60, 130, 80), (90, 170, 120), WHITE)
-                    no_btn  = Button(btn_start_x + btn_w + gap, btn_y, btn_w, btn_h, "NO", (140, 70, 70), (180, 100, 100), WHITE)
-                    yes_btn.draw(screen)
-                    no_btn.draw(screen)
-
-                    for event in pg.event.get():
+                    if play_again_buttons_size != (w, h):
+                        play_again_buttons_size = (w, h)
+                        btn_y = box_y + 100
+                        btn_total_width = btn_w * 2 + gap
+                        btn_start_x = (w - btn_total_width) // 2
+                        play_again_yes_btn.place(btn_start_x, btn_y, btn_w, btn_h)
+                        play_again_no_btn.place(btn_start_x + btn_w + gap, btn_y, btn_w, btn_h)
+                    play_again_yes_btn.draw(screen)
+                    play_again_no_btn.draw(screen)
+
+                    events += pg.event.get()
+                    for event in events:
                         if event.type == pg.QUIT:
                             self.quit = True
                             break
@@ -646,9 +840,9 @@ class Game:
                                 choice = "yes"
                             elif event.key in (pg.K_n, pg.K_ESCAPE):
                                 choice = "no"
-                        elif yes_btn.handle_event(event):
+                        elif play_again_yes_btn.handle_event(event):
                             choice = "yes"
-                        elif no_btn.handle_event(event):
+                        elif play_again_no_btn.handle_event(event):
                             choice = "no"
 
                     if self.cursor_img is not None:
@@ -658,6 +852,9 @@ class Game:
 
                     pg.display.flip()
                     clock.tick(60)
+                    # Nothing here changes on its own, so sleep until there is input
+                    if not self.quit:
+                        events = wait_for_events()
 
                 # Apply choice
                 if not self.quit:
@@ -667,11 +864,24 @@ class Game:
                         ai_highlight_time = None
                         goto_play_again_screen = False  # back to gameplay with fresh board
                         play_again_at = None
+                        events = []
                         continue  # restart gameplay loop 
                     else:
                         self.quit = True
                         play_again_at = None 
                         break  # exit  loop
 
-            clock.tick(60)
+            # clock.tick returns the time since the last frame, which is what a player notices when the AI holds the loop up.
+            # It also keeps a burst of events (like dragging the mouse) from drawing more than 60 frames a second.
+            self.ai_worker.record_frame(clock.tick(60) / 1000)
+            if self.quit:
+                break
+            # Sleep until an event, or until the AI may move, the highlight runs out or the timer shows the next second
+            deadlines = [timeAICanMove]
+            if ai_highlight_time is not None:
+                deadlines.append(ai_highlight_time + highlight_duration)
+            if self.start_ticks is not None and self.end_time is None:
+                deadlines.append(self.start_ticks + (elapsed_seconds + 1) * 1000)
+            events = wait_for_events(min((deadline for deadline in deadlines if deadline is not None), default=None))
+            clock.tick()  # The next frame's time starts when it wakes up, not when this one went to sleep
         self.exit_game()
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Module: MonteCarlo
+Classes: MonteCarloEstimator, Estimate
+Description: Monte Carlo mine probability estimator for forced guesses. Mine arrangements that agree
+                with every revealed number are drawn in vectorized batches: the frontier cells are
+                decided one at a time for the whole batch at once, each arrangement is weighted by how
+                likely the sampler was to draw it and by the ways to place the remaining mines in the
+                unconstrained interior, and the weighted batches estimate the chance of a mine on every
+                covered cell. Estimates are streamed after every batch, so a caller can stop early.
+Inputs: A Minesweeper board (display values and flags_remaining only), and a sample count and/or deadline.
+Outputs: Estimate objects with per-cell mine probabilities and the safest cell to guess.
+External Sources: NumPy
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import math
+import random
+import time
+import numpy as np
+from Solver import Solver
+
+class Estimate:
+    def __init__(self, probabilities, interior, interior_probability, samples, effective_samples):
+        self.probabilities = probabilities                # {(x, y): estimated chance of a mine} for frontier cells
+        self.interior = interior                          # Covered cells no number touches
+        self.interior_probability = interior_probability  # Chance of a mine on any one interior cell
+        self.samples = samples                            # Arrangements drawn so far, including rejected ones
+        self.effective_samples = effective_samples        # How many equally weighted samples the estimate is worth
+
+    def safest(self):
+        """Return (cell, probability) for the frontier cell least likely to be a mine, or (None, probability)
+        if an interior cell is at least as safe (every interior cell is equally likely to be a mine)."""
+        cell, lowest = None, 1.0
+        if self.interior:
+            lowest = self.interior_probability
+        for candidate, chance in sorted(self.probabilities.items()):
+            if chance < lowest:
+                cell, lowest = candidate, chance
+        return cell, lowest
+
+class MonteCarloEstimator:
+    # Sequential importance sampling. For every frontier cell in turn, each arrangement in the batch takes a
+    # mine with a probability based on how many mines its constraints still need, or is forced when only one
+    # value keeps them satisfiable. Arrangements that run into an unsatisfiable constraint are dropped. An
+    # arrangement is weighted by 1 / (chance the sampler drew it) * (ways to fill the interior), which makes the
+    # weighted samples an unbiased estimate over every arrangement consistent with the board.
+    def __init__(self, board, batch_size=1024, rng=None):
+        """rng is a numpy Generator; if it is not given one is seeded from the random module, so seeding
+        random makes the estimates repeatable."""
+        self.batch_size = batch_size
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        solver = Solver(board)
+        covered, constraints = solver.read_constraints()
+        self.safe, self.mines = set(), set()
+        constraints = solver.propagate(constraints, self.safe, self.mines)
+        self.consistent = constraints is not None
+        constraints = constraints or []
+
+        self.cells = []
+        for group in solver.components(constraints):
+            self.cells.extend(solver.order_cells(group))
+        frontier = set(self.cells)
+        self.interior = [cell for cell in covered if cell not in frontier and cell not in self.safe and cell not in self.mines]
+        self.mines_left = board.flags_remaining - len(self.mines)
+        self.counts = np.array([count for _, count in constraints], dtype=np.int32)
+
+        # For cell i: the constraints it is in, and how many of their cells come after it in the order
+        index = {cell: position for position, cell in enumerate(self.cells)}
+        self.cell_constraints = [[] for _ in self.cells]
+        self.left_after = [[] for _ in self.cells]
+        for number, (cells, _) in enumerate(constraints):
+            positions = sorted(index[cell] for cell in cells)
+            for rank, position in enumerate(positions):
+                self.cell_constraints[position].append(number)
+                self.left_after[position].append(len(positions) - rank - 1)
+        self.cell_constraints = [np.array(numbers, dtype=np.intp) for numbers in self.cell_constraints]
+        self.left_after = [np.array(left, dtype=np.int32) for left in self.left_after]
+
+        # log(ways to put r mines in the interior) for every r the frontier can leave over
+        interior_size = len(self.interior)
+        self.log_fill = np.array([math.lgamma(interior_size + 1) - math.lgamma(r + 1) - math.lgamma(interior_size - r + 1)
+                                  if 0 <= r <= interior_size else -np.inf for r in range(max(self.mines_left, 0) + 1)])
+
+        # Running sums, all scaled by exp(-log_scale) so that large weights do not overflow
+        self.log_scale = -np.inf
+        self.weight_sum = 0.0
+        self.weight_square_sum = 0.0
+        self.mine_weights = np.zeros(len(self.cells))
+        self.interior_weight = 0.0
+        self.samples = 0
+
+    def draw_batch(self):
+        """Draw one batch of arrangements. Returns their mines (batch x frontier cells) and log weights,
+        with -inf for arrangements that broke a constraint or the mine count."""
+        size = self.batch_size
+        need = np.tile(self.counts, (size, 1))
+        mines = np.zeros((size, len(self.cells)), dtype=bool)
+        log_weight = np.zeros(size)
+        alive = np.ones(size, dtype=bool)
+        for position in range(len(self.cells)):
+            numbers, left = self.cell_constraints[position], self.left_after[position]
+            needed = need[:, numbers]
+            can_be_mine = ((needed >= 1) & (needed - 1 <= left)).all(axis=1)
+            can_be_safe = (needed <= left).all(axis=1)
+            either = can_be_mine & can_be_safe
+            # Take a mine about as often as the constraints still need one per remaining cell
+            chance = np.clip((needed / (left + 1)).mean(axis=1), 0.05, 0.95)
+            is_mine = np.where(either, self.rng.random(size) < chance, can_be_mine)
+            log_weight -= np.where(either, np.log(np.where(is_mine, chance, 1 - chance)), 0.0)
+            alive &= can_be_mine | can_be_safe
+            need[:, numbers] -= is_mine[:, None]
+            mines[:, position] = is_mine
+        left_over = self.mines_left - mines.sum(axis=1)
+        fits = alive & (left_over >= 0)
+        log_weight = np.where(fits, log_weight + self.log_fill[np.maximum(left_over, 0)], -np.inf)
+        return mines, log_weight
+
+    def estimates(self, samples=None, deadline_ms=None):
+        """Yield an Estimate after every batch until samples arrangements have been drawn or deadline_ms
+        has passed (whichever comes first; with neither, one batch is drawn)."""
+        deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
+        target = samples if samples is not None or deadline is not None else self.batch_size
+        while True:
+            if self.cells:
+                self.add_batch(*self.draw_batch())
+            else:
+                self.samples += self.batch_size
+            yield self.current()
+            if target is not None and self.samples >= target:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+    def estimate(self, samples=None, deadline_ms=None):
+        """Return the final Estimate of estimates(samples, deadline_ms)."""
+        for estimate in self.estimates(samples, deadline_ms):
+            pass
+        return estimate
+
+    def add_batch(self, mines, log_weight):
+        """Fold one batch into the running sums."""
+        self.samples += len(log_weight)
+        top = log_weight.max()
+        if top == -np.inf:
+            return
+        if top > self.log_scale:
+            rescale = math.exp(self.log_scale - top) if self.log_scale > -np.inf else 0.0
+            self.weight_sum *= rescale
+            self.weight_square_sum *= rescale * rescale
+            self.mine_weights *= rescale
+            self.interior_weight *= rescale
+            self.log_scale = top
+        weight = np.exp(log_weight - self.log_scale)
+        self.weight_sum += weight.sum()
+        self.weight_square_sum += (weight * weight).sum()
+        self.mine_weights += weight @ mines
+        if self.interior:
+            self.interior_weight += weight @ ((self.mines_left - mines.sum(axis=1)) / len(self.interior))
+
+    def current(self):
+        """Estimate from everything drawn so far."""
+        probabilities = {cell: 0.0 for cell in self.safe}
+        probabilities.update((cell, 1.0) for cell in self.mines)
+        if not self.cells:
+            interior_probability = self.mines_left / len(self.interior) if self.interior else 0.0
+            return Estimate(probabilities, self.interior, interior_probability, self.samples, self.samples)
+        if self.weight_sum == 0:
+            # No consistent arrangement drawn yet, so nothing is known beyond the propagated cells
+            probabilities.update((cell, 0.5) for cell in self.cells)
+            return Estimate(probabilities, self.interior, 0.5, self.samples, 0.0)
+        probabilities.update(zip(self.cells, (self.mine_weights / self.weight_sum).tolist()))
+        return Estimate(probabilities, self.interior, self.interior_weight / self.weight_sum, self.samples,
+                        self.weight_sum ** 2 / self.weight_square_sum)
@@ -0,0 +1,63 @@
+"""
+Module: Neighbors
+Class: NeighborTable
+Function: get_neighbor_table
+Description: Precomputed neighbor offsets for Minesweeper boards. Every square falls into one of 16
+                kinds depending on which walls it touches, and each kind has a fixed tuple of in-bounds
+                neighbor offsets, so neighbor loops need no bounds checks. Tables are cached per
+                (width, height) and shared by every board and AI of that shape.
+Inputs: Board width and height.
+Outputs: NeighborTable for that board shape.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+from functools import lru_cache
+
+# Compass order used by AIPlayer.getAdjacentValues: left, topleft, top, topright, right, bottomright, bottom, bottomleft
+COMPASS = ((-1, 0), (-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1))
+
+def edge_kind(index, size):
+    """0 for an inner row/column, 1 at the low wall, 2 at the high wall, 3 if it touches both (size 1)."""
+    return (index == 0) | (index == size - 1) << 1
+
+def allowed_steps(kind):
+    """Steps (-1, 0, 1) that stay on the board for a row or column of the given edge kind."""
+    return tuple(step for step in (-1, 0, 1) if not (step == -1 and kind & 1) and not (step == 1 and kind & 2))
+
+class NeighborTable:
+    # The kind of square (x, y) is row_kinds[y] | column_kinds[x]: the column's edge kind in the low two
+    # bits and the row's in the next two. Storing kinds per row and column keeps the table O(width + height).
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.column_kinds = bytes(edge_kind(x, width) for x in range(width))
+        self.row_kinds = bytes(edge_kind(y, height) << 2 for y in range(height))
+        deltas = []
+        for kind in range(16):
+            dxs, dys = allowed_steps(kind & 3), allowed_steps(kind >> 2)
+            deltas.append(tuple((dx, dy) for dy in dys for dx in dxs if (dx, dy) != (0, 0)))
+        # deltas[kind]: (dx, dy) of every neighbor. offsets[kind]: the same as flat index (y * width + x) offsets.
+        # compass[kind]: (dx, dy) in COMPASS order, None where the neighbor would be off the board.
+        self.deltas = tuple(deltas)
+        self.offsets = tuple(tuple(dy * width + dx for dx, dy in kind_deltas) for kind_deltas in deltas)
+        self.compass = tuple(tuple(delta if delta in kind_deltas else None for delta in COMPASS) for kind_deltas in deltas)
+
+    def kind(self, x, y):
+        """Index into deltas, offsets and compass for square (x, y)."""
+        return self.row_kinds[y] | self.column_kinds[x]
+
+    def deltas_at(self, x, y):
+        """(dx, dy) offsets of the in-bounds neighbors of square (x, y)."""
+        return self.deltas[self.row_kinds[y] | self.column_kinds[x]]
+
+    def neighbors(self, x, y):
+        """(x, y) coordinates of the in-bounds neighbors of square (x, y)."""
+        return [(x + dx, y + dy) for dx, dy in self.deltas[self.row_kinds[y] | self.column_kinds[x]]]
+
+@lru_cache(maxsize=32)
+def get_neighbor_table(width, height):
+    """Return the shared NeighborTable for boards of this shape, building it on first use."""
+    return NeighborTable(width, height)
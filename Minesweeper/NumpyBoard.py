@@ -0,0 +1,73 @@
+"""
+Module: NumpyBoard
+Class: NumpyMinesweeper
+Description: Alternative storage backend for the Minesweeper board. The board, revealed
+                and flag grids are contiguous NumPy arrays and the adjacent mine counts are
+                computed for the whole board in one vectorized pass.
+Inputs: Width, height, and number of mines defining the initial board setup.
+Outputs: Minesweeper game board with the same public methods as MinesweeperBoard.Minesweeper.
+External Sources: NumPy
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import numpy as np
+from BoardFile import plane_size
+from MinesweeperBoard import Minesweeper
+
+class NumpyMinesweeper(Minesweeper):
+    def create_grids(self):
+        """Create the board as an int8 array and the revealed/flag grids as bool arrays."""
+        shape = (self.height, self.width)
+        return np.zeros(shape, dtype=np.int8), np.zeros(shape, dtype=bool), np.zeros(shape, dtype=bool)
+
+    def place_mines(self, safe_x=None, safe_y=None):
+        """Place mines, ensuring the first square is safe."""
+        self.board.flat[np.array(self.sample_mine_indices(safe_x, safe_y), dtype=np.int64)] = -1
+
+    def calculate_squares(self):
+        """Calculate the number of adjacent mines for all squares with a padded-shift sum."""
+        mines = self.board == -1
+        padded = np.pad(mines.astype(np.int8), 1)
+        counts = np.zeros((self.height, self.width), dtype=np.int8)
+        for dy in range(3):
+            for dx in range(3):
+                if dy == 1 and dx == 1:
+                    continue
+                counts += padded[dy:dy + self.height, dx:dx + self.width]
+        self.board = np.where(mines, np.int8(-1), counts).astype(np.int8)
+
+    def count_revealed_safe(self):
+        """Count the revealed non-mine squares with a full scan of the board (used to check revealed_safe_count)."""
+        return int(np.count_nonzero(self.revealed & (self.board != -1)))
+
+    def reveal_all_mines(self):
+        """Reveal all mines on the board. Returns the set of mine cells that were newly revealed."""
+        hidden_mines = (self.board == -1) & ~self.revealed
+        self.revealed |= hidden_mines
+        return {(int(x), int(y)) for y, x in np.argwhere(hidden_mines)}
+
+    def to_planes(self):
+        """Return the mine, revealed and flag bit planes in the BoardFile layout (bit y * (width + 1) + x)."""
+        size = plane_size(self.width, self.height)
+        planes = []
+        for grid in (self.board == -1, self.revealed, self.flags):
+            # Add the always-clear padding column, then pack the bits row by row
+            padded = np.zeros((self.height, self.width + 1), dtype=bool)
+            padded[:, :self.width] = grid
+            planes.append(np.packbits(padded.ravel(), bitorder="little").tobytes()[:size])
+        return planes
+
+    def load_planes(self, mines, revealed, flags):
+        """Restore the grids from bit planes in the BoardFile layout and rebuild the derived state."""
+        cells = self.height * (self.width + 1)
+        def unpack(plane):
+            bits = np.unpackbits(np.frombuffer(plane, dtype=np.uint8), bitorder="little")[:cells]
+            return bits.reshape(self.height, self.width + 1)[:, :self.width].astype(bool)
+        self.board = np.where(unpack(mines), np.int8(-1), np.int8(0)).astype(np.int8)
+        self.revealed = unpack(revealed)
+        self.flags = unpack(flags)
+        self.calculate_squares()
+        self.revealed_safe_count = self.count_revealed_safe()
+        self._refresh_display({(int(x), int(y)) for y, x in np.argwhere(self.revealed | self.flags)})
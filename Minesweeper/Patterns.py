@@ -0,0 +1,157 @@
+"""
+Module: Patterns
+Functions: neighborhood_key, row_keys, column_code, lookup, transform_grid, expand_patterns
+Description: Data-driven local patterns for the Hard AI. The 3x3 neighborhood of a square (covered,
+                flagged, off the board, or the number shown) is packed into one integer key, and the
+                patterns are written as 3x3 grids of symbols plus the move they lead to. Every pattern
+                is expanded into all of its rotations and reflections once, when the module is
+                imported, and the conclusions for each key are worked out the first time the key is
+                seen and kept (see lookup), so matching every pattern at a square is one cache lookup.
+                A new pattern is a new entry in PATTERNS.
+Inputs: A Minesweeper board (display values only) and a square on it.
+Outputs: For each square, the patterns that apply there and the squares they would reveal or flag.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+from functools import lru_cache
+
+# Codes of the squares in a key: the number shown (0-8), or one of these
+COVERED = 9
+FLAGGED = 10
+OFF_BOARD = 11
+MINE = 12  # A revealed mine, only seen once the game is lost
+CODES = {value: value for value in range(9)}
+CODES.update({"?": COVERED, "F": FLAGGED, -1: MINE})
+
+# The squares of a neighborhood as (dx, dy) from its middle, in the order they are packed into the key (4 bits each).
+# Column by column, so the key of the next square in a row is the last two columns shifted up plus one new column.
+WINDOW = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+COLUMN_BITS = 12
+KEY_MASK = (1 << 3 * COLUMN_BITS) - 1
+
+# Which codes each symbol of a pattern grid allows:
+#   * = anything, even off the board
+#   | = off the board (a wall)
+#   ? = covered square
+#   F = flagged square
+#   . = anything that is not covered or flagged: a revealed number or off the board
+#   0-8 = revealed square with that number
+SYMBOLS = {
+    "*": frozenset(range(13)),
+    "|": frozenset({OFF_BOARD}),
+    "?": frozenset({COVERED}),
+    "F": frozenset({FLAGGED}),
+    ".": frozenset(set(range(9)) | {OFF_BOARD, MINE}),
+}
+SYMBOLS.update({str(number): frozenset({number}) for number in range(9)})
+
+# Each pattern: (name, 3x3 grid around the anchor square, "reveal" or "flag", squares to play as (dx, dy) from the anchor).
+# The squares to play are tried in order and the first one that is on the board and covered is played. They may lie
+# outside the grid, but no further than 2 squares from the anchor (AIPlayer.update_hard_patterns relies on that).
+# Patterns are written for one orientation; the rotated and reflected versions are added automatically.
+PATTERNS = (
+    # Pattern 1: | 1 1 *
+    #            | ? ? ?
+    # Safe move:
+    #            | 1 1 *
+    #            | ? ? X
+    # Along a wall, if 2 adjacent revealed squares show a 1, the covered square past the second 1 can be uncovered.
+    # Anchored at the 1 against the wall; the square below is tried first, then the one above.
+    ("wall 1-1", ("|**",
+                  "|11",
+                  "|**"), "reveal", ((2, 1), (2, -1))),
+    # Pattern 2: if there is a covered square with 3 1s around one of its corners, and the 1 in the corner touches
+    # no other covered or flagged square, then the covered square must be a mine and should be flagged.
+    # 1 1
+    # 1 ?
+    # Anchored at the 1 in the corner.
+    ("corner of 1s", ("...",
+                      ".11",
+                      ".1?"), "flag", ((1, 1),)),
+    # Pattern 3: * * *
+    #            1 2 1
+    #            ? X ?
+    # With covered squares on one side of a 1-2-1, the square next to the 2 can be uncovered (the ones next to the
+    # 1s are mines, which the medium logic will flag). Anchored at the 2; below is tried first, then above.
+    ("1-2-1", ("***",
+               "121",
+               "***"), "reveal", ((0, 1), (0, -1))),
+)
+
+# The 8 rotations and reflections of a square, as functions of (dx, dy)
+SYMMETRIES = (
+    lambda dx, dy: (dx, dy),
+    lambda dx, dy: (-dx, dy),
+    lambda dx, dy: (dy, dx),
+    lambda dx, dy: (dy, -dx),
+    lambda dx, dy: (dx, -dy),
+    lambda dx, dy: (-dx, -dy),
+    lambda dx, dy: (-dy, dx),
+    lambda dx, dy: (-dy, -dx),
+)
+
+def transform_grid(grid, symmetry):
+    """The grid (rows of symbols) with every square moved by symmetry, as a tuple of symbols in WINDOW order."""
+    moved = {}
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            moved[symmetry(dx, dy)] = grid[dy + 1][dx + 1]
+    return tuple(moved[delta] for delta in WINDOW)
+
+def expand_patterns(patterns):
+    """Every distinct orientation of every pattern as (pattern number, allowed codes per square, action, squares
+    to play). Orientations that give the same grid as an earlier one are left out."""
+    variants = []
+    for number, (_, grid, action, moves) in enumerate(patterns):
+        seen = set()
+        for symmetry in SYMMETRIES:
+            symbols = transform_grid(grid, symmetry)
+            if symbols in seen:
+                continue
+            seen.add(symbols)
+            variants.append((number, tuple(SYMBOLS[symbol] for symbol in symbols), action,
+                             tuple(symmetry(dx, dy) for dx, dy in moves)))
+    return tuple(variants)
+
+VARIANTS = expand_patterns(PATTERNS)
+# Most neighborhood keys whose matches lookup keeps. Big boards keep showing new keys, so without a limit the cache
+# would only grow; past this the least recently used are dropped and worked out again if they come back.
+TABLE_SIZE = 1 << 16
+
+def column_code(board, x, y):
+    """Pack squares (x, y - 1), (x, y) and (x, y + 1) into 12 bits, the way they appear in a key."""
+    if not 0 <= x < board.width:
+        return OFF_BOARD << 8 | OFF_BOARD << 4 | OFF_BOARD
+    get_cell = board.get_cell
+    above = CODES[get_cell(x, y - 1)] if y > 0 else OFF_BOARD
+    below = CODES[get_cell(x, y + 1)] if y < board.height - 1 else OFF_BOARD
+    return above << 8 | CODES[get_cell(x, y)] << 4 | below
+
+def neighborhood_key(board, x, y):
+    """Pack the 3x3 neighborhood of square (x, y) into an integer, 4 bits per square in WINDOW order."""
+    return column_code(board, x - 1, y) << 24 | column_code(board, x, y) << 12 | column_code(board, x + 1, y)
+
+def row_keys(board, y, columns):
+    """Yield (x, key) for square (x, y) at every x of columns (in increasing order). Runs of neighboring squares
+    reuse the columns they share, so a whole row costs about 3 get_cell calls per square instead of 9."""
+    key = None
+    last = None
+    for x in columns:
+        if last is not None and x == last + 1:
+            key = (key << COLUMN_BITS & KEY_MASK) | column_code(board, x + 1, y)
+        else:
+            key = neighborhood_key(board, x, y)
+        last = x
+        yield x, key
+
+@lru_cache(maxsize=TABLE_SIZE)
+def lookup(key):
+    """The patterns that match a neighborhood key, as a tuple of (pattern number, action, squares to play).
+    Results are cached for as long as the process runs, shared by every game and board size, and the cache holds
+    at most TABLE_SIZE keys (the least recently used go first)."""
+    codes = [key >> shift & 15 for shift in range(4 * len(WINDOW) - 4, -1, -4)]
+    return tuple((number, action, moves) for number, allowed, action, moves in VARIANTS
+                 if all(code in options for code, options in zip(codes, allowed)))
@@ -2,13 +2,25 @@
 Module: PlayMinesweeper
 Function: play_minesweeper
 Description: Run minesweeper game.
-Inputs: None
+Inputs: Optional board size on the command line (--width and --height, 10x10 by default), and --debug.
+                Boards of more than 250,000 squares can only be played Solo.
 Outputs: Starts the Minesweeper game window.
 External Sources: None
 Author: Kiara [Sam] Grimsley
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
 Created: September 19, 2025
-Last Modified: September 19, 2025
+Last Modified: October 17, 2026
 """
 
-from MinesweeperGame import Game
-Game.play_minesweeper()
\ No newline at end of file
+import argparse
+from MinesweeperGame import Game, BOARD_WIDTH, BOARD_HEIGHT, CHUNKED_SQUARES
+
+parser = argparse.ArgumentParser(description="Play Minesweeper.",
+                                 epilog=f"Boards of more than {CHUNKED_SQUARES:,} squares can only be played Solo.")
+parser.add_argument("--width", type=int, default=BOARD_WIDTH, help="board width in squares")
+parser.add_argument("--height", type=int, default=BOARD_HEIGHT, help="board height in squares")
+parser.add_argument("--debug", action="store_true", help="print the AI's thinking time and the frame times after every AI move")
+args = parser.parse_args()
+if args.width < 2 or args.height < 2:
+    parser.error("the board must be at least 2x2")
+Game.play_minesweeper(args.width, args.height, args.debug)
@@ -0,0 +1,49 @@
+"""
+Module: Resources
+Class: Resources
+Description: Loads the game's fonts and images from disk once and hands the same objects to everything
+                that asks for them. A pygame Font reads and parses its TTF file when it is made, so making
+                one per button per frame read the font file hundreds of times a second. Here each font is
+                loaded once per size and each image once, and later requests are dictionary lookups.
+                Files that fail to load fall back to pygame's default font, or None for images, and the
+                failure is only reported the first time.
+Inputs: Asset file paths and font sizes.
+Outputs: Shared pygame Font objects and loaded image Surfaces.
+External Sources: pygame
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import pygame as pg
+
+class Resources:
+    def __init__(self):
+        self.fonts = {}   # (path, size) -> Font
+        self.images = {}  # path -> Surface, or None if it failed to load
+        self.loads = 0    # How many files were read from disk, for profiling
+
+    def font(self, path, size):
+        """The font in the TTF file at path, at size points."""
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.loads += 1
+            try:
+                font = pg.font.Font(path, size)
+            except (OSError, FileNotFoundError) as e:
+                print("Custom font failed to load:", e)
+                font = pg.font.SysFont(None, size)
+            self.fonts[key] = font
+        return font
+
+    def image(self, path):
+        """The image at path converted for fast blitting (so the window has to exist), or None if it can't be loaded."""
+        if path not in self.images:
+            self.loads += 1
+            try:
+                self.images[path] = pg.image.load(path).convert_alpha()
+            except (pg.error, OSError, FileNotFoundError) as e:
+                print("Image failed to load:", e)
+                self.images[path] = None
+        return self.images[path]
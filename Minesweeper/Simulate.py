@@ -0,0 +1,178 @@
+"""
+Module: Simulate
+Functions: play_game, play_batch, summarize, run_simulation, new_totals, add_counts
+Description: Headless AI simulation harness. Plays many games per AI difficulty without pygame,
+                spread over a process pool, and reports win rate, moves per game, throughput,
+                move latency percentiles, which stage of the AI picked the moves, and wall time.
+                Every game uses its own deterministic seed, so a run can be repeated exactly with the
+                same arguments. An optional per-move time budget is passed on to the AI, so budgets
+                can be compared against win rate.
+Inputs: Command line options (games per difficulty, difficulties, board size, workers, seed, move budget, output path).
+Outputs: JSON report written to a file or printed to stdout.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from AIPlayer import AIPlayer
+from MinesweeperBoard import Minesweeper
+
+DIFFICULTIES = ("Easy", "Medium", "Hard", "Expert")
+
+# Move latencies are collected in a histogram with buckets LATENCY_STEP apart on a log scale (2% wide),
+# so workers send back a small dict instead of every latency and percentiles are within 2%.
+LATENCY_STEP = math.log(1.02)
+
+def latency_bucket(seconds):
+    """Histogram bucket for a move latency."""
+    return int(math.log(max(seconds, 1e-9)) / LATENCY_STEP)
+
+def play_game(seed, difficulty, width, height, num_mines, max_moves, deadline_ms=None):
+    """Play one game with a single AIPlayer, giving it deadline_ms per move. Returns (result, moves, latency
+    histogram, {stage: moves}, moves over budget) where result is "won", "lost" or "stalled" (the AI stopped
+    making progress and hit max_moves)."""
+    minesweeper = Minesweeper(width, height, num_mines, "Auto", difficulty, seed=seed)
+    minesweeper.undo_limit = 0  # Nothing is ever undone, so don't keep the moves
+    ai_player = AIPlayer(minesweeper, difficulty)
+    # The AI's random choices get their own seed so they are not the same numbers the board used for its mines
+    random.seed(f"{seed}:ai")
+    histogram = {}
+    stages = {}
+    over_budget = 0
+    moves = 0
+    # The AI prints every move it makes, which would swamp the report and slow the workers down
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not minesweeper.is_game_over() and not minesweeper.is_game_won() and moves < max_moves:
+            start = time.perf_counter()
+            ai_player.make_move(deadline_ms)
+            bucket = latency_bucket(time.perf_counter() - start)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+            stages[ai_player.moveStage] = stages.get(ai_player.moveStage, 0) + 1
+            over_budget += deadline_ms is not None and ai_player.moveTime > deadline_ms
+            moves += 1
+    if minesweeper.is_game_won():
+        result = "won"
+    elif minesweeper.is_game_over():
+        result = "lost"
+    else:
+        result = "stalled"
+    return result, moves, histogram, stages, over_budget
+
+def new_totals():
+    """Empty counts for play_batch and run_simulation to add games to."""
+    return {"games": 0, "won": 0, "lost": 0, "stalled": 0, "moves": 0, "over_budget": 0, "latencies": {}, "stages": {}}
+
+def add_counts(counts, more):
+    """Add the {key: count} dict more into counts."""
+    for key, count in more.items():
+        counts[key] = counts.get(key, 0) + count
+
+def play_batch(seeds, difficulty, width, height, num_mines, max_moves, deadline_ms=None):
+    """Play a batch of games in one worker and return their combined counts."""
+    totals = new_totals()
+    for seed in seeds:
+        result, moves, histogram, stages, over_budget = play_game(seed, difficulty, width, height, num_mines, max_moves, deadline_ms)
+        totals["games"] += 1
+        totals[result] += 1
+        totals["moves"] += moves
+        totals["over_budget"] += over_budget
+        add_counts(totals["latencies"], histogram)
+        add_counts(totals["stages"], stages)
+    return totals
+
+def percentile(histogram, fraction):
+    """Latency in seconds below which the given fraction of moves fall."""
+    total = sum(histogram.values())
+    if total == 0:
+        return 0.0
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= fraction * total:
+            return math.exp((bucket + 0.5) * LATENCY_STEP)
+    return math.exp((max(histogram) + 0.5) * LATENCY_STEP)
+
+def summarize(totals, wall_time):
+    """Turn the combined counts of one difficulty into the numbers of the report."""
+    games, moves = totals["games"], totals["moves"]
+    return {
+        "games": games,
+        "won": totals["won"],
+        "lost": totals["lost"],
+        "stalled": totals["stalled"],
+        "win_rate": totals["won"] / games if games else 0.0,
+        "moves_per_game": moves / games if games else 0.0,
+        "moves_per_second": moves / wall_time if wall_time else 0.0,
+        "latency_p50_ms": percentile(totals["latencies"], 0.5) * 1000,
+        "latency_p99_ms": percentile(totals["latencies"], 0.99) * 1000,
+        "moves_over_budget": totals["over_budget"],
+        "moves_by_stage": dict(sorted(totals["stages"].items(), key=lambda item: -item[1])),
+        "wall_time_s": wall_time,
+    }
+
+def run_simulation(games, difficulties, width, height, num_mines, workers=None, seed=0, batch_size=None, max_moves=None,
+                   deadline_ms=None):
+    """Play games games per difficulty over a pool of workers processes and return the report as a dict.
+    Game i of every difficulty uses board seed seed + i. deadline_ms is the AI's time budget per move (None for none)."""
+    workers = workers or os.cpu_count() or 1
+    # Enough batches per worker to keep them all busy to the end, but few enough that scheduling is cheap
+    batch_size = batch_size or max(1, min(500, games // (workers * 8)))
+    max_moves = max_moves or width * height * 4
+    report = {
+        "config": {"games": games, "difficulties": list(difficulties), "width": width, "height": height,
+                   "num_mines": num_mines, "workers": workers, "seed": seed, "batch_size": batch_size,
+                   "max_moves": max_moves, "deadline_ms": deadline_ms},
+        "results": {},
+    }
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for difficulty in difficulties:
+            start = time.perf_counter()
+            batches = [range(first, min(first + batch_size, seed + games)) for first in range(seed, seed + games, batch_size)]
+            totals = new_totals()
+            futures = [pool.submit(play_batch, batch, difficulty, width, height, num_mines, max_moves, deadline_ms)
+                       for batch in batches]
+            for future in futures:
+                batch_totals = future.result()
+                for key in ("games", "won", "lost", "stalled", "moves", "over_budget"):
+                    totals[key] += batch_totals[key]
+                add_counts(totals["latencies"], batch_totals["latencies"])
+                add_counts(totals["stages"], batch_totals["stages"])
+            report["results"][difficulty] = summarize(totals, time.perf_counter() - start)
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Minesweeper AI games headlessly and report how they went.")
+    parser.add_argument("--games", type=int, default=1000, help="games per difficulty (default: 1000)")
+    parser.add_argument("--difficulties", nargs="+", default=["Easy", "Medium", "Hard"],
+                        help=f"difficulties to play: {', '.join(DIFFICULTIES)} (default: Easy Medium Hard)")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--height", type=int, default=10)
+    parser.add_argument("--mines", type=int, default=15)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game (default: 0)")
+    parser.add_argument("--batch-size", type=int, default=None, help="games per task sent to a worker")
+    parser.add_argument("--deadline-ms", type=float, default=None, help="AI time budget per move in milliseconds (default: none)")
+    parser.add_argument("--output", help="write the JSON report here instead of printing it")
+    args = parser.parse_args()
+    for difficulty in args.difficulties:
+        if difficulty not in DIFFICULTIES:
+            parser.error(f"unknown difficulty '{difficulty}'")
+
+    report = run_simulation(args.games, args.difficulties, args.width, args.height, args.mines,
+                            workers=args.workers, seed=args.seed, batch_size=args.batch_size, deadline_ms=args.deadline_ms)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as report_file:
+            report_file.write(text + "\n")
+    else:
+        print(text)
@@ -0,0 +1,267 @@
+"""
+Module: Solver
+Classes: Solver, SolveResult
+Description: Constraint solver for Minesweeper, used by the "Expert" AI. The revealed numbers give one
+                constraint each on their covered neighbors. Trivial constraints are propagated first,
+                the rest of the frontier is split into independent components, and the mine arrangements
+                of every component are counted exactly, one cell at a time along the frontier. Combining
+                the components with the number of mines left gives the exact mine probability of every
+                covered square, so a square is reported safe or a mine exactly when every arrangement
+                consistent with the board agrees.
+Inputs: A Minesweeper board. Only what a player can see is used: the display values and flags_remaining.
+Outputs: SolveResult with the certainly safe squares, the certain mines and all mine probabilities.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+from math import comb
+
+def count_choices(n, k):
+    """Ways to choose k of n squares, 0 when k is out of range."""
+    return comb(n, k) if 0 <= k <= n else 0
+
+def convolve(left, right):
+    """Multiply two {mines: arrangements} polynomials."""
+    product = {}
+    for k1, c1 in left.items():
+        for k2, c2 in right.items():
+            product[k1 + k2] = product.get(k1 + k2, 0) + c1 * c2
+    return product
+
+class SolveResult:
+    def __init__(self, safe, mines, probabilities, consistent=True):
+        self.safe = safe                    # Covered squares that are a mine in no consistent arrangement
+        self.mines = mines                  # Covered squares that are a mine in every consistent arrangement
+        self.probabilities = probabilities  # {(x, y): chance of a mine} for every covered, unflagged square
+        self.consistent = consistent        # False if the numbers and flags allow no arrangement at all
+
+class Solver:
+    # Flags are taken as mines, like the other AI levels do, so a wrong flag can make the board inconsistent.
+    def __init__(self, board):
+        self.board = board
+
+    def read_constraints(self):
+        """Return the covered squares and one [cells, mines] constraint per number that touches covered squares."""
+        board = self.board
+        view = board.get_display_board()
+        neighbors = board.neighbor_table.neighbors
+        covered = []
+        constraints = []
+        for y in range(board.height):
+            row = view[y]
+            for x in range(board.width):
+                value = row[x]
+                if value == "?":
+                    covered.append((x, y))
+                elif value != "F" and value > 0:
+                    cells = []
+                    mines = value
+                    for nx, ny in neighbors(x, y):
+                        shown = view[ny][nx]
+                        if shown == "?":
+                            cells.append((nx, ny))
+                        elif shown == "F":
+                            mines -= 1
+                    if cells:
+                        constraints.append([cells, mines])
+        return covered, constraints
+
+    def propagate(self, constraints, safe, mines):
+        """Settle every constraint that needs none or all of its cells, repeating until nothing changes.
+        Returns the remaining constraints, or None if one of them cannot be met."""
+        changed = True
+        while changed:
+            changed = False
+            remaining = []
+            for cells, count in constraints:
+                unknown = [cell for cell in cells if cell not in safe and cell not in mines]
+                count -= len(cells) - len(unknown) - sum(1 for cell in cells if cell in safe)
+                if count < 0 or count > len(unknown):
+                    return None
+                if not unknown:
+                    continue
+                if count == 0:
+                    safe.update(unknown)
+                    changed = True
+                elif count == len(unknown):
+                    mines.update(unknown)
+                    changed = True
+                else:
+                    remaining.append([unknown, count])
+            constraints = remaining
+        return constraints
+
+    def components(self, constraints):
+        """Group constraints that share cells (directly or through others) into independent components."""
+        parent = {}
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+        for cells, _ in constraints:
+            for cell in cells:
+                parent.setdefault(cell, cell)
+            root = find(cells[0])
+            for cell in cells[1:]:
+                parent[find(cell)] = root
+        groups = {}
+        for constraint in constraints:
+            groups.setdefault(find(constraint[0][0]), []).append(constraint)
+        return list(groups.values())
+
+    def order_cells(self, constraints):
+        """Order a component's cells breadth first from one end of the frontier, so that cells next to each
+        other on the board are next to each other in the order and few constraints are open at a time."""
+        linked = {}
+        for cells, _ in constraints:
+            for cell in cells:
+                linked.setdefault(cell, set()).update(cells)
+        start = min(linked, key=lambda cell: (len(linked[cell]), cell))
+        order = [start]
+        seen = {start}
+        for cell in order:
+            for other in sorted(linked[cell] - seen):
+                seen.add(other)
+                order.append(other)
+        return order
+
+    def enumerate_component(self, constraints, max_mines):
+        """Count every mine arrangement of one component, by number of mines, and how many of them put a
+        mine on each cell. Returns its cells and {mines: [arrangements, per-cell mine counts]}.
+        Cells are decided one at a time in order. The arrangements of the cells decided so far only matter
+        through the mines still needed by the constraints that are open (partly decided), so arrangements are
+        grouped by that state, counted forwards and backwards, and the two counts are combined per cell."""
+        cells = self.order_cells(constraints)
+        index = {cell: position for position, cell in enumerate(cells)}
+        size = len(cells)
+        members = [sorted(index[cell] for cell in constraint_cells) for constraint_cells, _ in constraints]
+        cell_constraints = [[] for _ in cells]
+        left_after = {}  # (constraint, position) -> cells of the constraint after that position
+        for number, positions in enumerate(members):
+            for rank, position in enumerate(positions):
+                cell_constraints[position].append(number)
+                left_after[number, position] = len(positions) - rank - 1
+        # open_at[i]: constraints with cells both before position i and at or after it, in a fixed order
+        open_at = [[] for _ in range(size + 1)]
+        for number, positions in enumerate(members):
+            for position in range(positions[0] + 1, positions[-1] + 1):
+                open_at[position].append(number)
+
+        steps = {}
+        def step(position, state, mine):
+            """State after giving the cell at position the value mine (1 for a mine), or None if that breaks a constraint."""
+            key = (position, state, mine)
+            if key in steps:
+                return steps[key]
+            need = dict(zip(open_at[position], state))
+            result = ()
+            for number in cell_constraints[position]:
+                still_needed = need.get(number, constraints[number][1]) - mine
+                if still_needed < 0 or still_needed > left_after[number, position]:
+                    result = None
+                    break
+                need[number] = still_needed
+            if result is not None:
+                result = tuple(need[number] for number in open_at[position + 1])
+            steps[key] = result
+            return result
+
+        # forward[i]: {state: {mines: arrangements}} over cells before position i
+        forward = [{(): {0: 1}}]
+        for position in range(size):
+            layer = {}
+            for state, polynomial in forward[position].items():
+                for mine in (0, 1):
+                    following = step(position, state, mine)
+                    if following is None:
+                        continue
+                    target = layer.setdefault(following, {})
+                    for placed, count in polynomial.items():
+                        if placed + mine <= max_mines:
+                            target[placed + mine] = target.get(placed + mine, 0) + count
+            forward.append(layer)
+        totals = forward[size].get((), {})
+        if not totals:
+            return cells, {}
+
+        # backward[i]: {state: {mines: arrangements}} over cells from position i on
+        backward = [None] * size + [{(): {0: 1}}]
+        for position in range(size - 1, -1, -1):
+            layer = {}
+            for state in forward[position]:
+                polynomial = {}
+                for mine in (0, 1):
+                    rest = backward[position + 1].get(step(position, state, mine))
+                    if rest:
+                        for placed, count in rest.items():
+                            polynomial[placed + mine] = polynomial.get(placed + mine, 0) + count
+                layer[state] = polynomial
+            backward[position] = layer
+
+        tallies = {placed: [count, [0] * size] for placed, count in totals.items()}
+        for position in range(size):
+            for state, before in forward[position].items():
+                after = backward[position + 1].get(step(position, state, 1))
+                if not after:
+                    continue
+                for placed, count in convolve(before, after).items():
+                    if placed + 1 in tallies:
+                        tallies[placed + 1][1][position] += count
+        return cells, tallies
+
+    def solve(self):
+        """Work out the safe squares, the mines and the mine probability of every covered square."""
+        covered, constraints = self.read_constraints()
+        mines_left = self.board.flags_remaining
+        safe, mines = set(), set()
+        constraints = self.propagate(constraints, safe, mines)
+        if constraints is None:
+            return SolveResult(set(), set(), {}, consistent=False)
+
+        frontier = {cell for cells, _ in constraints for cell in cells}
+        interior = [cell for cell in covered if cell not in frontier and cell not in safe and cell not in mines]
+        mines_left -= len(mines)
+        components = [self.enumerate_component(group, mines_left) for group in self.components(constraints)]
+        polynomials = [{placed: tally[0] for placed, tally in tallies.items()} for _, tallies in components]
+
+        # Weight of an arrangement = product of the component counts * ways to put the other mines in the interior
+        everything = {0: 1}
+        for polynomial in polynomials:
+            everything = convolve(everything, polynomial)
+        total = sum(count * count_choices(len(interior), mines_left - placed) for placed, count in everything.items())
+        if total == 0:
+            return SolveResult(set(), set(), {}, consistent=False)
+
+        probabilities = {cell: 0.0 for cell in safe}
+        probabilities.update((cell, 1.0) for cell in mines)
+        for number, (cells, tallies) in enumerate(components):
+            others = {0: 1}
+            for other, polynomial in enumerate(polynomials):
+                if other != number:
+                    others = convolve(others, polynomial)
+            mine_weights = [0] * len(cells)
+            for placed, (_, counts) in tallies.items():
+                weight = sum(count * count_choices(len(interior), mines_left - placed - other_placed)
+                             for other_placed, count in others.items())
+                if weight:
+                    for cell, count in enumerate(counts):
+                        mine_weights[cell] += count * weight
+            for cell, weight in zip(cells, mine_weights):
+                probabilities[cell] = weight / total
+                if weight == 0:
+                    safe.add(cell)
+                elif weight == total:
+                    mines.add(cell)
+        if interior:
+            # Every interior square is equally likely to hold one of the mines the frontier leaves over
+            weight = sum(count * count_choices(len(interior) - 1, mines_left - placed - 1) for placed, count in everything.items())
+            for cell in interior:
+                probabilities[cell] = weight / total
+            if weight == 0:
+                safe.update(interior)
+            elif weight == total:
+                mines.update(interior)
+        return SolveResult(safe, mines, probabilities)
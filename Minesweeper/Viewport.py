@@ -0,0 +1,130 @@
+"""
+Module: Viewport
+Class: Viewport
+Description: The part of the board that is on screen. Boards can be far bigger than the window, so the
+                grid is drawn inside an area of the window at a cell size that can be zoomed, and the view
+                can be panned across the board. A board smaller than the area is centered in it, the
+                way the 10x10 board always was. The viewport converts between board squares and screen
+                pixels, and says which squares are visible so only those need drawing.
+Inputs: Board width and height, the window area to draw the grid in, and pan/zoom requests.
+Outputs: Cell positions on screen, the square under a pixel, and the visible range of squares.
+External Sources: None
+Maintainers: Katie Nordberg, Kundana Dongala, Vivian Lara, Christina Sorensen, and Navya Nittala
+Created: October 17, 2026
+Last Modified: October 17, 2026
+"""
+
+# Cell sizes in pixels: zooming stays between MIN_CELL and MAX_CELL, and fitting a big board to the window stops at
+# FIT_MIN_CELL (the board is panned instead) so the numbers stay readable
+MIN_CELL = 8
+MAX_CELL = 96
+FIT_MIN_CELL = 24
+
+class Viewport:
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self.area = (0, 0, 0, 0)  # (x, y, width, height) of the window the grid is drawn in
+        self.cell_size = MIN_CELL
+        self.x0 = 0               # Screen position of the top left corner of square (0, 0), usually off screen
+        self.y0 = 0
+        self.zoomed = False       # Until the player zooms, the cell size follows the window size
+
+    def fit(self, area):
+        """Lay the grid out in area, (x, y, width, height) of the window. Called every frame, so a resized window
+        keeps the board where it was."""
+        if area == self.area:
+            return
+        x, y, width, height = area
+        old_x, old_y, old_width, old_height = self.area
+        if self.zoomed:
+            # Keep the square in the middle of the view in the middle
+            middle_x, middle_y = self.board_point(old_x + old_width / 2, old_y + old_height / 2)
+        else:
+            middle_x, middle_y = self.columns / 2, self.rows / 2
+            self.cell_size = max(FIT_MIN_CELL, min(MAX_CELL, width // self.columns, height // self.rows))
+        self.area = area
+        self.x0 = int(x + width / 2 - middle_x * self.cell_size)
+        self.y0 = int(y + height / 2 - middle_y * self.cell_size)
+        self.clamp()
+
+    def clamp(self):
+        """Keep the board covering the area, or centered in it if it is smaller."""
+        x, y, width, height = self.area
+        grid_width, grid_height = self.columns * self.cell_size, self.rows * self.cell_size
+        if grid_width <= width:
+            self.x0 = x + (width - grid_width) // 2
+        else:
+            self.x0 = min(x, max(x + width - grid_width, self.x0))
+        if grid_height <= height:
+            self.y0 = y + (height - grid_height) // 2
+        else:
+            self.y0 = min(y, max(y + height - grid_height, self.y0))
+
+    def board_point(self, px, py):
+        """The board position (in squares, with fractions) under screen pixel (px, py)."""
+        return (px - self.x0) / self.cell_size, (py - self.y0) / self.cell_size
+
+    def pan(self, dx, dy):
+        """Move the board by (dx, dy) pixels on screen."""
+        self.x0 += int(dx)
+        self.y0 += int(dy)
+        self.clamp()
+
+    def zoom(self, factor, px, py):
+        """Scale the cells by factor, keeping the point of the board under screen pixel (px, py) where it is."""
+        cell_size = max(MIN_CELL, min(MAX_CELL, round(self.cell_size * factor)))
+        if cell_size == self.cell_size and factor != 1:
+            # Rounding can swallow small steps on small cells, so move at least one pixel
+            cell_size = max(MIN_CELL, min(MAX_CELL, self.cell_size + (1 if factor > 1 else -1)))
+        bx, by = self.board_point(px, py)
+        self.cell_size = cell_size
+        self.zoomed = True
+        self.x0 = int(px - bx * cell_size)
+        self.y0 = int(py - by * cell_size)
+        self.clamp()
+
+    def show(self, x, y):
+        """Pan as little as possible to bring square (x, y) fully into view."""
+        area_x, area_y, width, height = self.area
+        left, top = self.x0 + x * self.cell_size, self.y0 + y * self.cell_size
+        dx = max(0, area_x - left) or min(0, area_x + width - left - self.cell_size)
+        dy = max(0, area_y - top) or min(0, area_y + height - top - self.cell_size)
+        if dx or dy:
+            self.pan(dx, dy)
+
+    def cell_at(self, px, py):
+        """The square (x, y) drawn at screen pixel (px, py), or None if the pixel is not on a visible square."""
+        area_x, area_y, width, height = self.area
+        if not (area_x <= px < area_x + width and area_y <= py < area_y + height):
+            return None
+        x, y = (px - self.x0) // self.cell_size, (py - self.y0) // self.cell_size
+        if 0 <= x < self.columns and 0 <= y < self.rows:
+            return int(x), int(y)
+        return None
+
+    def cell_rect(self, x, y):
+        """(left, top, width, height) of square (x, y) on screen."""
+        return self.x0 + x * self.cell_size, self.y0 + y * self.cell_size, self.cell_size, self.cell_size
+
+    def visible(self):
+        """The visible squares as (first column, last column + 1, first row, last row + 1)."""
+        area_x, area_y, width, height = self.area
+        size = self.cell_size
+        first_col = max(0, (area_x - self.x0) // size)
+        last_col = min(self.columns, (area_x + width - self.x0 + size - 1) // size)
+        first_row = max(0, (area_y - self.y0) // size)
+        last_row = min(self.rows, (area_y + height - self.y0 + size - 1) // size)
+        return first_col, last_col, first_row, last_row
+
+    def grid_rect(self):
+        """(left, top, width, height) of the part of the area the board covers."""
+        area_x, area_y, width, height = self.area
+        left, top = max(area_x, self.x0), max(area_y, self.y0)
+        right = min(area_x + width, self.x0 + self.columns * self.cell_size)
+        bottom = min(area_y + height, self.y0 + self.rows * self.cell_size)
+        return left, top, max(0, right - left), max(0, bottom - top)
+
+    def key(self):
+        """Everything that decides where squares are drawn, to tell when the layout changed."""
+        return self.area, self.cell_size, self.x0, self.y0